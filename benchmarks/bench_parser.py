@@ -0,0 +1,33 @@
+"""
+Compare parser backends on realistic booking sizes.
+
+    python -m benchmarks.bench_parser
+"""
+
+import timeit
+
+from benchmarks.generators import make_booking_xml
+from src.utils.xml_parser import get_parser, lxml_etree
+from src.validators.booking_validator import BookingValidator
+
+
+def main(number=2000):
+    backends = ["etree"] + (["lxml"] if lxml_etree is not None else [])
+    print(f"{'booking':>12} {'backend':>8} {'parse us':>10} {'validate us':>12}")
+    for passengers, segments in [(1, 2), (4, 4), (9, 8)]:
+        xml = make_booking_xml(passengers, segments)
+        for backend in backends:
+            parse = get_parser(backend)
+            parse_s = timeit.timeit(lambda p=parse, x=xml: p(x), number=number)
+            full_s = timeit.timeit(
+                lambda x=xml, b=backend: BookingValidator(x, parser=b).validate(), number=number
+            )
+            label = f"{passengers}p/{segments}s"
+            print(
+                f"{label:>12} {backend:>8} {parse_s / number * 1e6:>10.1f} "
+                f"{full_s / number * 1e6:>12.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""Synthetic document generators for the benchmark suite."""
+
+from datetime import datetime, timedelta
+
+SEGMENT = """
+            <Segment number="{number}" status="confirmed">
+                <Flight carrier="LO" number="{flight}" class="Y">
+                    <Departure>
+                        <Airport>{origin}</Airport>
+                        <Terminal>1</Terminal>
+                        <DateTime>{departure}</DateTime>
+                    </Departure>
+                    <Arrival>
+                        <Airport>{destination}</Airport>
+                        <Terminal>5</Terminal>
+                        <DateTime>{arrival}</DateTime>
+                    </Arrival>
+                    <Duration>120</Duration>
+                </Flight>
+            </Segment>"""
+
+PASSENGER = """
+        <Passenger id="P{number:03d}" type="{type}" title="Mr">
+            <Name>
+                <First>John</First>
+                <Last>Smith</Last>
+            </Name>
+            <DateOfBirth>{dob}</DateOfBirth>
+            <Contact>
+                <Email>passenger{number}@email.com</Email>
+            </Contact>
+            <Baggage>
+                <CarryOn>1</CarryOn>
+                <Checked>1</Checked>
+                <Weight unit="kg">{weight}</Weight>
+            </Baggage>
+            <Fare currency="GBP">{fare:.2f}</Fare>
+        </Passenger>"""
+
+FARE_RULE = """
+            <FareRule type="{type}" code="{code}">
+                <Days>{days}</Days>
+                <Description>Generated rule {number}</Description>
+            </FareRule>"""
+
+AIRPORTS = ["WAW", "LHR", "JFK", "CDG", "FRA", "AMS", "MAD", "FCO"]
+RULE_TYPES = ["ADVANCE_PURCHASE", "MIN_STAY", "MAX_STAY", "PENALTIES", "BLACKOUT_DATES"]
+
+
+def make_booking_xml(passengers=1, segments=2, reference="REF2025001"):
+    """Build a valid booking with the given number of passengers and segments."""
+    start = datetime(2025, 6, 15, 8, 30)
+    segment_xml = []
+    for index in range(segments):
+        # Two hour flights with a three hour connection
+        departure = start + timedelta(hours=5 * index)
+        segment_xml.append(
+            SEGMENT.format(
+                number=index + 1,
+                flight=100 + index,
+                origin=AIRPORTS[index % len(AIRPORTS)],
+                destination=AIRPORTS[(index + 1) % len(AIRPORTS)],
+                departure=departure.isoformat(),
+                arrival=(departure + timedelta(hours=2)).isoformat(),
+            )
+        )
+
+    fare = 100.0
+    # Keep the total weight under the 100kg booking limit
+    weight = max(1, 100 // max(passengers, 1))
+    passenger_xml = [
+        PASSENGER.format(
+            number=number,
+            type="child" if number % 4 == 0 else "adult",
+            dob="2018-01-01" if number % 4 == 0 else "1985-03-20",
+            weight=weight,
+            fare=fare,
+        )
+        for number in range(1, passengers + 1)
+    ]
+
+    subtotal = fare * passengers
+    tax = round(subtotal * 0.15, 2)
+    return f"""
+    <BookingResponse>
+        <BookingReference>{reference}</BookingReference>
+        <BookingDate>2025-01-15T10:30:00</BookingDate>
+        <Agency code="AG001" name="Travel Solutions"/>
+        <Itinerary>
+            <Route>{"".join(segment_xml)}
+            </Route>
+        </Itinerary>
+        <Passengers>{"".join(passenger_xml)}
+        </Passengers>
+        <Pricing currency="GBP">
+            <SubTotal>{subtotal:.2f}</SubTotal>
+            <Tax>{tax:.2f}</Tax>
+            <Total>{subtotal + tax:.2f}</Total>
+        </Pricing>
+    </BookingResponse>
+    """
+
+
+def make_fare_xml(rules=2, reference="FARE2025001"):
+    """Build a valid fare with the given number of fare rules."""
+    rule_xml = [
+        FARE_RULE.format(
+            type=RULE_TYPES[index % len(RULE_TYPES)],
+            code=f"R{index % 1000:03d}",
+            days=index % 366,
+            number=index,
+        )
+        for index in range(rules)
+    ]
+    return f"""
+    <FareResponse>
+        <FareInfo>
+            <FareReference>{reference}</FareReference>
+            <FareBasis>YOWUS</FareBasis>
+            <ValidatingCarrier>LO</ValidatingCarrier>
+        </FareInfo>
+        <Pricing currency="USD">
+            <BaseFare>500.00</BaseFare>
+            <Taxes>75.00</Taxes>
+            <Total>575.00</Total>
+        </Pricing>
+        <FareRules>{"".join(rule_xml)}
+        </FareRules>
+        <Availability>
+            <SeatsAvailable>7</SeatsAvailable>
+        </Availability>
+    </FareResponse>
+    """
+
+
+def make_booking_feed(documents=100, passengers=1, segments=2):
+    """Build a multi-booking feed as bytes, as read by BookingValidator.iter_validate."""
+    bookings = (
+        make_booking_xml(passengers, segments, reference=f"REF{number:07d}")
+        for number in range(documents)
+    )
+    return ("<BookingFeed>" + "".join(bookings) + "</BookingFeed>").encode()
@@ -0,0 +1,104 @@
+"""
+Load test for the asyncio validation service.
+
+Pushes generated booking and fare documents through the service, either
+in-process or over the local TCP source, and reports throughput and p50/p99
+latency.
+
+    python -m benchmarks.load_test --documents 5000 --workers 4
+    python -m benchmarks.load_test --tcp
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from benchmarks.generators import make_booking_xml, make_fare_xml
+from src.service.sources import serve_tcp
+from src.service.validation_service import ValidationService
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def make_documents(count):
+    # One document per line, as carried by the service sources
+    booking = " ".join(make_booking_xml(4, 3).split())
+    fare = " ".join(make_fare_xml(20).split())
+    return [booking if index % 2 == 0 else fare for index in range(count)]
+
+
+async def _iterate(documents):
+    for document in documents:
+        yield document
+
+
+async def run_in_process(service, documents):
+    latencies = []
+    async for _, _, latency in service.process(_iterate(documents)):
+        latencies.append(latency)
+    return latencies
+
+
+async def run_tcp(service, documents):
+    server = await serve_tcp(service)
+    host, port = server.sockets[0].getsockname()[:2]
+    reader, writer = await asyncio.open_connection(host, port, limit=2**24)
+
+    sent = {}
+
+    async def send():
+        for index, document in enumerate(documents):
+            sent[index] = time.perf_counter()
+            writer.write(document.encode("utf-8") + b"\n")
+            await writer.drain()
+        writer.write_eof()
+
+    sender = asyncio.ensure_future(send())
+    latencies = []
+    for _ in documents:
+        result = json.loads(await reader.readline())
+        latencies.append(time.perf_counter() - sent[result["index"]])
+    await sender
+    writer.close()
+    server.close()
+    await server.wait_closed()
+    return latencies
+
+
+async def main_async(args):
+    service = ValidationService(workers=args.workers, max_in_flight=args.max_in_flight)
+    documents = make_documents(args.documents)
+    try:
+        # Start the worker processes before measuring
+        await asyncio.gather(*(service.validate(doc) for doc in documents[: service.max_in_flight]))
+
+        started = time.perf_counter()
+        runner = run_tcp if args.tcp else run_in_process
+        latencies = await runner(service, documents)
+        elapsed = time.perf_counter() - started
+    finally:
+        service.close()
+
+    print(f"documents:   {len(latencies)}")
+    print(f"throughput:  {len(latencies) / elapsed:.0f} docs/s")
+    print(f"p50 latency: {percentile(latencies, 0.50) * 1000:.2f} ms")
+    print(f"p99 latency: {percentile(latencies, 0.99) * 1000:.2f} ms")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validation service load test")
+    parser.add_argument("--documents", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--max-in-flight", type=int, default=None)
+    parser.add_argument("--tcp", action="store_true", help="go through the local TCP source")
+    asyncio.run(main_async(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
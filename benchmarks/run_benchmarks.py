@@ -0,0 +1,184 @@
+"""
+Validator benchmark suite.
+
+Times parsing, validator setup and each registered rule separately on
+synthetic documents of growing size, plus streaming throughput on a
+multi-booking feed.
+
+    python -m benchmarks.run_benchmarks             # compare against the baseline
+    python -m benchmarks.run_benchmarks --save      # record a new baseline
+
+Timings are the best of several repeats, in microseconds per call. A metric
+that is slower than its baseline by more than the tolerance is reported as a
+regression and the run exits with status 1; a missing baseline exits with 2.
+"""
+
+import argparse
+import io
+import json
+import sys
+import timeit
+from pathlib import Path
+
+from benchmarks.generators import make_booking_feed, make_booking_xml, make_fare_xml
+from src.utils.xml_parser import get_parser
+from src.validators.booking_validator import BookingValidator
+from src.validators.columnar import COLUMNAR_RULES, np, validate_bookings_columnar
+from src.validators.fare_validator import FareValidator
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+
+BOOKING_SIZES = [(1, 2), (9, 8), (50, 20)]
+FARE_SIZES = [2, 100, 500]
+FEED_SIZE = 1000
+COLUMNAR_SIZE = 1000
+
+
+def time_call(func, number, repeat=5):
+    """Best time per call in microseconds."""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e6
+
+
+def rules(validator):
+    """
+    ``(name, rule)`` pairs of every rule in the validator's registry, both the
+    rule methods and the checkers compiled from its rule schema.
+    """
+    registry = validator.registry
+    return registry.select(registry.names())
+
+
+def bench_document(validator_cls, xml, parser, number):
+    """Time parse, setup, each rule and the full validate() for one document."""
+    parse = get_parser(parser)
+    root = parse(xml)
+    validator = validator_cls(root)
+
+    timings = {
+        "parse": time_call(lambda: parse(xml), number),
+        "setup": time_call(lambda: validator_cls(root), number),
+    }
+    for name, rule in rules(validator):
+        # Rules are run on a valid document, so repeated calls do not
+        # accumulate messages. Metric names stay those of the rule methods.
+        timings[f"_validate_{name}"] = time_call(lambda rule=rule: rule(validator), number)
+    timings["validate"] = time_call(lambda: validator_cls(xml, parser=parser).validate(), number)
+    return timings
+
+
+def bench_feed(documents, parser):
+    """Stream a multi-booking feed and report documents per second."""
+    feed = make_booking_feed(documents)
+    seconds = min(
+        timeit.repeat(
+            lambda: sum(1 for _ in BookingValidator.iter_validate(io.BytesIO(feed), parser=parser)),
+            number=1,
+            repeat=3,
+        )
+    )
+    return {"docs_per_second": documents / seconds}
+
+
+def bench_columnar(documents, parser):
+    """Compare the columnar engine with the scalar validator on the same rules."""
+    docs = [make_booking_xml(9, 4, reference=f"REF{number:07d}") for number in range(documents)]
+
+    def scalar():
+        for doc in docs:
+            BookingValidator(doc, parser=parser, rules=COLUMNAR_RULES).validate()
+
+    return {
+        "scalar_us_per_doc": time_call(scalar, 1, repeat=3) / documents,
+        "columnar_us_per_doc": time_call(
+            lambda: validate_bookings_columnar(docs, parser=parser), 1, repeat=3
+        )
+        / documents,
+    }
+
+
+def run(parser="auto", number=200):
+    results = {}
+    for passengers, segments in BOOKING_SIZES:
+        xml = make_booking_xml(passengers, segments)
+        results[f"booking_{passengers}p_{segments}s"] = bench_document(
+            BookingValidator, xml, parser, number
+        )
+    for rules in FARE_SIZES:
+        results[f"fare_{rules}r"] = bench_document(
+            FareValidator, make_fare_xml(rules), parser, number
+        )
+    results[f"feed_{FEED_SIZE}"] = bench_feed(FEED_SIZE, parser)
+    if np is not None:
+        results[f"columnar_{COLUMNAR_SIZE}"] = bench_columnar(COLUMNAR_SIZE, parser)
+    return results
+
+
+def compare(results, baseline, tolerance, min_delta=1.0):
+    """
+    Return regression messages for metrics slower than baseline by more than
+    tolerance. Timings less than ``min_delta`` microseconds slower are timer
+    noise and never reported.
+    """
+    regressions = []
+    for scenario, metrics in results.items():
+        for metric, value in metrics.items():
+            reference = baseline.get(scenario, {}).get(metric)
+            if reference is None:
+                continue
+            # Throughput regresses when it drops, timings when they grow
+            if metric == "docs_per_second":
+                slower = value < reference * (1 - tolerance)
+            else:
+                slower = value > reference * (1 + tolerance) and value - reference >= min_delta
+            if slower:
+                regressions.append(f"{scenario}.{metric}: {value:.1f} vs baseline {reference:.1f}")
+    return regressions
+
+
+def print_results(results):
+    for scenario, metrics in results.items():
+        print(scenario)
+        for metric, value in metrics.items():
+            unit = "docs/s" if metric == "docs_per_second" else "us"
+            print(f"  {metric:<32} {value:>12.1f} {unit}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--parser", default="auto", help="auto, lxml or etree")
+    parser.add_argument("--number", type=int, default=200, help="calls per timing repeat")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--save", action="store_true", help="record results as the baseline")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.25, help="allowed slowdown before failing"
+    )
+    parser.add_argument(
+        "--min-delta",
+        type=float,
+        default=1.0,
+        help="microseconds of slowdown ignored as timer noise",
+    )
+    args = parser.parse_args(argv)
+
+    results = run(parser=args.parser, number=args.number)
+    print_results(results)
+
+    if args.save:
+        args.baseline.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        # Without a baseline no regression can be detected, which must not pass
+        print(f"No baseline at {args.baseline}; run with --save to record one", file=sys.stderr)
+        return 2
+
+    baseline = json.loads(args.baseline.read_text())
+    regressions = compare(results, baseline, args.tolerance, args.min_delta)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,232 @@
+"""
+Command-line bulk validator.
+
+Validates booking and fare XML from files, directories, glob patterns or
+stdin across worker processes and writes one JSON result per document
+(JSON Lines), while reporting throughput and the error rate on stderr.
+
+    python -m src bookings/ fares/*.xml --workers 8 --output results.jsonl
+    cat nightly.xml | python -m src -
+"""
+
+import argparse
+import glob
+import mmap
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from src.validators.archive import scan_documents
+from src.validators.batch import validate_document
+from src.validators.findings import dumps
+
+# Documents handed to the worker pool at a time; keeps memory flat on huge runs
+WINDOW_PER_WORKER = 256
+# Seconds between progress updates
+PROGRESS_INTERVAL = 0.5
+
+
+def iter_paths(inputs):
+    """
+    Expand files, directories (all *.xml below them) and glob patterns. A
+    pattern matching nothing is passed on as is, so it is reported as missing.
+    """
+    for item in inputs:
+        if item == "-":
+            yield item
+        elif os.path.isdir(item):
+            for root, dirs, files in os.walk(item):
+                dirs.sort()
+                for name in sorted(files):
+                    if name.endswith(".xml"):
+                        yield os.path.join(root, name)
+        elif glob.has_magic(item):
+            yield from sorted(glob.glob(item, recursive=True)) or [item]
+        else:
+            yield item
+
+
+def _read(path):
+    """
+    The content of a file, or of stdin for ``-``, as an mmap where possible so
+    that multi-gigabyte dumps are not copied into memory. Pipes are read.
+    """
+    f = sys.stdin.buffer if path == "-" else open(path, "rb")
+    try:
+        try:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            # Pipes cannot be mapped, and empty files have nothing to map
+            return f.read()
+    finally:
+        if f is not sys.stdin.buffer:
+            f.close()
+
+
+def iter_documents(inputs):
+    """
+    Yield ``(source, position, document)`` for every <BookingResponse> and
+    <FareResponse> found; a file may hold one document or many concatenated.
+    Sources without any are reported with a None document, and sources that
+    cannot be read with the OSError instead of a document.
+    """
+    for path in iter_paths(inputs):
+        try:
+            data = _read(path)
+        except OSError as e:
+            yield path, 0, e
+            continue
+
+        try:
+            found = False
+            for position, (_, start, end, _) in enumerate(scan_documents(data)):
+                found = True
+                yield path, position, data[start:end]
+            if not found:
+                yield path, 0, None
+        finally:
+            if isinstance(data, mmap.mmap):
+                data.close()
+
+
+def _validate(document, **options):
+    """Validate one document in a worker, reporting failures instead of raising."""
+    if document is None:
+        return {
+            "is_valid": False,
+            "errors": ["No BookingResponse or FareResponse document found"],
+            "warnings": [],
+        }
+    if isinstance(document, OSError):
+        return {"is_valid": False, "errors": [f"Cannot read input: {document}"], "warnings": []}
+    try:
+        return validate_document(document, **options)
+    except Exception as e:
+        return {"is_valid": False, "errors": [f"Validation failed: {e}"], "warnings": []}
+
+
+def _windows(iterable, size):
+    window = []
+    for item in iterable:
+        window.append(item)
+        if len(window) == size:
+            yield window
+            window = []
+    if window:
+        yield window
+
+
+class Progress:
+    """Live documents/s and error rate, written to a stream."""
+
+    def __init__(self, stream, enabled=True):
+        self.stream = stream
+        self.enabled = enabled
+        self.documents = 0
+        self.invalid = 0
+        self.started = time.perf_counter()
+        self._shown = self.started
+
+    def update(self, result):
+        self.documents += 1
+        if not result["is_valid"]:
+            self.invalid += 1
+        now = time.perf_counter()
+        if self.enabled and now - self._shown >= PROGRESS_INTERVAL:
+            self._shown = now
+            self.stream.write(f"\r{self.line()}")
+            self.stream.flush()
+
+    def line(self):
+        elapsed = max(time.perf_counter() - self.started, 1e-9)
+        error_rate = 100 * self.invalid / self.documents if self.documents else 0.0
+        return (
+            f"{self.documents} documents, {self.documents / elapsed:.0f} docs/s, "
+            f"{self.invalid} invalid ({error_rate:.1f}%)"
+        )
+
+    def finish(self):
+        if self.enabled:
+            self.stream.write(f"\r{self.line()}\n")
+            self.stream.flush()
+
+
+def run(inputs, output, workers=1, progress=None, **options):
+    """Validate all inputs, writing JSON Lines to the binary stream ``output``."""
+    validate = partial(_validate, **options)
+    jobs = iter_documents(inputs)
+    structured = options.get("structured", False)
+
+    def write(source, position, result):
+        record = {"source": source, "position": position, **result}
+        output.write(dumps([record], messages=structured))
+        if progress is not None:
+            progress.update(result)
+
+    if workers == 1:
+        for source, position, document in jobs:
+            write(source, position, validate(document))
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for window in _windows(jobs, workers * WINDOW_PER_WORKER):
+            chunksize = max(1, len(window) // (workers * 4))
+            documents = [document for _, _, document in window]
+            for (source, position, _), result in zip(
+                window, executor.map(validate, documents, chunksize=chunksize), strict=False
+            ):
+                write(source, position, result)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m src",
+        description="Validate booking and fare XML documents in bulk.",
+    )
+    parser.add_argument(
+        "inputs",
+        nargs="*",
+        default=["-"],
+        help="files, directories or glob patterns; '-' or nothing reads stdin",
+    )
+    parser.add_argument(
+        "-w", "--workers", type=int, default=None, help="worker processes (default: CPU count)"
+    )
+    parser.add_argument(
+        "-o", "--output", default="-", help="JSON Lines output file (default: stdout)"
+    )
+    parser.add_argument("--parser", default="auto", help="XML parser backend: auto, lxml or etree")
+    parser.add_argument(
+        "--fail-fast", action="store_true", help="stop each document at its first error"
+    )
+    parser.add_argument(
+        "--structured",
+        action="store_true",
+        help="write findings as objects with rule, code, path and values",
+    )
+    parser.add_argument("-q", "--quiet", action="store_true", help="no progress on stderr")
+    return parser
+
+
+def main(argv=None):
+    """Entry point; returns 0 when every document is valid and 1 otherwise."""
+    args = build_parser().parse_args(argv)
+    workers = args.workers or os.cpu_count() or 1
+    progress = Progress(sys.stderr, enabled=not args.quiet)
+    options = {"parser": args.parser}
+    if args.fail_fast:
+        options["fail_fast"] = True
+    if args.structured:
+        options["structured"] = True
+
+    if args.output == "-":
+        run(args.inputs, sys.stdout.buffer, workers, progress, **options)
+        sys.stdout.flush()
+    else:
+        with open(args.output, "wb") as output:
+            run(args.inputs, output, workers, progress, **options)
+
+    progress.finish()
+    return 1 if progress.invalid else 0
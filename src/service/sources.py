@@ -0,0 +1,73 @@
+"""
+Local stand-in input sources for the validation service.
+
+Both sources carry one XML document per line, which keeps framing trivial for
+test feeds and local tooling.
+"""
+
+import asyncio
+import json
+
+# Longest accepted document line on the TCP source
+MAX_LINE_BYTES = 16 * 1024 * 1024
+
+
+async def tail_file(path, follow=True, poll_interval=0.1):
+    """
+    Yield documents appended to a file, one per line.
+
+    With ``follow`` the file is watched for new lines like ``tail -f``;
+    otherwise iteration stops at end of file.
+    """
+    with open(path, encoding="utf-8") as f:
+        buffer = ""
+        while True:
+            line = f.readline()
+            if not line:
+                if not follow:
+                    break
+                await asyncio.sleep(poll_interval)
+                continue
+
+            buffer += line
+            # A line without newline is still being written
+            if not buffer.endswith("\n"):
+                continue
+            document = buffer.strip()
+            buffer = ""
+            if document:
+                yield document
+
+        if buffer.strip():
+            yield buffer.strip()
+
+
+async def _read_lines(reader):
+    while True:
+        line = await reader.readline()
+        if not line:
+            break
+        document = line.decode("utf-8").strip()
+        if document:
+            yield document
+
+
+async def serve_tcp(service, host="127.0.0.1", port=0):
+    """
+    Serve the validation service on a local TCP socket.
+
+    Clients send one XML document per line and receive one JSON result per
+    line, tagged with the document's position on the connection, in
+    completion order. Returns the started ``asyncio.Server``.
+    """
+
+    async def handle(reader, writer):
+        try:
+            async for index, result, _ in service.process(_read_lines(reader)):
+                writer.write(json.dumps({"index": index, **result}).encode("utf-8") + b"\n")
+                # Slow clients slow down reading, which in turn holds back input
+                await writer.drain()
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(handle, host, port, limit=MAX_LINE_BYTES)
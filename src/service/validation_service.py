@@ -0,0 +1,107 @@
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from src.validators.batch import validate_document
+
+# Marks the end of a stream's results
+_END = object()
+
+
+def _failed_result(error):
+    return {"is_valid": False, "errors": [f"Validation failed: {error}"], "warnings": []}
+
+
+class ValidationService:
+    """
+    Asyncio front end that validates booking and fare documents in a pool of
+    worker processes.
+
+    At most ``max_in_flight`` documents are validated or queued at a time,
+    across all callers. A stream stops reading its input while it has that
+    many documents pending, so a fast producer cannot pile up unbounded work.
+    """
+
+    def __init__(self, workers=None, max_in_flight=None, executor=None):
+        workers = workers or os.cpu_count() or 1
+        if executor is None:
+            # Spawned workers do not inherit the service's open sockets, which
+            # forked ones would keep alive after the service closes them
+            executor = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        self.executor = executor
+        # Enough in flight to keep every worker busy while results travel back
+        self.max_in_flight = max_in_flight or workers * 4
+        self._slots = asyncio.Semaphore(self.max_in_flight)
+
+    async def validate(self, xml_string):
+        """Validate one document, waiting for a free slot first."""
+        async with self._slots:
+            return await self._run(xml_string)
+
+    async def _run(self, xml_string):
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self.executor, validate_document, xml_string)
+        except Exception as e:
+            # A broken document must not take the service down
+            return _failed_result(e)
+
+    async def process(self, documents):
+        """
+        Validate documents from an async iterable and yield
+        ``(index, result, latency_seconds)`` as each one completes.
+
+        ``index`` is the document's position in the input; latency is
+        measured from the moment the document was accepted. Input is read in
+        its own task, so a result is yielded as soon as it completes, also
+        while the input waits for its next document (an open TCP connection,
+        a followed file).
+        """
+        results = asyncio.Queue()
+        # Documents read but not yet yielded; reading waits while it is full
+        in_flight = asyncio.Semaphore(self.max_in_flight)
+        tasks = set()
+
+        async def run(index, xml_string, accepted):
+            # The slots are shared by every stream and validate() caller
+            async with self._slots:
+                result = await self._run(xml_string)
+            results.put_nowait((index, result, time.perf_counter() - accepted))
+
+        async def read():
+            try:
+                iterator = aiter(documents)
+                index = 0
+                while True:
+                    # Backpressure: do not read further input until a slot frees
+                    await in_flight.acquire()
+                    try:
+                        xml_string = await anext(iterator)
+                    except StopAsyncIteration:
+                        break
+                    task = asyncio.ensure_future(run(index, xml_string, time.perf_counter()))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+                    index += 1
+                if tasks:
+                    await asyncio.wait(set(tasks))
+            finally:
+                results.put_nowait(_END)
+
+        reader = asyncio.ensure_future(read())
+        try:
+            while (item := await results.get()) is not _END:
+                in_flight.release()
+                yield item
+            # Re-raises an error of the input iterator
+            await reader
+        finally:
+            for task in (reader, *tasks):
+                task.cancel()
+
+    def close(self):
+        self.executor.shutdown()
@@ -0,0 +1,50 @@
+"""
+Date handling shared by the validators.
+
+Date strings repeat heavily across a batch (departure times of the same
+flights, fare validity periods), so parsing is memoized. Ages are exact
+birthday-based ages rather than day counts divided by 365.25.
+"""
+
+from datetime import datetime
+from functools import lru_cache
+
+
+@lru_cache(maxsize=65536)
+def parse_datetime(text):
+    """Parse an ISO 8601 date or date-time string to a datetime."""
+    return datetime.fromisoformat(text)
+
+
+@lru_cache(maxsize=65536)
+def parse_date(text):
+    """Parse an ISO 8601 date (or date-time) string to a date."""
+    return datetime.fromisoformat(text).date()
+
+
+def years_before(day, years):
+    """The same calendar day ``years`` earlier; 29 February falls back to the 28th."""
+    try:
+        return day.replace(year=day.year - years)
+    except ValueError:
+        return day.replace(year=day.year - years, day=28)
+
+
+@lru_cache(maxsize=4096)
+def age_cutoff(day, years):
+    """
+    Latest date of birth at which someone is at least ``years`` old on
+    ``day``: born on or before the cutoff means old enough.
+    """
+    return years_before(day, years)
+
+
+def age_on(date_of_birth, day):
+    """Age in whole years on ``day``, counting a birthday as reached on the day itself."""
+    if isinstance(day, datetime):
+        day = day.date()
+    return (
+        day.year
+        - date_of_birth.year
+        - ((day.month, day.day) < (date_of_birth.month, date_of_birth.day))
+    )
@@ -0,0 +1,78 @@
+import threading
+from time import perf_counter
+
+
+class Instrumentation:
+    """
+    Opt-in timing of validation steps (parse, index and each rule).
+
+    Pass one instance to any number of validators. Every document's timings
+    are handed to ``callback(validator_name, timings)`` when it finishes and
+    added to run-wide totals, which can be read from ``totals`` or dumped in
+    Prometheus text format with ``to_prometheus()``.
+    """
+
+    def __init__(self, callback=None):
+        self.callback = callback
+        # (validator, step) -> [seconds, calls]
+        self.totals = {}
+        # validator -> documents validated
+        self.documents = {}
+        self._lock = threading.Lock()
+
+    def timed(self, timings, name, func, *args):
+        """Call ``func(*args)`` and add its wall time to ``timings[name]``."""
+        start = perf_counter()
+        try:
+            return func(*args)
+        finally:
+            timings[name] = timings.get(name, 0.0) + perf_counter() - start
+
+    def finish_document(self, validator_name, timings):
+        """Aggregate one document's timings and report them to the callback."""
+        with self._lock:
+            self.documents[validator_name] = self.documents.get(validator_name, 0) + 1
+            for name, seconds in timings.items():
+                total = self.totals.setdefault((validator_name, name), [0.0, 0])
+                total[0] += seconds
+                total[1] += 1
+
+        if self.callback is not None:
+            self.callback(validator_name, timings)
+
+    def reset(self):
+        with self._lock:
+            self.totals.clear()
+            self.documents.clear()
+
+    def to_prometheus(self):
+        """Dump the aggregated totals in Prometheus text exposition format."""
+        with self._lock:
+            totals = sorted(self.totals.items())
+            documents = sorted(self.documents.items())
+
+        lines = [
+            "# HELP validator_documents_total Documents validated.",
+            "# TYPE validator_documents_total counter",
+        ]
+        lines += [
+            f'validator_documents_total{{validator="{validator}"}} {count}'
+            for validator, count in documents
+        ]
+        lines += [
+            "# HELP validator_step_seconds_total Wall time spent in each validation step.",
+            "# TYPE validator_step_seconds_total counter",
+        ]
+        lines += [
+            f'validator_step_seconds_total{{validator="{validator}",step="{step}"}} {seconds:.9f}'
+            for (validator, step), (seconds, _) in totals
+        ]
+        lines += [
+            "# HELP validator_step_calls_total Times each validation step ran.",
+            "# TYPE validator_step_calls_total counter",
+        ]
+        lines += [
+            f'validator_step_calls_total{{validator="{validator}",step="{step}"}} {calls}'
+            for (validator, step), (_, calls) in totals
+        ]
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,186 @@
+"""
+Fixed-point money shared by the pricing rules.
+
+Amounts are parsed straight from the document text to integer minor units
+(cents, pence, yen) using the currency's exponent, so sums and totals
+reconcile exactly instead of within a float tolerance. Amount strings repeat
+heavily across a batch (the same fares and taxes), so parsing is memoized
+and the rules compare plain ints; ``Money`` objects are only built for the
+values of findings.
+"""
+
+from decimal import Decimal
+from fractions import Fraction
+from functools import lru_cache
+
+# Minor unit exponent of currencies that do not use two decimal places (ISO 4217)
+CURRENCY_EXPONENTS = {
+    "BIF": 0,
+    "CLP": 0,
+    "DJF": 0,
+    "GNF": 0,
+    "ISK": 0,
+    "JPY": 0,
+    "KMF": 0,
+    "KRW": 0,
+    "PYG": 0,
+    "RWF": 0,
+    "UGX": 0,
+    "VND": 0,
+    "VUV": 0,
+    "XAF": 0,
+    "XOF": 0,
+    "XPF": 0,
+    "BHD": 3,
+    "IQD": 3,
+    "JOD": 3,
+    "KWD": 3,
+    "LYD": 3,
+    "OMR": 3,
+    "TND": 3,
+}
+DEFAULT_EXPONENT = 2
+
+
+def currency_exponent(currency):
+    """Number of decimal places of the currency's minor unit."""
+    return CURRENCY_EXPONENTS.get(currency, DEFAULT_EXPONENT)
+
+
+def _to_minor(text, exponent, currency):
+    if not isinstance(text, str):
+        # A missing element reads as None
+        raise ValueError(f"Invalid amount: {text!r}")
+    amount = text.strip()
+    sign = 1
+    if amount[:1] in ("-", "+"):
+        sign = -1 if amount[0] == "-" else 1
+        amount = amount[1:]
+
+    whole, _, fraction = amount.partition(".")
+    digits = whole + fraction
+    if not digits.isascii() or not digits.isdigit():
+        raise ValueError(f"Invalid amount: {text!r}")
+
+    if fraction[exponent:].strip("0"):
+        raise ValueError(
+            f"Amount {text.strip()} has more than {exponent} decimal places for {currency}"
+        )
+    return sign * int((whole or "0") + fraction[:exponent].ljust(exponent, "0"))
+
+
+class MinorUnits(dict):
+    """
+    Memoized amount text -> integer minor units of one currency.
+
+    Lookups of amounts seen before are plain dict hits, which is cheaper
+    than calling ``float()``; new amounts are parsed on the miss.
+    """
+
+    __slots__ = ("currency", "exponent")
+
+    # Entries kept before the table is cleared, bounding memory on long runs
+    maxsize = 65536
+
+    def __init__(self, currency):
+        super().__init__()
+        self.currency = currency
+        self.exponent = currency_exponent(currency)
+
+    def __missing__(self, text):
+        if len(self) >= self.maxsize:
+            self.clear()
+        value = self[text] = _to_minor(text, self.exponent, self.currency)
+        return value
+
+
+_TABLES = {}
+
+
+def minor_units(currency):
+    """The shared ``MinorUnits`` table of a currency."""
+    table = _TABLES.get(currency)
+    if table is None:
+        table = _TABLES[currency] = MinorUnits(currency)
+    return table
+
+
+def parse_minor(text, currency=None):
+    """
+    Parse an amount such as ``"899.00"`` to integer minor units of the currency.
+
+    Trailing zeros beyond the currency's decimal places are accepted; any
+    other extra precision, or text that is not a plain decimal number, raises
+    ValueError.
+    """
+    return minor_units(currency)[text]
+
+
+@lru_cache(maxsize=256)
+def rate_ratio(rate):
+    """``(numerator, denominator)`` of the decimal a rate was written as, e.g. 0.15 -> 3/20."""
+    ratio = Fraction(repr(rate))
+    return ratio.numerator, ratio.denominator
+
+
+def percent(rate):
+    """A rate as a percentage with the precision it was written with, e.g. 0.075 -> ``"7.5%"``."""
+    text = format(Decimal(repr(rate)) * 100, "f")
+    if "." in text:
+        text = text.rstrip("0").rstrip(".")
+    return f"{text}%"
+
+
+def apply_rate(minor, rate):
+    """``minor`` units times ``rate``, rounded half up to whole minor units."""
+    numerator, denominator = rate_ratio(rate)
+    scaled = minor * numerator
+    if scaled >= 0:
+        return (2 * scaled + denominator) // (2 * denominator)
+    return -((-2 * scaled + denominator) // (2 * denominator))
+
+
+class Money:
+    """An amount in integer minor units of a currency."""
+
+    __slots__ = ("minor", "currency")
+
+    def __init__(self, minor, currency=None):
+        self.minor = minor
+        self.currency = currency
+
+    @classmethod
+    def parse(cls, text, currency=None):
+        return cls(parse_minor(text, currency), currency)
+
+    @property
+    def exponent(self):
+        return currency_exponent(self.currency)
+
+    def to_decimal(self):
+        return Decimal(self.minor).scaleb(-self.exponent)
+
+    def __float__(self):
+        return self.minor / 10**self.exponent
+
+    def __str__(self):
+        exponent = self.exponent
+        digits = str(abs(self.minor)).rjust(exponent + 1, "0")
+        sign = "-" if self.minor < 0 else ""
+        if not exponent:
+            return f"{sign}{digits}"
+        return f"{sign}{digits[:-exponent]}.{digits[-exponent:]}"
+
+    def __format__(self, spec):
+        return format(self.to_decimal(), spec) if spec else str(self)
+
+    def __repr__(self):
+        return f"Money({str(self)!r}, {self.currency!r})"
+
+    def __eq__(self, other):
+        if type(other) is not Money:
+            return NotImplemented
+        return self.to_decimal() == other.to_decimal() and self.currency == other.currency
+
+    def __hash__(self):
+        return hash((self.to_decimal(), self.currency))
@@ -0,0 +1,24 @@
+def print_report(result):
+    """Print a booking validation result in human-readable form.
+
+    Pass as ``reporter`` to ``BookingValidator`` to get console output; by
+    default validation is quiet.
+    """
+    summary = result.get("summary")
+    if summary is not None:
+        print("Booking summary:")
+        print(f"Booking reference: {summary['booking_reference']}")
+        print(f"Agency: {summary['agency_name']} ({summary['agency_code']})")
+        print(
+            f"Passengers: {summary['total_passengers']} - "
+            f"Adults: {summary['adults']}, Children: {summary['children']}"
+        )
+        print(f"Total price: {summary['currency']} {summary['total_price']}\n")
+
+    for request in result.get("special_requests", []):
+        print(f"Code: {request['code']}, Description: {request['description']}")
+
+    for error in result["errors"]:
+        print(f"Error: {error}")
+    for warning in result["warnings"]:
+        print(f"Warning: {warning}")
@@ -0,0 +1,64 @@
+import xml.etree.ElementTree as ET
+
+try:
+    from lxml import etree as lxml_etree
+except ImportError:  # lxml is optional, stdlib ElementTree is the fallback
+    lxml_etree = None
+
+BACKENDS = ("auto", "lxml", "etree")
+
+if lxml_etree is not None:
+    # Comments and processing instructions are dropped so that element
+    # iteration sees exactly what ElementTree would.
+    _LXML_PARSER = lxml_etree.XMLParser(
+        remove_comments=True, remove_pis=True, resolve_entities=False
+    )
+
+
+def resolve_backend(backend="auto"):
+    """Resolve ``auto`` to the fastest installed parser backend name."""
+    if backend == "auto":
+        return "lxml" if lxml_etree is not None else "etree"
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown parser backend: {backend} (expected one of: {BACKENDS})")
+    if backend == "lxml" and lxml_etree is None:
+        raise ImportError("Parser backend 'lxml' requested but lxml is not installed")
+    return backend
+
+
+def get_parser(backend="auto"):
+    """Return a ``fromstring(xml)`` function for the given parser backend."""
+    if resolve_backend(backend) == "lxml":
+        return _lxml_fromstring
+    return ET.fromstring
+
+
+def get_iterparse(backend="auto"):
+    """Return an ``iterparse(source, events)`` function for the given parser backend."""
+    if resolve_backend(backend) == "lxml":
+        return _lxml_iterparse
+    return ET.iterparse
+
+
+def _lxml_fromstring(xml_string):
+    if isinstance(xml_string, str):
+        # lxml refuses str input that carries an encoding declaration
+        xml_string = xml_string.encode("utf-8")
+    return lxml_etree.fromstring(xml_string, _LXML_PARSER)
+
+
+def _lxml_iterparse(source, events):
+    return lxml_etree.iterparse(
+        source, events=events, remove_comments=True, remove_pis=True, resolve_entities=False
+    )
+
+
+def iter_tags(root, tags):
+    """
+    Iterate over ``root`` and its descendants whose tag is in ``tags``, in
+    document order, in a single walk of the tree.
+    """
+    if lxml_etree is not None and not isinstance(root, ET.Element):
+        # lxml filters by tag in C without creating proxies for other elements
+        return root.iter(*tags)
+    return (elem for elem in root.iter() if elem.tag in tags)
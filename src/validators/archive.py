@@ -0,0 +1,167 @@
+import json
+import mmap
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from src.validators.batch import validate_document
+
+# Opening tag of each document in an archive
+DOCUMENT_START = re.compile(rb"<(BookingResponse|FareResponse)[\s/>]")
+# Reference element used to look documents up, per document type
+REFERENCE_PATTERNS = {
+    b"BookingResponse": re.compile(rb"<BookingReference>\s*([^<]*?)\s*</BookingReference>"),
+    b"FareResponse": re.compile(rb"<FareReference>\s*([^<]*?)\s*</FareReference>"),
+}
+
+
+def scan_documents(buffer):
+    """
+    Find the <BookingResponse> and <FareResponse> documents in a bytes-like
+    buffer (bytes or an mmap), yielding ``(tag, start, end, reference)``.
+    """
+    size = len(buffer)
+    starts = [(m.start(), m.end(), m.group(1)) for m in DOCUMENT_START.finditer(buffer)]
+    for i, (start, tag_end, tag) in enumerate(starts):
+        # A document never runs past the start of the next one, so a
+        # truncated document does not swallow its successor
+        limit = starts[i + 1][0] if i + 1 < len(starts) else size
+        close = buffer.find(b"</" + tag + b">", tag_end, limit)
+        end = limit if close == -1 else close + len(tag) + 3
+        reference = REFERENCE_PATTERNS[tag].search(buffer, start, end)
+        yield (
+            tag.decode("ascii"),
+            start,
+            end,
+            None if reference is None else reference.group(1).decode("utf-8"),
+        )
+
+
+class ArchiveIndex:
+    """
+    Byte-offset index of the <BookingResponse> and <FareResponse> documents in
+    an archive of concatenated XML.
+
+    Entries are ``(tag, start, end, reference)`` tuples in file order, where
+    ``reference`` is the BookingReference or FareReference (None if missing).
+    The index is saved next to the archive so reruns skip the scan, and it is
+    rebuilt when the archive's size or modification time changes.
+    """
+
+    def __init__(self, path, entries, size, mtime_ns):
+        self.path = os.fspath(path)
+        self.entries = entries
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self._by_reference = None
+
+    @staticmethod
+    def index_path(path):
+        """Path of the sidecar index file of an archive."""
+        return f"{os.fspath(path)}.index.json"
+
+    @classmethod
+    def build(cls, path):
+        """Scan the memory-mapped archive for document boundaries."""
+        stat = os.stat(path)
+        entries = []
+        if stat.st_size:
+            with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                entries = list(scan_documents(mm))
+        return cls(path, entries, stat.st_size, stat.st_mtime_ns)
+
+    @classmethod
+    def open(cls, path):
+        """Load the saved index of an archive, building and saving it when stale."""
+        try:
+            with open(cls.index_path(path), encoding="utf-8") as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            saved = None
+
+        stat = os.stat(path)
+        if (
+            saved is not None
+            and saved.get("size") == stat.st_size
+            and saved.get("mtime_ns") == stat.st_mtime_ns
+        ):
+            entries = [tuple(entry) for entry in saved["documents"]]
+            return cls(path, entries, saved["size"], saved["mtime_ns"])
+
+        index = cls.build(path)
+        index.save()
+        return index
+
+    def save(self):
+        """Write the index to the archive's sidecar file."""
+        with open(self.index_path(self.path), "w", encoding="utf-8") as f:
+            json.dump({"size": self.size, "mtime_ns": self.mtime_ns, "documents": self.entries}, f)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def find(self, reference):
+        """Index entry of the document with the given reference, or None."""
+        if self._by_reference is None:
+            self._by_reference = {entry[3]: entry for entry in self.entries}
+        return self._by_reference.get(reference)
+
+    def read(self, reference):
+        """Bytes of the document with the given reference."""
+        entry = self.find(reference)
+        if entry is None:
+            raise KeyError(reference)
+        with open(self.path, "rb") as f:
+            f.seek(entry[1])
+            return f.read(entry[2] - entry[1])
+
+    def validate(self, reference, parser="auto", **options):
+        """Validate the single document with the given reference."""
+        return validate_document(self.read(reference), parser=parser, **options)
+
+
+def _validate_spans(path, spans, parser="auto", **options):
+    """Validate the documents at the given byte spans of a memory-mapped archive."""
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return [validate_document(mm[start:end], parser=parser, **options) for start, end in spans]
+
+
+def validate_archive(path, workers=None, chunksize=None, parser="auto", index=None, **options):
+    """
+    Validate every document of an archive of concatenated XML.
+
+    Yields ``(reference, result)`` pairs in file order. The archive is
+    memory-mapped and only one document at a time is copied out of it; the
+    index is split into chunks of ``chunksize`` documents that worker
+    processes validate from their own mapping of the file. ``options`` are
+    passed on to the validators.
+    """
+    if index is None:
+        index = ArchiveIndex.open(path)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if chunksize is None:
+        # Roughly four chunks per worker balances load without chatty IPC
+        chunksize = max(1, len(index) // (workers * 4))
+
+    entries = index.entries
+    chunks = [entries[i : i + chunksize] for i in range(0, len(entries), chunksize)]
+    validate = partial(_validate_spans, index.path, parser=parser, **options)
+    spans = ([(start, end) for _, start, end, _ in chunk] for chunk in chunks)
+
+    if workers == 1 or len(chunks) < 2:
+        yield from _with_references(chunks, map(validate, spans))
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from _with_references(chunks, executor.map(validate, spans))
+
+
+def _with_references(chunks, chunk_results):
+    for chunk, results in zip(chunks, chunk_results, strict=False):
+        for entry, result in zip(chunk, results, strict=False):
+            yield entry[3], result
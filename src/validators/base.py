@@ -0,0 +1,210 @@
+import xml.etree.ElementTree as ET
+
+from src.utils.xml_parser import get_parser
+from src.validators.findings import Finding
+from src.validators.prefilter import check_element, check_structure, malformed
+
+
+def load_document(xml_string, parser="auto", document_type=None):
+    """
+    Prefilter and parse an XML document, or check an already parsed element.
+
+    Returns ``(root, findings)``: the root element and no findings, or None
+    and the error findings of a document that cannot be validated.
+    """
+    if ET.iselement(xml_string):
+        findings = check_element(xml_string, document_type)
+        return (None, findings) if findings else (xml_string, ())
+
+    findings = check_structure(xml_string, document_type)
+    if findings:
+        return None, findings
+    try:
+        return get_parser(parser)(xml_string), ()
+    except SyntaxError as e:
+        return None, (malformed(e, document_type),)
+
+
+class _ErrorBudgetExhausted(Exception):
+    """Raised from a rule once the validator's error budget is used up."""
+
+
+class BaseValidator:
+    """
+    Document handling shared by the booking and fare validators: parsing,
+    finding collection and optional per-step instrumentation.
+    """
+
+    # Rule registry of the concrete validator, see rules.RuleRegistry
+    registry = None
+    # Finding code -> (path template, message template), see findings.Finding
+    messages = {}
+    # Declarative rules of the concrete validator, see schema.RuleSchema
+    schema = None
+    # Root tag of the documents the validator accepts, see prefilter.check_structure
+    document_type = None
+
+    def __init__(
+        self,
+        xml_string,
+        parser="auto",
+        instrumentation=None,
+        rules=None,
+        fail_fast=False,
+        max_errors=None,
+        structured=False,
+        schema=None,
+    ):
+        # A schema replaces the validator's default declared rules and
+        # thresholds, e.g. one loaded for a market
+        if schema is not None:
+            self.schema = schema
+        if self.schema is not None:
+            self.registry, self.messages = self.schema.bind(type(self))
+        # Names of the rules validate() runs; None runs the registry defaults
+        self.rules = None if rules is None else tuple(rules)
+        # Return Finding objects instead of formatted messages
+        self.structured = structured
+        # Stop validating after this many errors; fail_fast stops at the first
+        if fail_fast:
+            max_errors = 1
+        if max_errors is not None and max_errors < 1:
+            raise ValueError(f"max_errors must be at least 1, got {max_errors}")
+        self.max_errors = max_errors
+        self.instrumentation = instrumentation
+        self.parser = parser
+        # Without a document the validator only holds its configuration, and
+        # validates documents through for_document(), see engine.ValidatorEngine
+        if xml_string is not None:
+            self._start(xml_string)
+
+    def _start(self, xml_string):
+        """Set up the per-document state and load the document."""
+        # Set when the error budget ended the run before every rule finished
+        self.truncated = False
+        # rule name -> (errors, warnings) of each rule that ran to completion
+        self.rule_findings = {}
+        # Seconds spent in each step for this document, filled when instrumented
+        self.timings = {}
+        self.errors = []
+        self.warnings = []
+        # Name of the rule being run, recorded on its findings
+        self._rule = None
+        # Set when the document failed the structural prefilter or did not
+        # parse; its findings are the errors and no rules run
+        self.rejected = False
+        # An already parsed element is accepted as well, which is what the
+        # streaming and batch entry points hand over. Only the compact model
+        # built from it is kept, so the tree is released right away.
+        root = self._timed("parse", self._parse, xml_string, self.parser)
+        if not self.rejected:
+            self._timed("model", self._load_model, root)
+
+    def for_document(self, xml_string):
+        """
+        New validator for ``xml_string`` with this validator's configuration.
+
+        The configuration (rules, schema binding, thresholds, catalogs) is
+        shared as is, so nothing is checked or resolved again; only the
+        per-document state is new.
+        """
+        validator = object.__new__(type(self))
+        validator.__dict__.update(self.__dict__)
+        validator._start(xml_string)
+        return validator
+
+    def _parse(self, xml_string, parser):
+        root, findings = load_document(xml_string, parser, self.document_type)
+        if findings:
+            self._reject(findings)
+        return root
+
+    def _reject(self, findings):
+        """Record the findings of a document that cannot be validated."""
+        self.errors.extend(findings)
+        self.rejected = True
+
+    def _load_model(self, root):
+        """Build the validator's data model from the parsed document."""
+        raise NotImplementedError
+
+    def _timed(self, name, func, *args):
+        """Run one validation step, timing it when instrumentation is enabled."""
+        if self.instrumentation is None:
+            return func(*args)
+        return self.instrumentation.timed(self.timings, name, func, *args)
+
+    def _error(self, code, /, **values):
+        """
+        Record an error finding; ``code`` selects its entry in ``messages``.
+        Once the error budget is used up the current rule is abandoned and no
+        further rules run, so later checks are never made.
+        """
+        errors = self.errors
+        errors.append(Finding((self._rule, code, "error", self.messages[code], values)))
+        if self.max_errors is not None and len(errors) >= self.max_errors:
+            raise _ErrorBudgetExhausted
+
+    def _warning(self, code, /, **values):
+        """Record a warning finding; ``code`` selects its entry in ``messages``."""
+        self.warnings.append(Finding((self._rule, code, "warning", self.messages[code], values)))
+
+    def _add_error(self, finding):
+        """Add an existing error finding, within the error budget."""
+        self.errors.append(finding)
+        if self.max_errors is not None and len(self.errors) >= self.max_errors:
+            raise _ErrorBudgetExhausted
+
+    def _run_rules(self, rules=None, reuse=None):
+        """
+        Run the selected rules, falling back to the validator's own selection.
+        ``reuse`` maps rule names to ``(errors, warnings)`` found earlier, which
+        are taken over instead of running those rules again. Each run starts
+        from no findings, so validating a document again replaces the earlier
+        run's findings instead of adding to them.
+        """
+        errors = self.errors = []
+        warnings = self.warnings = []
+        self.rule_findings = {}
+        self.truncated = False
+        try:
+            for name, rule in self.registry.select(self.rules if rules is None else rules):
+                errors_start = len(errors)
+                warnings_start = len(warnings)
+                if reuse and name in reuse:
+                    reused_errors, reused_warnings = reuse[name]
+                    warnings.extend(reused_warnings)
+                    for finding in reused_errors:
+                        self._add_error(finding)
+                else:
+                    self._rule = name
+                    self._timed(name, rule, self)
+                self.rule_findings[name] = (
+                    tuple(errors[errors_start:]),
+                    tuple(warnings[warnings_start:]),
+                )
+        except _ErrorBudgetExhausted:
+            self.truncated = True
+
+    def _result(self, **extra):
+        """Build the result dict and hand the document timings to instrumentation."""
+        if self.structured:
+            # Copies, so a later run on this validator leaves the result alone
+            errors = list(self.errors)
+            warnings = list(self.warnings)
+        else:
+            # Messages are only formatted here, once all rules are done
+            errors = [str(finding) for finding in self.errors]
+            warnings = [str(finding) for finding in self.warnings]
+
+        result = {
+            "is_valid": len(errors) == 0,
+            "errors": errors,
+            "warnings": warnings,
+            **extra,
+        }
+        if self.max_errors is not None:
+            result["truncated"] = self.truncated
+        if self.instrumentation is not None:
+            self.instrumentation.finish_document(type(self).__name__, self.timings)
+        return result
@@ -0,0 +1,62 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from src.validators.booking_validator import BookingValidator
+from src.validators.fare_validator import FareValidator
+from src.validators.prefilter import check_structure, rejected_result, root_tag
+
+# Validator used for each supported document root tag
+VALIDATORS = {
+    "BookingResponse": BookingValidator,
+    "FareResponse": FareValidator,
+}
+
+
+def validate_document(xml_string, validator_cls=None, parser="auto", **options):
+    """
+    Validate a single XML document.
+
+    When no validator class is given, it is picked from the document's root
+    tag (BookingResponse or FareResponse). ``options`` are passed on to the
+    validator, e.g. ``rules=["pricing"]``. Documents failing the structural
+    prefilter or the parse get a result with a structured error instead of
+    raising.
+    """
+    if validator_cls is None:
+        validator_cls = VALIDATORS.get(root_tag(xml_string))
+        if validator_cls is None:
+            # Empty, not XML or an unsupported root: say which
+            findings = check_structure(xml_string)
+            return rejected_result(findings, options.get("structured", False))
+
+    return validator_cls(xml_string, parser=parser, **options).validate()
+
+
+def validate_many(docs, workers=None, chunksize=None, validator_cls=None, parser="auto", **options):
+    """
+    Validate a batch of XML documents across a pool of worker processes.
+
+    Results are returned in input order, one ``is_valid/errors/warnings`` dict
+    per document. ``workers`` defaults to the number of CPUs; with a single
+    worker the batch is validated in-process. Documents are sent to the
+    workers in chunks of ``chunksize`` to keep inter-process overhead low.
+    ``options`` are passed on to every document's validator, as with
+    ``validate_document``, e.g. ``rules``, ``schema`` or one ``now`` for the
+    whole batch; they must pickle to reach the workers.
+    """
+    docs = list(docs)
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    validate = partial(validate_document, validator_cls=validator_cls, parser=parser, **options)
+
+    if workers == 1 or len(docs) < 2:
+        return [validate(doc) for doc in docs]
+
+    if chunksize is None:
+        # Roughly four chunks per worker balances load without chatty IPC
+        chunksize = max(1, len(docs) // (workers * 4))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(validate, docs, chunksize=chunksize))
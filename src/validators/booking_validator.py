@@ -1,173 +1,255 @@
-import xml.etree.ElementTree as ET
 from collections import Counter
-from datetime import datetime
 
+from src.utils.dates import age_cutoff, age_on, parse_date
+from src.utils.xml_parser import get_iterparse
+from src.validators.base import BaseValidator
+from src.validators.models import Booking
+from src.validators.rules import RuleRegistry
+from src.validators.schema import RuleSchema
+
+# Thresholds and the baggage and pricing rules, see schemas/booking.json
+DEFAULT_SCHEMA = RuleSchema.builtin("booking")
+
+_SEGMENT_PATH = "BookingResponse/Itinerary/Route/Segment[@number='{segment}']"
+_PASSENGER_PATH = "BookingResponse/Passengers/Passenger[@id='{passenger_id}']"
+
+# Finding code -> (element path, message), both formatted with the finding's values
+MESSAGES = {
+    "connection_too_short": (
+        _SEGMENT_PATH,
+        "Connection time too short at {airport} between segments {previous} and {segment}: "
+        "{minutes:.0f} minutes (minimum {minimum} minutes required)",
+    ),
+    "child_too_old": (
+        _PASSENGER_PATH,
+        "Passenger {passenger_id} is classified as child but is {age} years old "
+        "(should be under {limit})",
+    ),
+    "adult_too_young": (
+        _PASSENGER_PATH,
+        "Passenger {passenger_id} is classified as adult but is {age} years old "
+        "(should be {limit} or older)",
+    ),
+    "baggage_limit_exceeded": (
+        "BookingResponse/Passengers",
+        "Baggage limit exceeded: Total weight {weight}kg (limit {limit}kg), "
+        "Total checked bags: {checked_bags}",
+    ),
+    "invalid_pricing_value": (
+        "BookingResponse/Pricing",
+        "Invalid numeric value in pricing: {error}",
+    ),
+    "subtotal_mismatch": (
+        "BookingResponse/Pricing/SubTotal",
+        "SubTotal mismatch: sum of fares is {fare_sum}, but SubTotal is {subtotal}",
+    ),
+    "tax_mismatch": (
+        "BookingResponse/Pricing/Tax",
+        "Tax mismatch: expected {expected} ({rate} of {subtotal}), but got {tax}",
+    ),
+    "total_mismatch": (
+        "BookingResponse/Pricing/Total",
+        "Total mismatch: expected {expected} (SubTotal + Tax), but got {total}",
+    ),
+}
+
+
+class BookingValidator(BaseValidator):
+    registry = RuleRegistry()
+    messages = MESSAGES
+    schema = DEFAULT_SCHEMA
+    document_type = "BookingResponse"
+
+    def __init__(
+        self,
+        xml_string,
+        reporter=None,
+        parser="auto",
+        instrumentation=None,
+        rules=None,
+        min_connection_times=None,
+        fail_fast=False,
+        max_errors=None,
+        structured=False,
+        schema=None,
+    ):
+        # Optional callable receiving each result, e.g. reporting.print_report
+        self.reporter = reporter
+        # Minimum connection minutes per connecting airport code, e.g. {"LHR": 75}
+        self.min_connection_times = min_connection_times or {}
+        super().__init__(
+            xml_string,
+            parser=parser,
+            instrumentation=instrumentation,
+            rules=rules,
+            fail_fast=fail_fast,
+            max_errors=max_errors,
+            structured=structured,
+            schema=schema,
+        )
 
-class BookingValidator:
-    def __init__(self, xml_string):
-        self.root = ET.fromstring(xml_string)
-        self.errors = []
-        self.warnings = []
-
-    def validate(self):
-        self._print_booking_summary()
-        self._validate_connection_times()
-        self._validate_passenger_ages()
-        self._validate_baggage()
-        self._validate_pricing()
-        self._extract_special_requests()
-
-        return {"is_valid": len(self.errors) == 0, "errors": self.errors, "warnings": self.warnings}
+    @classmethod
+    def iter_validate(cls, source, **options):
+        """Validate every <BookingResponse> in an XML feed while it is being read.
+
+        ``source`` is a filename or a binary file object. One result dict is
+        yielded per booking, in document order, and each booking element is
+        detached from the tree once validated so memory use stays flat no
+        matter how large the feed is. ``options`` are passed on to the
+        validator for each booking.
+        """
+        iterparse = get_iterparse(options.get("parser", "auto"))
+        parents = []
+        for event, elem in iterparse(source, events=("start", "end")):
+            if event == "start":
+                parents.append(elem)
+                continue
+
+            parents.pop()
+            if elem.tag != "BookingResponse":
+                continue
+
+            yield cls(elem, **options).validate()
+
+            elem.clear()
+            if parents:
+                parents[-1].remove(elem)
+
+    def validate(self, rules=None):
+        """
+        Run the booking rules. ``rules`` is an optional iterable of rule names,
+        e.g. ``["pricing"]``, overriding the selection given at construction.
+        """
+        return self._validate(rules)
+
+    def revalidate(self, previous, rules=None):
+        """
+        Validate this booking as a modification of ``previous``, the validator
+        that checked the earlier version. Only the rules reading a section that
+        changed (Itinerary, Passengers or Pricing) run again; the others take
+        over their findings from ``previous``. The result is the same as
+        ``validate()`` would return.
+        """
+        return self._validate(rules, self._reusable_findings(previous))
+
+    def _reusable_findings(self, previous):
+        """Findings of ``previous`` for the rules whose sections did not change."""
+        if (
+            self.rejected
+            or previous.rejected
+            or previous.min_connection_times != self.min_connection_times
+            or previous.schema is not self.schema
+        ):
+            return None
+
+        changed = self.booking.changed_sections(previous.booking)
+        reusable = {}
+        for name, findings in previous.rule_findings.items():
+            sections = self.registry.sections(name)
+            if sections is not None and not sections & changed:
+                reusable[name] = findings
+        return reusable
+
+    def _validate(self, rules=None, reuse=None):
+        if self.rejected:
+            summary, special_requests = None, []
+        else:
+            summary = self._timed("summary", self._build_booking_summary)
+            self._run_rules(rules, reuse)
+            special_requests = self._timed("special_requests", self._extract_special_requests)
 
-    def _print_booking_summary(self):
-        """Extract and display booking summary."""
+        result = self._result(summary=summary, special_requests=special_requests)
+        if self.reporter is not None:
+            self.reporter(result)
 
-        bookingreference = self.root.find("BookingReference").text
+        return result
 
-        agency = self.root.find("Agency")
-        agency_code = agency.get("code")
-        agency_name = agency.get("name")
+    def _load_model(self, root):
+        self.booking = Booking.from_element(root)
 
-        passengers = self.root.findall(".//Passenger")
-        total_passengers = len(passengers)
+    def _build_booking_summary(self):
+        """Extract booking summary."""
+        booking = self.booking
 
         # Count passenger types automatically
-        passenger_types = [p.get("type") for p in passengers]
-        type_counts = Counter(passenger_types)
-
-        # Get total price
-        total_price = self.root.find(".//Pricing/Total").text
-        currency = self.root.find(".//Pricing").get("currency")
-
-        print("Booking summary:")
-        print(f"Booking reference: {bookingreference}")
-        print(f"Agency: {agency_name} ({agency_code})")
-        print(
-            f"Passengers: {total_passengers} - "
-            f"Adults: {type_counts['adult']}, Children: {type_counts['child']}"
-        )
-        print(f"Total price: {currency} {total_price}\n")
-
+        type_counts = Counter(p.type for p in booking.passengers)
+
+        return {
+            "booking_reference": booking.reference,
+            "agency_code": booking.agency_code,
+            "agency_name": booking.agency_name,
+            "total_passengers": len(booking.passengers),
+            "adults": type_counts["adult"],
+            "children": type_counts["child"],
+            "total_price": booking.pricing.total,
+            "currency": booking.pricing.currency,
+        }
+
+    @registry.register("connection_times", sections=("Itinerary",))
     def _validate_connection_times(self):
-        """Check connection time is at least 90 minutes."""
-        # Option 1: XPath with position index (1-based)
-        arrival1_str = self.root.find(".//Segment[1]/Flight/Arrival/DateTime").text
-        departure2_str = self.root.find(".//Segment[2]/Flight/Departure/DateTime").text
-
-        # Option 2: Attribute filter
-        # segment1 = self.root.find('.//Segment[@number="1"]')
-        # arrival1 = segment1.find('.//Arrival/DateTime').text
-
-        # Option 3: Python list indexing (0-based)
-        # segments = self.root.findall('.//Segment')
-        # arrival1 = segments[0].find('.//Arrival/DateTime').text
-        # departure2 = segments[1].find('.//Departure/DateTime').text
-        arrival1 = datetime.fromisoformat(arrival1_str)
-        departure2 = datetime.fromisoformat(departure2_str)
-
-        delta = departure2 - arrival1
-        connection_minutes = delta.total_seconds() / 60
-        if connection_minutes < 90:
-            self.errors.append(
-                f"Connection time too short: {connection_minutes:.0f} minutes "
-                f"(minimum 90 minutes required)"
-            )
-        else:
-            print("Time between arrival and departure is ok\n")
-
+        """Check every connection meets the airport's minimum connection time."""
+        min_connection_times = self.min_connection_times
+        default_minimum = self.schema.parameters["min_connection_minutes"]
+        segments = self.booking.segments
+
+        # Compare each arrival with the next departure, in itinerary order
+        for previous, segment in zip(segments, segments[1:], strict=False):
+            airport = segment.departure_airport
+            minimum = min_connection_times.get(airport, default_minimum)
+
+            connection_minutes = (
+                segment.departure_time - previous.arrival_time
+            ).total_seconds() / 60
+            if connection_minutes < minimum:
+                self._error(
+                    "connection_too_short",
+                    airport=airport,
+                    previous=previous.number,
+                    segment=segment.number,
+                    minutes=connection_minutes,
+                    minimum=minimum,
+                )
+
+    @registry.register("passenger_ages", sections=("Itinerary", "Passengers"))
     def _validate_passenger_ages(self):
-        """Validate passenger type matches their age."""
-        departure1_str = self.root.find(".//Segment[1]/Flight/Departure/DateTime").text
-        departure1 = datetime.fromisoformat(departure1_str)
-
-        passengers = self.root.findall(".//Passenger")
-
-        for passenger in passengers:
-            passenger_id = passenger.get("id")
-            passenger_type = passenger.get("type")
+        """Validate passenger type matches their age on the first departure."""
+        departure1 = self.booking.segments[0].departure_time
+        limit = self.schema.parameters["child_age_limit"]
+        # Born on or before the cutoff means at the age limit or older on departure
+        cutoff = age_cutoff(departure1.date(), limit)
 
-            date_of_birth_str = passenger.find("DateOfBirth").text
-            date_of_birth = datetime.fromisoformat(date_of_birth_str)
+        for passenger in self.booking.passengers:
+            passenger_type = passenger.type
+            if passenger_type != "child" and passenger_type != "adult":
+                continue
 
-            # Calculate age in years
-            passenger_age_days = (departure1 - date_of_birth).days
-            passenger_age_years = passenger_age_days / 365.25
+            date_of_birth = parse_date(passenger.date_of_birth)
+            is_child_age = date_of_birth > cutoff
 
             # Validate type matches age
-            if passenger_type == "child":
-                if passenger_age_years >= 12:
-                    self.errors.append(
-                        f"Passenger {passenger_id} is classified as child but is "
-                        f"{passenger_age_years:.1f} years old (should be under 12)"
-                    )
-            elif passenger_type == "adult":
-                if passenger_age_years < 12:
-                    self.errors.append(
-                        f"Passenger {passenger_id} is classified as adult but is "
-                        f"{passenger_age_years:.1f} years old (should be 12 or older)"
-                    )
-
-    def _validate_baggage(self):
-        """Check baggage limits."""
-        passengers = self.root.findall(".//Passenger")
-
-        weight_sum = 0
-        checked_sum = 0
-
-        for passenger in passengers:
-            weight_sum += float(passenger.find("Baggage/Weight").text)
-            checked_sum += float(passenger.find("Baggage/Checked").text)
-
-        if weight_sum > 100:
-            self.errors.append(
-                f"Baggage limit exceeded: Total weight {weight_sum}kg "
-                f"(limit 100kg), Total checked bags: {checked_sum}"
-            )
-
-    def _validate_pricing(self):
-        """Validate price calculations."""
-        passengers = self.root.findall(".//Passenger")
-        fare_sum = 0
-
-        for passenger in passengers:
-            fare = passenger.find("Fare").text
-            fare_sum += float(fare)
-
-        subtotal = float(self.root.find(".//Pricing/SubTotal").text)
-        tax = float(self.root.find(".//Pricing/Tax").text)
-        total = float(self.root.find(".//Pricing/Total").text)
-
-        # Check 1: SubTotal should equal sum of passenger fares
-        if abs(fare_sum - subtotal) > 0.01:
-            self.errors.append(
-                f"SubTotal mismatch: sum of fares is {fare_sum}, " f"but SubTotal is {subtotal}"
-            )
-
-        # Check 2: Tax should be 15% of SubTotal
-        calculated_tax = subtotal * 0.15
-        if abs(calculated_tax - tax) > 0.01:
-            self.errors.append(
-                f"Tax mismatch: expected {calculated_tax:.2f} (15% of {subtotal}), "
-                f"but got {tax}"
-            )
-
-        # Check 3: Total should equal SubTotal + Tax
-        calculated_total = subtotal + tax
-        if abs(calculated_total - total) > 0.01:
-            self.errors.append(
-                f"Total mismatch: expected {calculated_total:.2f} "
-                f"(SubTotal + Tax), but got {total}"
-            )
+            if passenger_type == "child" and not is_child_age:
+                self._error(
+                    "child_too_old",
+                    passenger_id=passenger.id,
+                    age=age_on(date_of_birth, departure1),
+                    limit=limit,
+                )
+            elif passenger_type == "adult" and is_child_age:
+                self._error(
+                    "adult_too_young",
+                    passenger_id=passenger.id,
+                    age=age_on(date_of_birth, departure1),
+                    limit=limit,
+                )
+
+    # Declared in the schema
+    registry.declare("baggage")
+    registry.declare("pricing")
 
     def _extract_special_requests(self):
-        """List and count special requests."""
-        passengers = self.root.findall(".//Passenger")
-        for passenger in passengers:
-            special_request = passenger.find("SpecialRequests")
-            if special_request is not None:
-                requests = special_request.findall("Request")
-
-                for request in requests:
-                    code = request.get("code")  # Get the code attribute
-                    description = request.text  # Get the text content
-                    print(f"Code: {code}, Description: {description}")
+        """List special requests per passenger."""
+        return [
+            {"passenger_id": passenger.id, "code": code, "description": description}
+            for passenger in self.booking.passengers
+            for code, description in passenger.special_requests
+        ]
@@ -0,0 +1,221 @@
+import datetime
+import hashlib
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from src.validators.batch import validate_document
+
+# Options that do not change the result, left out of cache keys
+UNKEYED_OPTIONS = frozenset({"instrumentation", "reporter"})
+
+
+def _option_key(name, value):
+    """
+    Text standing for an option value in cache keys, the same in every
+    process. Values are plain data, or objects with a content ``digest``
+    such as rule schemas and fare catalogs; anything else would be keyed by
+    its memory address, so it is rejected.
+    """
+    if value is None or isinstance(value, (bool, int, float, str, datetime.date)):
+        return repr(value)
+    if isinstance(value, (list, tuple)):
+        return "[" + ", ".join(_option_key(name, item) for item in value) + "]"
+    if isinstance(value, (set, frozenset)):
+        return "{" + ", ".join(sorted(_option_key(name, item) for item in value)) + "}"
+    if isinstance(value, dict):
+        items = sorted((_option_key(name, k), _option_key(name, v)) for k, v in value.items())
+        return "{" + ", ".join(f"{k}: {v}" for k, v in items) + "}"
+    digest = getattr(value, "digest", None)
+    if isinstance(digest, str):
+        return f"{type(value).__name__}({digest})"
+    raise ValueError(f"Option {name!r} has no stable cache key: {type(value).__name__}")
+
+
+class MemoryCacheBackend:
+    """In-process LRU store of pickled results."""
+
+    def __init__(self, maxsize=10000):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key, stored_at, value):
+        """Store an entry and return the number of entries evicted."""
+        with self._lock:
+            self._entries[key] = (stored_at, value)
+            self._entries.move_to_end(key)
+            evicted = 0
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                evicted += 1
+            return evicted
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class DiskCacheBackend:
+    """
+    On-disk LRU store backed by SQLite, so cached results survive restarts
+    and can be shared between processes on one host.
+    """
+
+    # Inserts between recounts of the table, which pick up entries that other
+    # processes sharing the file added or removed
+    recount_interval = 1024
+
+    def __init__(self, path, maxsize=100000):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "key TEXT PRIMARY KEY, stored_at REAL, accessed_at REAL, value BLOB)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS results_lru ON results (accessed_at)")
+        # Running entry count, so inserts do not count the table
+        self._count = self._recount()
+        self._inserts = 0
+
+    def _recount(self):
+        return self._db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def get(self, key):
+        with self._lock:
+            row = self._db.execute(
+                "SELECT stored_at, value FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                self._db.execute(
+                    "UPDATE results SET accessed_at = ? WHERE key = ?", (time.time(), key)
+                )
+            return row
+
+    def set(self, key, stored_at, value):
+        """Store an entry and return the number of entries evicted."""
+        with self._lock:
+            accessed_at = time.time()
+            replaced = self._db.execute(
+                "UPDATE results SET stored_at = ?, accessed_at = ?, value = ? WHERE key = ?",
+                (stored_at, accessed_at, value, key),
+            ).rowcount
+            if not replaced:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+                    (key, stored_at, accessed_at, value),
+                )
+                self._count += 1
+                self._inserts += 1
+                if self._inserts >= self.recount_interval:
+                    self._count = self._recount()
+                    self._inserts = 0
+
+            excess = self._count - self.maxsize
+            if excess <= 0:
+                return 0
+            evicted = self._db.execute(
+                "DELETE FROM results WHERE key IN "
+                "(SELECT key FROM results ORDER BY accessed_at LIMIT ?)",
+                (excess,),
+            ).rowcount
+            self._count -= evicted
+            return evicted
+
+    def delete(self, key):
+        with self._lock:
+            self._count -= self._db.execute("DELETE FROM results WHERE key = ?", (key,)).rowcount
+
+    def close(self):
+        self._db.close()
+
+    def __len__(self):
+        with self._lock:
+            return self._recount()
+
+
+class ResultCache:
+    """
+    Content-addressed cache of validation results.
+
+    Documents are keyed by a SHA-256 hash of the raw XML together with the
+    validator and its options, so resent copies of a booking or fare are
+    answered without parsing. Entries are evicted least-recently-used beyond
+    the backend's size bound and expire after ``ttl`` seconds.
+    """
+
+    def __init__(self, backend=None, ttl=None, clock=time.time):
+        self.backend = MemoryCacheBackend() if backend is None else backend
+        self.ttl = ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @staticmethod
+    def key(xml_string, validator_cls=None, **options):
+        """
+        Hash of the document content, the validator and the options that
+        affect its result. Raises ValueError for an option value with no
+        stable key, see ``_option_key``.
+        """
+        if isinstance(xml_string, str):
+            xml_string = xml_string.encode("utf-8")
+        name = "auto" if validator_cls is None else validator_cls.__name__
+        keyed = sorted(
+            (option, _option_key(option, value))
+            for option, value in options.items()
+            if option not in UNKEYED_OPTIONS
+        )
+        digest = hashlib.sha256(f"{name}\0{keyed!r}\0".encode())
+        digest.update(xml_string)
+        return digest.hexdigest()
+
+    def validate(self, xml_string, validator_cls=None, **options):
+        """
+        Return the cached result for this document, validating it on a miss.
+
+        ``validator_cls`` and ``options`` are handled as in
+        ``batch.validate_document``.
+        """
+        key = self.key(xml_string, validator_cls, **options)
+        entry = self.backend.get(key)
+
+        if entry is not None:
+            stored_at, value = entry
+            if self.ttl is None or self.clock() - stored_at < self.ttl:
+                self.hits += 1
+                # Each hit gets its own copy, so callers cannot alter the cache
+                return pickle.loads(value)
+            self.backend.delete(key)
+            self.expirations += 1
+
+        self.misses += 1
+        result = validate_document(xml_string, validator_cls, **options)
+        self.evictions += self.backend.set(
+            key, self.clock(), pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        )
+        return result
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "size": len(self.backend),
+        }
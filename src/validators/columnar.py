@@ -0,0 +1,288 @@
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, only needed for the columnar engine
+    np = None
+
+from src.utils.dates import age_cutoff, age_on, parse_date, parse_datetime
+from src.utils.money import Money, minor_units, percent, rate_ratio
+from src.utils.xml_parser import iter_tags
+from src.validators.base import load_document
+from src.validators.booking_validator import DEFAULT_SCHEMA, BookingValidator
+from src.validators.findings import Finding
+from src.validators.models import BOOKING_TAGS, segment_order
+
+# Rules covered by the columnar engine, in the order BookingValidator runs them
+COLUMNAR_RULES = ("passenger_ages", "baggage", "pricing")
+# Schema rules the engine vectorizes; their checks must be the built-in ones
+_SCHEMA_RULES = ("baggage", "pricing")
+
+
+def _check_schema(schema):
+    """Reject schemas whose baggage or pricing checks differ from the built-in ones."""
+    for name in _SCHEMA_RULES:
+        checker = schema.checkers.get(name)
+        if checker is None or checker.source != DEFAULT_SCHEMA.checkers[name].source:
+            raise ValueError(
+                f"The columnar engine only mirrors the built-in {name!r} rule; "
+                "a schema may change its parameters and messages, not its checks"
+            )
+
+
+class ColumnarBookingBatch:
+    """
+    Passenger age, baggage and pricing checks for many bookings at once.
+
+    Passenger dates of birth, departure times, fares, baggage weights and
+    pricing totals from all documents are read straight from the parsed trees
+    into NumPy column arrays, without building a ``Booking`` model, and the
+    checks run as vectorized operations. Money columns hold integer minor
+    units, so pricing reconciles exactly as in the scalar rules. Thresholds
+    and message templates come from ``schema`` (by default BookingValidator's
+    built-in one); findings are only built for failing rows and match what
+    ``BookingValidator`` produces for the same rules and schema.
+    """
+
+    def __init__(self, docs, parser="auto", schema=None):
+        if np is None:
+            raise ImportError("The columnar batch engine requires numpy")
+
+        self.schema = DEFAULT_SCHEMA if schema is None else schema
+        _check_schema(self.schema)
+        _, self.messages = self.schema.bind(BookingValidator)
+        parameters = self.schema.parameters
+        self.child_age_limit = parameters["child_age_limit"]
+        self.baggage_limit_kg = parameters["baggage_limit_kg"]
+        self.tax_rate = parameters["tax_rate"]
+
+        # One (document, id, type, date of birth, weight, checked bags, fare)
+        # row per passenger, read straight from the tree: no model is built
+        # and only the first segment's departure time is parsed
+        rows = []
+        fares = []
+        departures = []
+        currencies = []
+        pricing_values = []
+        # Document index -> parsed root, for bookings with amounts that do not
+        # parse; the scalar pricing rule reports those instead
+        self.unparsed_pricing = {}
+        # Document index -> error messages of a document rejected as a whole,
+        # which has no rows in the columns
+        self.rejected = {}
+
+        for doc_index, doc in enumerate(docs):
+            root, findings = load_document(doc, parser, BookingValidator.document_type)
+            if findings:
+                self.rejected[doc_index] = [str(finding) for finding in findings]
+                departures.append(None)
+                currencies.append(None)
+                pricing_values.append((0, 0, 0))
+                continue
+
+            first_segment = pricing = None
+            first_order = float("inf")
+            doc_rows = []
+            # The same tags and walk as Booking.from_element
+            for elem in iter_tags(root, BOOKING_TAGS):
+                tag = elem.tag
+                if tag == "Passenger":
+                    # Plain tags, not paths, keep the lookups on the C fast path
+                    baggage = elem.find("Baggage")
+                    doc_rows.append(
+                        (
+                            doc_index,
+                            elem.get("id"),
+                            elem.get("type"),
+                            elem.findtext("DateOfBirth"),
+                            None if baggage is None else baggage.findtext("Weight"),
+                            None if baggage is None else baggage.findtext("Checked"),
+                            elem.findtext("Fare"),
+                        )
+                    )
+                elif tag == "Segment":
+                    # First in itinerary order, ties in document order
+                    order = segment_order(elem.get("number"))
+                    if first_segment is None or order < first_order:
+                        first_segment, first_order = elem, order
+                elif pricing is None:
+                    pricing = elem
+
+            currency = pricing.get("currency")
+            units = minor_units(currency)
+            try:
+                doc_fares = [units[row[6]] for row in doc_rows]
+                amounts = (
+                    units[pricing.findtext("SubTotal")],
+                    units[pricing.findtext("Tax")],
+                    units[pricing.findtext("Total")],
+                )
+            except ValueError:
+                # Zeros reconcile, so the vectorized checks pass over this booking
+                self.unparsed_pricing[doc_index] = root
+                doc_fares = [0] * len(doc_rows)
+                amounts = (0, 0, 0)
+
+            rows.extend(doc_rows)
+            fares.extend(doc_fares)
+            departure = first_segment.find("Flight").find("Departure").find("DateTime")
+            departures.append(parse_datetime(departure.text))
+            currencies.append(currency)
+            pricing_values.append(amounts)
+
+        self.size = len(pricing_values)
+        (
+            passenger_doc,
+            self.passenger_ids,
+            passenger_types,
+            self.dates_of_birth_text,
+            weights,
+            checked,
+            _,
+        ) = (
+            (list(column) for column in zip(*rows)) if rows else ([] for _ in range(7))
+        )
+        self.passenger_doc = np.array(passenger_doc, dtype=np.intp)
+        self.passenger_types = np.array(passenger_types, dtype=object)
+        self.dates_of_birth = _to_dates(self.dates_of_birth_text)
+        self.departures = departures
+        # Age cutoffs per document, spread over its passengers
+        cutoffs = [
+            None if departure is None else age_cutoff(departure.date(), self.child_age_limit)
+            for departure in departures
+        ]
+        self.cutoffs = _to_dates(cutoffs)[self.passenger_doc]
+        # float() per value, like the scalar baggage rule
+        self.weights = np.array([float(value) for value in weights], dtype=np.float64)
+        self.checked = np.array([float(value) for value in checked], dtype=np.float64)
+        self.fares = np.array(fares, dtype=np.int64)
+        self.currencies = currencies
+        pricing_columns = np.array(pricing_values, dtype=np.int64).reshape(self.size, 3)
+        self.subtotals = pricing_columns[:, 0].copy()
+        self.taxes = pricing_columns[:, 1].copy()
+        self.totals = pricing_columns[:, 2].copy()
+
+    def validate(self):
+        """Return one ``is_valid/errors/warnings`` dict per document, in input order."""
+        errors = [list(self.rejected.get(doc, ())) for doc in range(self.size)]
+
+        self._check_passenger_ages(errors)
+        self._check_baggage(errors)
+        self._check_pricing(errors)
+
+        return [
+            {"is_valid": len(doc_errors) == 0, "errors": doc_errors, "warnings": []}
+            for doc_errors in errors
+        ]
+
+    def _error(self, errors, doc, rule, code, **values):
+        """Add the formatted error message of a finding to document ``doc``."""
+        finding = Finding((rule, code, "error", self.messages[code], values))
+        errors[doc].append(str(finding))
+
+    def _per_document_sum(self, column):
+        # bincount adds in passenger order, like the scalar running sum
+        return np.bincount(self.passenger_doc, weights=column, minlength=self.size)
+
+    def _check_passenger_ages(self, errors):
+        # Born after the 12th-birthday cutoff of the departure date means under 12
+        is_child_age = self.dates_of_birth > self.cutoffs
+
+        too_old = (self.passenger_types == "child") & ~is_child_age
+        too_young = (self.passenger_types == "adult") & is_child_age
+
+        for row in np.flatnonzero(too_old | too_young).tolist():
+            self._error(
+                errors,
+                self.passenger_doc[row],
+                "passenger_ages",
+                "child_too_old" if too_old[row] else "adult_too_young",
+                passenger_id=self.passenger_ids[row],
+                age=age_on(
+                    parse_date(self.dates_of_birth_text[row]),
+                    self.departures[self.passenger_doc[row]],
+                ),
+                limit=self.child_age_limit,
+            )
+
+    def _check_baggage(self, errors):
+        weight_sums = self._per_document_sum(self.weights)
+        checked_sums = self._per_document_sum(self.checked)
+
+        for doc in np.flatnonzero(weight_sums > self.baggage_limit_kg).tolist():
+            self._error(
+                errors,
+                doc,
+                "baggage",
+                "baggage_limit_exceeded",
+                weight=float(weight_sums[doc]),
+                limit=self.baggage_limit_kg,
+                checked_bags=float(checked_sums[doc]),
+            )
+
+    def _check_pricing(self, errors):
+        fare_sums = np.zeros(self.size, dtype=np.int64)
+        np.add.at(fare_sums, self.passenger_doc, self.fares)
+        subtotals, taxes, totals = self.subtotals, self.taxes, self.totals
+        currencies = self.currencies
+
+        # Check 1: SubTotal should equal sum of passenger fares
+        for doc in np.flatnonzero(fare_sums != subtotals).tolist():
+            currency = currencies[doc]
+            self._error(
+                errors,
+                doc,
+                "pricing",
+                "subtotal_mismatch",
+                fare_sum=Money(int(fare_sums[doc]), currency),
+                subtotal=Money(int(subtotals[doc]), currency),
+            )
+
+        # Check 2: Tax should be SubTotal times the tax rate, rounded half up
+        numerator, denominator = rate_ratio(self.tax_rate)
+        scaled = subtotals * numerator
+        calculated_taxes = np.sign(scaled) * (
+            (2 * np.abs(scaled) + denominator) // (2 * denominator)
+        )
+        for doc in np.flatnonzero(calculated_taxes != taxes).tolist():
+            currency = currencies[doc]
+            self._error(
+                errors,
+                doc,
+                "pricing",
+                "tax_mismatch",
+                expected=Money(int(calculated_taxes[doc]), currency),
+                rate=percent(self.tax_rate),
+                subtotal=Money(int(subtotals[doc]), currency),
+                tax=Money(int(taxes[doc]), currency),
+            )
+
+        # Check 3: Total should equal SubTotal + Tax
+        calculated_totals = subtotals + taxes
+        for doc in np.flatnonzero(calculated_totals != totals).tolist():
+            currency = currencies[doc]
+            self._error(
+                errors,
+                doc,
+                "pricing",
+                "total_mismatch",
+                expected=Money(int(calculated_totals[doc]), currency),
+                total=Money(int(totals[doc]), currency),
+            )
+
+        for doc, root in self.unparsed_pricing.items():
+            validator = BookingValidator(root, rules=("pricing",), schema=self.schema)
+            errors[doc].extend(validator.validate()["errors"])
+
+
+def _to_dates(values):
+    # Date-times are floored to their day, like datetime.date()
+    return np.array(values, dtype="datetime64[s]").astype("datetime64[D]")
+
+
+def validate_bookings_columnar(docs, parser="auto", schema=None):
+    """
+    Run the passenger age, baggage and pricing rules over many bookings at once.
+
+    Results match ``BookingValidator(doc, rules=COLUMNAR_RULES, schema=schema)
+    .validate()`` for each document's ``is_valid/errors/warnings``.
+    """
+    return ColumnarBookingBatch(docs, parser=parser, schema=schema).validate()
@@ -0,0 +1,171 @@
+from src.utils.money import Money, minor_units
+from src.validators.base import BaseValidator
+from src.validators.booking_validator import BookingValidator
+from src.validators.fare_validator import FareValidator
+from src.validators.rules import RuleRegistry
+
+# Finding code -> (element path, message), both formatted with the finding's values
+MESSAGES = {
+    "subtotal_fare_mismatch": (
+        "BookingResponse/Pricing/SubTotal",
+        "Booking SubTotal {subtotal} does not match fare BaseFare {base_fare} "
+        "for {passengers} passenger(s): expected {expected}",
+    ),
+    "tax_fare_mismatch": (
+        "BookingResponse/Pricing/Tax",
+        "Booking Tax {tax} does not match fare Taxes {taxes} "
+        "for {passengers} passenger(s): expected {expected}",
+    ),
+    "currency_mismatch": (
+        "BookingResponse/Pricing/@currency",
+        "Booking currency {booking_currency} does not match fare currency {fare_currency}",
+    ),
+}
+
+
+class BookingFareValidator(BaseValidator):
+    """
+    Validates a <BookingResponse> together with its <FareResponse>.
+
+    Each document is parsed once and its model is shared: the booking and
+    fare rules run on it as usual, and the cross-document rules read the
+    same models instead of parsing the documents again. The fare is taken to
+    be the per-passenger fare quoted for every passenger on the booking.
+
+    ``fail_fast`` and ``max_errors`` apply to the booking, fare and
+    cross-document rules each; ``truncated`` is set when any of them was cut
+    short.
+    """
+
+    registry = RuleRegistry()
+    messages = MESSAGES
+
+    def __init__(
+        self,
+        booking_xml,
+        fare_xml,
+        parser="auto",
+        instrumentation=None,
+        rules=None,
+        fail_fast=False,
+        max_errors=None,
+        structured=False,
+        booking_options=None,
+        fare_options=None,
+    ):
+        # Extra options for the booking and fare validators, e.g.
+        # {"min_connection_times": {...}} or {"catalog": ...}
+        shared = {
+            "parser": parser,
+            "instrumentation": instrumentation,
+            "structured": structured,
+            "fail_fast": fail_fast,
+            "max_errors": max_errors,
+        }
+        self.booking_options = {**shared, **(booking_options or {})}
+        self.fare_options = {**shared, **(fare_options or {})}
+        super().__init__(
+            (booking_xml, fare_xml),
+            parser=parser,
+            instrumentation=instrumentation,
+            rules=rules,
+            fail_fast=fail_fast,
+            max_errors=max_errors,
+            structured=structured,
+        )
+
+    def validate(self, rules=None):
+        """
+        Run the booking, fare and cross-document rules. ``rules`` selects the
+        cross-document rules; the result's ``errors`` and ``warnings`` are
+        theirs, and the booking and fare results are nested under ``booking``
+        and ``fare``. ``is_valid`` covers all three.
+        """
+        booking = self.booking_validator.validate()
+        fare = self.fare_validator.validate()
+        if not self.rejected:
+            self._run_rules(rules)
+
+        result = self._result(booking=booking, fare=fare)
+        result["is_valid"] = result["is_valid"] and booking["is_valid"] and fare["is_valid"]
+        if "truncated" in result:
+            result["truncated"] = (
+                result["truncated"]
+                or booking.get("truncated", False)
+                or fare.get("truncated", False)
+            )
+        return result
+
+    def _parse(self, documents, parser):
+        # Each document is prefiltered and parsed by its own validator
+        return documents
+
+    def _load_model(self, documents):
+        booking_xml, fare_xml = documents
+        self.booking_validator = BookingValidator(booking_xml, **self.booking_options)
+        self.fare_validator = FareValidator(fare_xml, **self.fare_options)
+        # A rejected document has no model; its findings are in its own result
+        self.rejected = self.booking_validator.rejected or self.fare_validator.rejected
+        if not self.rejected:
+            self.booking = self.booking_validator.booking
+            self.fare = self.fare_validator.fare
+
+    @registry.register("fare_totals")
+    def _validate_fare_totals(self):
+        """Check the booking's SubTotal and Tax against the fare's BaseFare and Taxes."""
+        pricing = self.booking.pricing
+        fare_pricing = self.fare.pricing
+        if pricing is None or fare_pricing is None:
+            return
+        if fare_pricing.base_fare is None or fare_pricing.taxes is None:
+            return
+
+        # All amounts are read in the booking's currency; a fare in another
+        # currency is reported by currency_consistency. Unparseable amounts
+        # are reported by the booking and fare rules.
+        currency = pricing.currency
+        units = minor_units(currency)
+        try:
+            subtotal = units[pricing.subtotal]
+            tax = units[pricing.tax]
+            base_fare = units[fare_pricing.base_fare]
+            taxes = units[fare_pricing.taxes]
+        except ValueError:
+            return
+
+        passengers = len(self.booking.passengers)
+
+        expected_subtotal = base_fare * passengers
+        if expected_subtotal != subtotal:
+            self._error(
+                "subtotal_fare_mismatch",
+                subtotal=Money(subtotal, currency),
+                base_fare=Money(base_fare, currency),
+                passengers=passengers,
+                expected=Money(expected_subtotal, currency),
+            )
+
+        expected_tax = taxes * passengers
+        if expected_tax != tax:
+            self._error(
+                "tax_fare_mismatch",
+                tax=Money(tax, currency),
+                taxes=Money(taxes, currency),
+                passengers=passengers,
+                expected=Money(expected_tax, currency),
+            )
+
+    @registry.register("currency_consistency")
+    def _validate_currency_consistency(self):
+        """Check the booking is priced in the fare's currency."""
+        pricing = self.booking.pricing
+        fare_pricing = self.fare.pricing
+        if pricing is None or fare_pricing is None:
+            return
+
+        if pricing.currency != fare_pricing.currency:
+            self._error(
+                "currency_mismatch",
+                booking_currency=pricing.currency,
+                fare_currency=fare_pricing.currency,
+            )
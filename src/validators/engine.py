@@ -0,0 +1,43 @@
+"""
+Reusable validator engines.
+
+A validator instance holds the state of one document (its model, errors
+and warnings), so it is built per document and cannot be shared. A
+``ValidatorEngine`` is configured once instead, with the rule selection,
+rule schema, thresholds and catalogs, and validates any number of
+documents with ``validate(document)``. The engine itself is never changed
+after construction: each call works on its own per-document validator, so
+one engine can be shared between threads.
+"""
+
+
+class ValidatorEngine:
+    """
+    A validator configured once and reused for any number of documents.
+
+    ``options`` are the constructor options of ``validator_cls``, e.g.
+    ``rules``, ``schema``, ``min_connection_times`` or ``catalog``. They are
+    checked and resolved here, so invalid rule names or schemas raise on
+    construction and ``validate`` does no setup beyond the document's own.
+    """
+
+    def __init__(self, validator_cls, **options):
+        self.validator_cls = validator_cls
+        # Configuration-only validator that every document's validator copies
+        self._prototype = validator_cls(None, **options)
+        self._prototype.registry.select(self._prototype.rules)
+
+    def __repr__(self):
+        return f"ValidatorEngine({self.validator_cls.__name__})"
+
+    def validate(self, document, rules=None):
+        """
+        Validate one document (XML text, bytes or a parsed element) and return
+        its result dict. ``rules`` overrides the engine's rule selection for
+        this document only.
+        """
+        return self._prototype.for_document(document).validate(rules)
+
+    def validator(self, document):
+        """The per-document validator for ``document``, e.g. to revalidate it later."""
+        return self._prototype.for_document(document)
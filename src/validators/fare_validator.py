@@ -1,223 +1,259 @@
+import hashlib
+import json
 import re
-import xml.etree.ElementTree as ET
 from datetime import datetime
 
+from src.utils.dates import parse_datetime
+from src.validators.base import BaseValidator
+from src.validators.models import Fare
+from src.validators.rules import RuleRegistry
+from src.validators.schema import RuleSchema
+
+# Fare basis codes are typically 4-15 characters, alphanumeric
+FARE_BASIS_PATTERN = re.compile(r"^[A-Z0-9]{4,15}$")
+# ISO 4217 currency codes are 3 uppercase letters
+CURRENCY_CODE_PATTERN = re.compile(r"^[A-Z]{3}$")
+
+FARE_RULE_TYPES = (
+    "ADVANCE_PURCHASE",
+    "MIN_STAY",
+    "MAX_STAY",
+    "PENALTIES",
+    "BLACKOUT_DATES",
+)
+COMMON_CURRENCIES = frozenset({"USD", "EUR", "GBP", "JPY", "PLN", "CAD", "AUD", "CHF"})
+
+# Thresholds and the pricing, fare rule and availability rules, see schemas/fare.json
+DEFAULT_SCHEMA = RuleSchema.builtin("fare")
+
+_PRICING_PATH = "FareResponse//Pricing"
+_RULE_PATH = "FareResponse//FareRule[@type='{rule_type}']"
+
+# Finding code -> (element path, message), both formatted with the finding's values
+MESSAGES = {
+    "missing_fare_info": ("FareResponse/FareInfo", "Missing FareInfo element"),
+    "missing_field": ("FareResponse/FareInfo/{field}", "Missing required field: {field}"),
+    "invalid_fare_basis": (
+        "FareResponse//FareBasis",
+        "Invalid fare basis code format: {code} (must be 4-15 uppercase alphanumeric characters)",
+    ),
+    "missing_pricing": (_PRICING_PATH, "Missing Pricing element"),
+    "missing_pricing_components": (
+        _PRICING_PATH,
+        "Missing pricing components (BaseFare, Taxes, or Total)",
+    ),
+    "total_mismatch": (
+        _PRICING_PATH + "/Total",
+        "Total mismatch: BaseFare ({base_fare}) + Taxes ({taxes}) = {expected}, "
+        "but Total is {total}",
+    ),
+    "negative_base_fare": (
+        _PRICING_PATH + "/BaseFare",
+        "BaseFare cannot be negative: {base_fare}",
+    ),
+    "negative_taxes": (_PRICING_PATH + "/Taxes", "Taxes cannot be negative: {taxes}"),
+    "invalid_pricing_value": (_PRICING_PATH, "Invalid numeric value in pricing: {error}"),
+    "unknown_rule_type": (
+        _RULE_PATH,
+        "Unknown fare rule type: {rule_type}. Expected one of: {expected}",
+    ),
+    "invalid_rule_code": (
+        "FareResponse//FareRule[@code='{rule_code}']",
+        "Invalid fare rule code format: {rule_code} "
+        "(must be 2-4 uppercase alphanumeric characters)",
+    ),
+    "invalid_advance_purchase_days": (
+        _RULE_PATH + "/Days",
+        "Invalid advance purchase days: {days} (must be {min_days}-{max_days})",
+    ),
+    "invalid_stay_days": (
+        _RULE_PATH + "/Days",
+        "Invalid {rule_type} days: {days} (must be {min_days}-{max_days})",
+    ),
+    "invalid_days_value": (_RULE_PATH + "/Days", "Invalid days value: {days}"),
+    "negative_seats": (
+        "FareResponse//Availability/SeatsAvailable",
+        "Seats available cannot be negative: {seats}",
+    ),
+    "no_seats": ("FareResponse//Availability/SeatsAvailable", "No seats available for this fare"),
+    "unusual_seat_count": (
+        "FareResponse//Availability/SeatsAvailable",
+        "Unusual seat count: {seats} (typically capped at {limit} for display)",
+    ),
+    "invalid_seat_count": (
+        "FareResponse//Availability/SeatsAvailable",
+        "Invalid seat count: {seats}",
+    ),
+    "invalid_currency": (
+        "FareResponse//*[@currency='{currency}']",
+        "Invalid currency code: {currency} (must be 3 uppercase letters, ISO 4217)",
+    ),
+    "uncommon_currency": (
+        "FareResponse//*[@currency='{currency}']",
+        "Uncommon currency code: {currency}. Verify this is correct.",
+    ),
+    "validity_order": (
+        "FareResponse//ValidTo",
+        "ValidTo date ({valid_to}) must be after ValidFrom date ({valid_from})",
+    ),
+    "fare_expired": ("FareResponse//ValidTo", "Fare has expired (ValidTo: {valid_to})"),
+    "invalid_date": ("FareResponse//ValidFrom", "Invalid date format: {error}"),
+}
+
+
+class FareCatalog:
+    """
+    Known fare rule types and common currencies used by FareValidator.
 
-class FareValidator:
+    Built once and shared between validators; lookups are set-based.
+    """
+
+    def __init__(self, rule_types=FARE_RULE_TYPES, currencies=COMMON_CURRENCIES):
+        self.rule_types = tuple(rule_types)
+        self.rule_type_set = frozenset(self.rule_types)
+        self.rule_types_text = ", ".join(self.rule_types)
+        self.currencies = frozenset(currencies)
+        table = {"rule_types": self.rule_types, "currencies": sorted(self.currencies)}
+        self.digest = hashlib.sha256(json.dumps(table, sort_keys=True).encode()).hexdigest()
+
+    def __repr__(self):
+        # Stable across processes, so it can take part in result cache keys
+        return f"FareCatalog(digest={self.digest!r})"
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load a catalog from a JSON configuration table such as
+        ``{"rule_types": ["ADVANCE_PURCHASE", ...], "currencies": ["USD", ...]}``.
+        Missing entries fall back to the built-in defaults.
+        """
+        with open(path, encoding="utf-8") as f:
+            table = json.load(f)
+
+        return cls(
+            rule_types=table.get("rule_types", FARE_RULE_TYPES),
+            currencies=table.get("currencies", COMMON_CURRENCIES),
+        )
+
+
+DEFAULT_CATALOG = FareCatalog()
+
+
+class FareValidator(BaseValidator):
     """
     Validates airline fare data including fare rules, pricing, availability,
     and fare component structures.
     """
 
-    def __init__(self, xml_string):
-        self.root = ET.fromstring(xml_string)
-        self.errors = []
-        self.warnings = []
-
-    def validate(self):
-        """Run all fare validations."""
-        self._validate_fare_structure()
-        self._validate_fare_basis_codes()
-        self._validate_pricing_components()
-        self._validate_fare_rules()
-        self._validate_availability()
-        self._validate_currency()
-
-        return {
-            "is_valid": len(self.errors) == 0,
-            "errors": self.errors,
-            "warnings": self.warnings,
-        }
-
+    registry = RuleRegistry()
+    messages = MESSAGES
+    schema = DEFAULT_SCHEMA
+    document_type = "FareResponse"
+
+    def __init__(
+        self,
+        xml_string,
+        catalog=None,
+        parser="auto",
+        instrumentation=None,
+        rules=None,
+        fail_fast=False,
+        max_errors=None,
+        now=None,
+        structured=False,
+        schema=None,
+    ):
+        super().__init__(
+            xml_string,
+            parser=parser,
+            instrumentation=instrumentation,
+            rules=rules,
+            fail_fast=fail_fast,
+            max_errors=max_errors,
+            structured=structured,
+            schema=schema,
+        )
+        self.catalog = DEFAULT_CATALOG if catalog is None else catalog
+        # Reference time for the expiry check; pass one value for a whole batch
+        # so every fare is judged against the same clock
+        self.now = now
+
+    def validate(self, rules=None):
+        """
+        Run the fare validations. ``rules`` is an optional iterable of rule
+        names overriding the selection given at construction.
+        """
+        if not self.rejected:
+            self._run_rules(rules)
+
+        return self._result()
+
+    def _load_model(self, root):
+        self.fare = Fare.from_element(root)
+
+    @registry.register("fare_structure")
     def _validate_fare_structure(self):
         """Validate basic fare structure."""
-        fare_info = self.root.find("FareInfo")
+        fare_info = self.fare.info
 
         if fare_info is None:
-            self.errors.append("Missing FareInfo element")
+            self._error("missing_fare_info")
             return
 
         # Check required fields
-        required_fields = ["FareReference", "FareBasis", "ValidatingCarrier"]
-        for field in required_fields:
-            if fare_info.find(field) is None:
-                self.errors.append(f"Missing required field: {field}")
-
+        required_fields = [
+            ("FareReference", fare_info.reference),
+            ("FareBasis", fare_info.basis),
+            ("ValidatingCarrier", fare_info.validating_carrier),
+        ]
+        for field, value in required_fields:
+            if value is None:
+                self._error("missing_field", field=field)
+
+    @registry.register("fare_basis_codes")
     def _validate_fare_basis_codes(self):
         """Validate fare basis code format."""
-        fare_bases = self.root.findall(".//FareBasis")
-
-        for fare_basis in fare_bases:
-            code = fare_basis.text
-
-            # Fare basis codes are typically 4-15 characters, alphanumeric
-            if not re.match(r"^[A-Z0-9]{4,15}$", code):
-                self.errors.append(
-                    f"Invalid fare basis code format: {code} "
-                    f"(must be 4-15 uppercase alphanumeric characters)"
-                )
-
-    def _validate_pricing_components(self):
-        """Validate pricing breakdown."""
-        pricing = self.root.find(".//Pricing")
-
-        if pricing is None:
-            self.errors.append("Missing Pricing element")
-            return
-
-        base_fare = pricing.find("BaseFare")
-        taxes = pricing.find("Taxes")
-        total = pricing.find("Total")
+        for code in self.fare.fare_basis_codes:
+            if not FARE_BASIS_PATTERN.match(code):
+                self._error("invalid_fare_basis", code=code)
 
-        if base_fare is None or taxes is None or total is None:
-            self.errors.append("Missing pricing components (BaseFare, Taxes, or Total)")
-            return
-
-        # Extract values
-        try:
-            base_value = float(base_fare.text)
-            taxes_value = float(taxes.text)
-            total_value = float(total.text)
-
-            # Validate calculation
-            calculated_total = base_value + taxes_value
-            if abs(calculated_total - total_value) > 0.01:
-                self.errors.append(
-                    f"Total mismatch: BaseFare ({base_value}) + Taxes ({taxes_value}) "
-                    f"= {calculated_total}, but Total is {total_value}"
-                )
-
-            # Validate positive values
-            if base_value < 0:
-                self.errors.append(f"BaseFare cannot be negative: {base_value}")
-            if taxes_value < 0:
-                self.errors.append(f"Taxes cannot be negative: {taxes_value}")
-
-        except ValueError as e:
-            self.errors.append(f"Invalid numeric value in pricing: {e}")
-
-    def _validate_fare_rules(self):
-        """Validate fare rules and restrictions."""
-        fare_rules = self.root.findall(".//FareRule")
-
-        for rule in fare_rules:
-            rule_type = rule.get("type")
-            rule_code = rule.get("code")
-
-            # Validate rule type
-            valid_types = [
-                "ADVANCE_PURCHASE",
-                "MIN_STAY",
-                "MAX_STAY",
-                "PENALTIES",
-                "BLACKOUT_DATES",
-            ]
-            if rule_type and rule_type not in valid_types:
-                self.warnings.append(
-                    f"Unknown fare rule type: {rule_type}. "
-                    f"Expected one of: {', '.join(valid_types)}"
-                )
-
-            # Validate rule code format (typically 2-4 characters)
-            if rule_code and not re.match(r"^[A-Z0-9]{2,4}$", rule_code):
-                self.errors.append(
-                    f"Invalid fare rule code format: {rule_code} "
-                    f"(must be 2-4 uppercase alphanumeric characters)"
-                )
-
-            # Validate advance purchase days
-            if rule_type == "ADVANCE_PURCHASE":
-                days_elem = rule.find("Days")
-                if days_elem is not None:
-                    try:
-                        days = int(days_elem.text)
-                        if days < 0 or days > 365:
-                            self.errors.append(
-                                f"Invalid advance purchase days: {days} " f"(must be 0-365)"
-                            )
-                    except ValueError:
-                        self.errors.append(f"Invalid days value: {days_elem.text}")
-
-            # Validate stay duration
-            if rule_type in ["MIN_STAY", "MAX_STAY"]:
-                days_elem = rule.find("Days")
-                if days_elem is not None:
-                    try:
-                        days = int(days_elem.text)
-                        if days < 0 or days > 365:
-                            self.errors.append(f"Invalid {rule_type} days: {days} (must be 0-365)")
-                    except ValueError:
-                        self.errors.append(f"Invalid days value: {days_elem.text}")
-
-    def _validate_availability(self):
-        """Validate seat availability."""
-        availability = self.root.find(".//Availability")
-
-        if availability is not None:
-            seats = availability.find("SeatsAvailable")
-            if seats is not None:
-                try:
-                    seat_count = int(seats.text)
-                    if seat_count < 0:
-                        self.errors.append(f"Seats available cannot be negative: {seat_count}")
-                    elif seat_count == 0:
-                        self.warnings.append("No seats available for this fare")
-                    elif seat_count > 9:
-                        # Airlines typically show 9+ as "9"
-                        self.warnings.append(
-                            f"Unusual seat count: {seat_count} "
-                            f"(typically capped at 9 for display)"
-                        )
-                except ValueError:
-                    self.errors.append(f"Invalid seat count: {seats.text}")
+    # Declared in the schema
+    registry.declare("pricing_components")
+    registry.declare("fare_rules")
+    registry.declare("availability")
 
+    @registry.register("currency")
     def _validate_currency(self):
         """Validate currency codes."""
-        currency_elements = self.root.findall(".//*[@currency]")
-
-        for elem in currency_elements:
-            currency = elem.get("currency")
+        common_currencies = self.catalog.currencies
 
-            # ISO 4217 currency codes are 3 uppercase letters
-            if not re.match(r"^[A-Z]{3}$", currency):
-                self.errors.append(
-                    f"Invalid currency code: {currency} " f"(must be 3 uppercase letters, ISO 4217)"
-                )
+        for currency in self.fare.currencies:
+            if not CURRENCY_CODE_PATTERN.match(currency):
+                self._error("invalid_currency", currency=currency)
 
             # Check common currencies
-            common_currencies = [
-                "USD",
-                "EUR",
-                "GBP",
-                "JPY",
-                "PLN",
-                "CAD",
-                "AUD",
-                "CHF",
-            ]
             if currency not in common_currencies:
-                self.warnings.append(
-                    f"Uncommon currency code: {currency}. " f"Verify this is correct."
-                )
+                self._warning("uncommon_currency", currency=currency)
 
+    # Opt-in: only runs when selected, e.g. rules=[..., "validity_dates"]
+    @registry.register("validity_dates", default=False)
     def _validate_validity_dates(self):
         """Validate fare validity dates."""
-        valid_from = self.root.find(".//ValidFrom")
-        valid_to = self.root.find(".//ValidTo")
+        valid_from = self.fare.valid_from
+        valid_to = self.fare.valid_to
 
         if valid_from is not None and valid_to is not None:
             try:
-                from_date = datetime.fromisoformat(valid_from.text)
-                to_date = datetime.fromisoformat(valid_to.text)
+                from_date = parse_datetime(valid_from)
+                to_date = parse_datetime(valid_to)
 
                 if to_date <= from_date:
-                    self.errors.append(
-                        f"ValidTo date ({to_date}) must be after ValidFrom date ({from_date})"
-                    )
+                    self._error("validity_order", valid_to=to_date, valid_from=from_date)
 
                 # Check if fare has expired
-                if to_date < datetime.now():
-                    self.warnings.append(f"Fare has expired (ValidTo: {to_date.date()})")
+                now = datetime.now() if self.now is None else self.now
+                if to_date < now:
+                    self._warning("fare_expired", valid_to=to_date.date())
 
             except ValueError as e:
-                self.errors.append(f"Invalid date format: {e}")
+                self._error("invalid_date", error=str(e))
@@ -0,0 +1,128 @@
+"""
+Structured validation findings.
+
+Rules record what they found as ``Finding`` objects: the rule and finding
+codes, a severity, the element path and the typed values involved. The text
+message is only formatted when it is asked for, so documents whose findings
+are counted, filtered or shipped in bulk never pay for string building.
+"""
+
+import json
+from datetime import date, datetime
+from operator import itemgetter
+
+from src.utils.money import Money
+
+try:
+    import msgpack
+except ImportError:  # msgpack is optional, only needed for the msgpack format
+    msgpack = None
+
+FORMATS = ("json", "msgpack")
+
+
+class Finding(tuple):
+    """
+    One error or warning; ``str(finding)`` gives the text message.
+
+    Built as ``Finding((rule, code, severity, templates, values))``, where
+    ``templates`` is the ``(path, message)`` pair both formatted with
+    ``values``. It is a tuple so that creating one stays a single C-level
+    call in the rules' hot loops.
+    """
+
+    __slots__ = ()
+
+    rule = property(itemgetter(0), doc="Name of the rule that produced the finding.")
+    code = property(itemgetter(1), doc="Finding code, e.g. tax_mismatch.")
+    severity = property(itemgetter(2), doc="error or warning.")
+    values = property(itemgetter(4), doc="Typed values the messages are built from.")
+
+    @property
+    def path(self):
+        """Path of the element the finding is about, e.g. BookingResponse/Pricing/Tax."""
+        return self[3][0].format_map(self[4])
+
+    @property
+    def message(self):
+        return self[3][1].format_map(self[4])
+
+    def __str__(self):
+        return self.message
+
+    def __repr__(self):
+        return f"Finding({self.rule!r}, {self.code!r}, {self.severity!r}, {self.values!r})"
+
+    def __hash__(self):
+        # The values dict is not hashable
+        return hash(self[:3])
+
+    def to_dict(self, message=False):
+        """Plain dict of the finding; the text message is only added on request."""
+        record = {
+            "rule": self.rule,
+            "code": self.code,
+            "severity": self.severity,
+            "path": self.path,
+            "values": self.values,
+        }
+        if message:
+            record["message"] = self.message
+        return record
+
+
+def to_record(result, messages=False):
+    """
+    Plain-data copy of a result dict with its findings turned into dicts.
+    Findings that are already text (e.g. from the columnar engine) stay text.
+    """
+    record = dict(result)
+    for key in ("errors", "warnings"):
+        if key in record:
+            record[key] = [
+                finding.to_dict(messages) if isinstance(finding, Finding) else finding
+                for finding in record[key]
+            ]
+    return record
+
+
+def _default(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, Money):
+        # Exact decimal text, e.g. "899.00"
+        return str(value)
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def dumps(results, format="json", messages=False):
+    """
+    Serialize results for shipping in bulk.
+
+    ``json`` gives compact JSON Lines, one result per line; ``msgpack`` gives
+    one msgpack array of all results. Dates and times are written as ISO 8601
+    text and money amounts as exact decimal text. ``messages=True`` also
+    includes each finding's text message.
+    """
+    records = [to_record(result, messages) for result in results]
+    if format == "json":
+        return b"".join(
+            json.dumps(record, separators=(",", ":"), default=_default).encode("utf-8") + b"\n"
+            for record in records
+        )
+    if format == "msgpack":
+        if msgpack is None:
+            raise ImportError("The msgpack format requires the msgpack package")
+        return msgpack.packb(records, default=_default)
+    raise ValueError(f"Unknown format: {format}. Available: {', '.join(FORMATS)}")
+
+
+def loads(data, format="json"):
+    """Read results written by ``dumps`` back as plain dicts."""
+    if format == "json":
+        return [json.loads(line) for line in data.splitlines() if line.strip()]
+    if format == "msgpack":
+        if msgpack is None:
+            raise ImportError("The msgpack format requires the msgpack package")
+        return msgpack.unpackb(data)
+    raise ValueError(f"Unknown format: {format}. Available: {', '.join(FORMATS)}")
@@ -0,0 +1,322 @@
+"""
+Compact data model of booking and fare documents.
+
+The classes hold only the fields the validators read and are built straight
+from the parsed tree in one walk, after which the tree can be released.
+Text fields keep the document's text (``None`` when the element is missing,
+``""`` when it is empty); itinerary times are parsed to ``datetime`` once
+(memoized, see ``src.utils.dates``).
+"""
+
+from src.utils.dates import parse_datetime
+from src.utils.xml_parser import iter_tags
+
+BOOKING_TAGS = frozenset({"Segment", "Passenger", "Pricing"})
+# Document section -> Booking attribute holding it
+BOOKING_SECTIONS = {"Itinerary": "segments", "Passengers": "passengers", "Pricing": "pricing"}
+
+
+def _child_text(parent, tag):
+    """Text of a direct child: None if the child is missing, "" if it is empty."""
+    if parent is None:
+        return None
+    child = parent.find(tag)
+    if child is None:
+        return None
+    return child.text or ""
+
+
+def segment_order(number):
+    """Sort key of a segment's ``number`` attribute, see ``Segment.sort_key``."""
+    return int(number) if number is not None and number.isdigit() else float("inf")
+
+
+class _Record:
+    """Base for the model classes: slot-wise equality and a readable repr."""
+
+    __slots__ = ()
+
+    def _values(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._values() == other._values()
+
+    def __hash__(self):
+        return hash(self._values())
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class Segment(_Record):
+    __slots__ = (
+        "number",
+        "departure_airport",
+        "departure_time",
+        "arrival_airport",
+        "arrival_time",
+    )
+
+    def __init__(self, number, departure_airport, departure_time, arrival_airport, arrival_time):
+        self.number = number
+        self.departure_airport = departure_airport
+        self.departure_time = departure_time
+        self.arrival_airport = arrival_airport
+        self.arrival_time = arrival_time
+
+    @classmethod
+    def from_element(cls, segment):
+        flight = segment.find("Flight")
+        departure = flight.find("Departure")
+        arrival = flight.find("Arrival")
+        return cls(
+            segment.get("number"),
+            _child_text(departure, "Airport"),
+            parse_datetime(departure.find("DateTime").text),
+            _child_text(arrival, "Airport"),
+            parse_datetime(arrival.find("DateTime").text),
+        )
+
+    def sort_key(self):
+        """Itinerary order; unnumbered segments go last, in document order."""
+        return segment_order(self.number)
+
+
+class Passenger(_Record):
+    __slots__ = (
+        "id",
+        "type",
+        "date_of_birth",
+        "baggage_weight",
+        "checked_bags",
+        "fare",
+        "special_requests",
+    )
+
+    def __init__(
+        self, id, type, date_of_birth, baggage_weight, checked_bags, fare, special_requests=()
+    ):
+        self.id = id
+        self.type = type
+        self.date_of_birth = date_of_birth
+        self.baggage_weight = baggage_weight
+        self.checked_bags = checked_bags
+        self.fare = fare
+        # (code, description) pairs
+        self.special_requests = tuple(special_requests)
+
+    @classmethod
+    def from_element(cls, passenger):
+        baggage = passenger.find("Baggage")
+        requests = passenger.find("SpecialRequests")
+        return cls(
+            passenger.get("id"),
+            passenger.get("type"),
+            _child_text(passenger, "DateOfBirth"),
+            _child_text(baggage, "Weight"),
+            _child_text(baggage, "Checked"),
+            _child_text(passenger, "Fare"),
+            (
+                ()
+                if requests is None
+                else [
+                    (request.get("code"), request.text) for request in requests.findall("Request")
+                ]
+            ),
+        )
+
+
+class Pricing(_Record):
+    __slots__ = ("currency", "subtotal", "tax", "total")
+
+    def __init__(self, currency, subtotal, tax, total):
+        self.currency = currency
+        self.subtotal = subtotal
+        self.tax = tax
+        self.total = total
+
+    @classmethod
+    def from_element(cls, pricing):
+        return cls(
+            pricing.get("currency"),
+            _child_text(pricing, "SubTotal"),
+            _child_text(pricing, "Tax"),
+            _child_text(pricing, "Total"),
+        )
+
+
+class Booking(_Record):
+    __slots__ = ("reference", "agency_code", "agency_name", "segments", "passengers", "pricing")
+
+    def __init__(self, reference, agency_code, agency_name, segments, passengers, pricing):
+        self.reference = reference
+        self.agency_code = agency_code
+        self.agency_name = agency_name
+        # Sorted in itinerary order
+        self.segments = tuple(segments)
+        self.passengers = tuple(passengers)
+        self.pricing = pricing
+
+    @classmethod
+    def from_element(cls, root):
+        """Build a booking from a <BookingResponse> element in one walk of the tree."""
+        segments = []
+        passengers = []
+        pricing = None
+
+        for elem in iter_tags(root, BOOKING_TAGS):
+            tag = elem.tag
+            if tag == "Passenger":
+                passengers.append(Passenger.from_element(elem))
+            elif tag == "Segment":
+                segments.append(Segment.from_element(elem))
+            elif pricing is None:
+                pricing = Pricing.from_element(elem)
+
+        agency = root.find("Agency")
+        return cls(
+            _child_text(root, "BookingReference"),
+            None if agency is None else agency.get("code"),
+            None if agency is None else agency.get("name"),
+            sorted(segments, key=Segment.sort_key),
+            passengers,
+            pricing,
+        )
+
+    def changed_sections(self, other):
+        """Names of the document sections that differ from ``other``."""
+        return frozenset(
+            section
+            for section, attr in BOOKING_SECTIONS.items()
+            if getattr(self, attr) != getattr(other, attr)
+        )
+
+
+class FareInfo(_Record):
+    __slots__ = ("reference", "basis", "validating_carrier")
+
+    def __init__(self, reference, basis, validating_carrier):
+        self.reference = reference
+        self.basis = basis
+        self.validating_carrier = validating_carrier
+
+    @classmethod
+    def from_element(cls, fare_info):
+        return cls(
+            _child_text(fare_info, "FareReference"),
+            _child_text(fare_info, "FareBasis"),
+            _child_text(fare_info, "ValidatingCarrier"),
+        )
+
+
+class FareRule(_Record):
+    __slots__ = ("type", "code", "days")
+
+    def __init__(self, type, code, days):
+        self.type = type
+        self.code = code
+        self.days = days
+
+    @classmethod
+    def from_element(cls, rule):
+        return cls(rule.get("type"), rule.get("code"), _child_text(rule, "Days"))
+
+
+class FarePricing(_Record):
+    __slots__ = ("currency", "base_fare", "taxes", "total")
+
+    def __init__(self, currency, base_fare, taxes, total):
+        self.currency = currency
+        self.base_fare = base_fare
+        self.taxes = taxes
+        self.total = total
+
+    @classmethod
+    def from_element(cls, pricing):
+        return cls(
+            pricing.get("currency"),
+            _child_text(pricing, "BaseFare"),
+            _child_text(pricing, "Taxes"),
+            _child_text(pricing, "Total"),
+        )
+
+
+class Fare(_Record):
+    __slots__ = (
+        "info",
+        "fare_basis_codes",
+        "pricing",
+        "rules",
+        "seats_available",
+        "currencies",
+        "valid_from",
+        "valid_to",
+    )
+
+    def __init__(
+        self,
+        info,
+        fare_basis_codes,
+        pricing,
+        rules,
+        seats_available=None,
+        currencies=(),
+        valid_from=None,
+        valid_to=None,
+    ):
+        self.info = info
+        # Every FareBasis in the document, not only the one in FareInfo
+        self.fare_basis_codes = tuple(fare_basis_codes)
+        self.pricing = pricing
+        self.rules = tuple(rules)
+        self.seats_available = seats_available
+        # Every currency attribute below the root, in document order
+        self.currencies = tuple(currencies)
+        self.valid_from = valid_from
+        self.valid_to = valid_to
+
+    @classmethod
+    def from_element(cls, root):
+        """Build a fare from a <FareResponse> element in one walk of the tree."""
+        fare_basis_codes = []
+        rules = []
+        currencies = []
+        pricing = None
+        availability = None
+        valid_from = None
+        valid_to = None
+
+        for elem in root.iter():
+            tag = elem.tag
+            if tag == "FareBasis":
+                fare_basis_codes.append(elem.text or "")
+            elif tag == "FareRule":
+                rules.append(FareRule.from_element(elem))
+            elif tag == "Pricing" and pricing is None:
+                pricing = FarePricing.from_element(elem)
+            elif tag == "Availability" and availability is None:
+                availability = elem
+            elif tag == "ValidFrom" and valid_from is None:
+                valid_from = elem.text or ""
+            elif tag == "ValidTo" and valid_to is None:
+                valid_to = elem.text or ""
+
+            currency = elem.get("currency")
+            if currency is not None and elem is not root:
+                currencies.append(currency)
+
+        fare_info = root.find("FareInfo")
+        return cls(
+            None if fare_info is None else FareInfo.from_element(fare_info),
+            fare_basis_codes,
+            pricing,
+            rules,
+            _child_text(availability, "SeatsAvailable"),
+            currencies,
+            valid_from,
+            valid_to,
+        )
@@ -0,0 +1,140 @@
+"""
+Structural prefilter run before a document is parsed.
+
+Truncated input, input that is not XML and documents of the wrong type are
+common in live traffic. ``check_structure`` finds them with a few bounded
+regex scans of the raw text or bytes (the root tag near the start, the
+closing tag at the end, the required elements), so they are rejected in
+microseconds with a structured finding instead of a full parse that ends in
+an exception. Documents that pass can still be malformed inside; the
+parsers report those as a ``malformed_document`` finding. Already parsed
+elements, e.g. from a streamed feed, get the same root and required element
+checks from ``check_element``.
+"""
+
+import re
+
+from src.validators.findings import Finding
+
+# Elements every document of a type must contain
+REQUIRED_ELEMENTS = {
+    "BookingResponse": ("BookingReference", "Segment", "Pricing"),
+    "FareResponse": ("FareInfo",),
+}
+# Bytes scanned for the root tag, past any declaration, comments and doctype
+HEAD_LIMIT = 65536
+# Bytes scanned for the closing root tag, past trailing whitespace and comments
+TAIL_LIMIT = 1024
+
+RULE = "structure"
+
+# Finding code -> (element path, message), both formatted with the finding's values
+MESSAGES = {
+    "empty_document": ("", "Document is empty"),
+    "not_xml": ("", "Document does not start with an XML element"),
+    "unsupported_document": ("{root}", "Unsupported document type: {root}"),
+    "truncated_document": ("{root}", "Document is truncated: no closing </{root}> tag"),
+    "missing_element": ("{root}/{element}", "Missing required element: {element}"),
+    "malformed_document": ("{root}", "Malformed XML: {error}"),
+}
+
+_HEAD = r"\A(?:{bom})?(?:\s+|<\?.*?\?>|<!--.*?-->|<!DOCTYPE[^>]*>)*<([A-Za-z_][\w.\-]*)([\s/>])"
+
+
+def _patterns(compile_text, bom):
+    """The prefilter regexes, compiled for str or, with ``compile_text`` encoding, bytes."""
+    head = re.compile(compile_text(_HEAD.format(bom=bom)), re.DOTALL)
+    tails = {
+        root: re.compile(compile_text(rf"</{root}\s*>(?:\s+|<!--.*?-->)*\Z"), re.DOTALL)
+        for root in REQUIRED_ELEMENTS
+    }
+    elements = {
+        root: tuple(
+            (element, re.compile(compile_text(rf"<{element}[\s/>]"))) for element in elements
+        )
+        for root, elements in REQUIRED_ELEMENTS.items()
+    }
+    return head, tails, elements
+
+
+_TEXT_PATTERNS = _patterns(str, "\ufeff")
+# Raw input is UTF-8, so its byte-order mark is matched encoded
+_BYTES_PATTERNS = _patterns(lambda pattern: pattern.encode("latin-1"), "\xef\xbb\xbf")
+
+
+def _finding(code, **values):
+    return Finding((RULE, code, "error", MESSAGES[code], values))
+
+
+def _head(document):
+    """``(match of the root's start tag or None, patterns)`` for a raw document."""
+    patterns = _TEXT_PATTERNS if isinstance(document, str) else _BYTES_PATTERNS
+    return patterns[0].match(document, 0, min(len(document), HEAD_LIMIT)), patterns
+
+
+def root_tag(document):
+    """Tag of a raw document's root element, or None when none is found."""
+    match, _ = _head(document)
+    if match is None:
+        return None
+    root = match.group(1)
+    return root if isinstance(root, str) else root.decode("ascii", "replace")
+
+
+def check_structure(document, document_type=None):
+    """
+    Check a raw document (str or bytes) for gross structural problems.
+
+    Returns a tuple of error findings, empty when the document may be
+    parsed. ``document_type`` is the expected root tag; by default any
+    supported document type is accepted.
+    """
+    match, (_, tails, elements) = _head(document)
+    if match is None:
+        return (_finding("not_xml" if document.strip() else "empty_document"),)
+
+    size = len(document)
+    root = match.group(1)
+    if not isinstance(root, str):
+        root = root.decode("ascii", "replace")
+    if root not in REQUIRED_ELEMENTS or (document_type is not None and root != document_type):
+        return (_finding("unsupported_document", root=root),)
+
+    # A self-closing root has no closing tag, and no required elements either
+    if not tails[root].search(document, max(match.end(), size - TAIL_LIMIT)):
+        if match.group(2) not in ("/", b"/"):
+            return (_finding("truncated_document", root=root),)
+
+    return tuple(
+        _finding("missing_element", root=root, element=element)
+        for element, pattern in elements[root]
+        if pattern.search(document, match.end()) is None
+    )
+
+
+def check_element(root, document_type=None):
+    """
+    Check a parsed document's root element like ``check_structure`` checks
+    raw text: its tag and the required elements below it.
+    """
+    tag = root.tag
+    if tag not in REQUIRED_ELEMENTS or (document_type is not None and tag != document_type):
+        return (_finding("unsupported_document", root=tag),)
+
+    # Most required elements are direct children, found without walking the tree
+    return tuple(
+        _finding("missing_element", root=tag, element=element)
+        for element in REQUIRED_ELEMENTS[tag]
+        if root.find(element) is None and next(root.iter(element), None) is None
+    )
+
+
+def malformed(error, root=None):
+    """Finding for a document the parser could not read."""
+    return _finding("malformed_document", root=root or "", error=str(error))
+
+
+def rejected_result(findings, structured=False):
+    """Result dict for a document rejected before validation."""
+    errors = list(findings) if structured else [str(finding) for finding in findings]
+    return {"is_valid": False, "errors": errors, "warnings": []}
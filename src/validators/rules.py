@@ -0,0 +1,104 @@
+class RuleRegistry:
+    """
+    Ordered registry of named validation rules.
+
+    Rules are plain validator methods registered with ``@registry.register(name)``
+    in the class body. Callers pick a subset by name; rules that are not
+    selected are never called. Subclasses extend a validator's rules with
+    ``registry = ParentValidator.registry.copy()``.
+
+    Rules declared in a rule schema (see ``schema.RuleSchema``) only have
+    their place reserved with ``registry.declare(name)``; ``bind`` fills them
+    in with the schema's compiled checkers.
+    """
+
+    def __init__(self, rules=None, defaults=None, sections=None):
+        # name -> unbound rule function, in registration order
+        self._rules = dict(rules or {})
+        self._defaults = list(self._rules if defaults is None else defaults)
+        # name -> document sections the rule reads, for rules that declare them
+        self._sections = dict(sections or {})
+        self._selections = {}
+
+    def register(self, name, default=True, sections=None):
+        """
+        Register a rule; ``default=False`` rules only run when selected explicitly.
+        ``sections`` names the document sections the rule reads, which lets
+        incremental revalidation skip it when none of them changed.
+        """
+
+        def decorator(func):
+            self._rules[name] = func
+            if default and name not in self._defaults:
+                self._defaults.append(name)
+            if sections is not None:
+                self._sections[name] = frozenset(sections)
+            self._selections.clear()
+            return func
+
+        return decorator
+
+    def declare(self, name):
+        """Reserve the place of a rule that a rule schema provides."""
+        self._rules[name] = None
+        if name not in self._defaults:
+            self._defaults.append(name)
+        self._selections.clear()
+
+    def bind(self, checkers, defaults, sections):
+        """
+        Copy of the registry with the schema's ``checkers`` (name -> rule
+        function) in place of the declared rules. Checkers the registry did not
+        declare are added after the other rules. ``defaults`` names the
+        checkers that run when no selection is given and ``sections`` maps
+        checker names to the document sections they read.
+        """
+        bound = self.copy()
+        for name, checker in checkers.items():
+            bound._rules[name] = checker
+            if name in defaults:
+                if name not in bound._defaults:
+                    bound._defaults.append(name)
+            elif name in bound._defaults:
+                bound._defaults.remove(name)
+            if name in sections:
+                bound._sections[name] = frozenset(sections[name])
+
+        missing = [name for name, rule in bound._rules.items() if rule is None]
+        if missing:
+            raise ValueError(f"Rule(s) not defined by the schema: {', '.join(missing)}")
+        return bound
+
+    def copy(self):
+        return RuleRegistry(self._rules, self._defaults, self._sections)
+
+    def names(self):
+        """Names of all registered rules, in registration order."""
+        return tuple(self._rules)
+
+    def defaults(self):
+        """Names of the rules that run when no selection is given."""
+        return tuple(self._defaults)
+
+    def sections(self, name):
+        """Sections the rule reads, or None when it did not declare them."""
+        return self._sections.get(name)
+
+    def select(self, names=None):
+        """
+        Return ``(name, rule)`` pairs for the selected rule names, in
+        registration order. ``None`` selects the default rules.
+        """
+        key = None if names is None else frozenset(names)
+        selection = self._selections.get(key)
+        if selection is None:
+            wanted = self._defaults if key is None else key
+            unknown = set(wanted) - set(self._rules)
+            if unknown:
+                raise ValueError(
+                    f"Unknown rule(s): {', '.join(sorted(unknown))}. "
+                    f"Available: {', '.join(self._rules)}"
+                )
+            selection = tuple((name, rule) for name, rule in self._rules.items() if name in wanted)
+            self._selections[key] = selection
+        return selection
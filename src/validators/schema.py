@@ -0,0 +1,464 @@
+"""
+Declarative validation rules.
+
+A rule schema is a JSON table of parameters, typed fields and rules. Each rule
+lists checks whose conditions are small expressions over the fields, and the
+whole schema is compiled once into plain Python rule functions, so a declared
+rule runs as fast as a hand-written one. Thresholds and relations can then be
+changed per market by loading a different schema, without a code release::
+
+    {
+        "extends": "booking",
+        "parameters": {"tax_rate": 0.23, "baggage_limit_kg": 80}
+    }
+
+Table layout:
+
+``model``
+    Validator attribute holding the document model, e.g. ``"booking"``.
+``parameters``
+    Named constants; lists become sets for ``in`` tests.
+``patterns``
+    Named regular expressions, tested with ``matches(pattern, text)``.
+``fields``
+    Named lookups on the model: ``{"path": "pricing.subtotal", "type":
+    "float"}``. ``passengers[].fare`` collects a value per passenger and
+    ``"sum": true`` adds them up. Each field is read at most once per rule.
+    ``"money"`` fields are integer minor units, with the currency taken from
+    the field named by ``"currency"`` (see ``src.utils.money``).
+``rules``
+    Rule name -> ``{"checks": [...]}`` with optional ``sections``,
+    ``default``, ``when`` (skip the rule unless true), ``each``/``as`` (run
+    the checks per item of a model collection) and ``invalid``.
+``messages``
+    Extra or replacement finding messages, ``code -> [path, message]``.
+
+A check records the finding ``code`` when its ``fail`` expression is true,
+after computing its ``let`` bindings; ``when`` skips it, ``severity`` may be
+``"warning"`` and ``stop`` ends the rule (or the item) once it failed.
+``values`` maps the finding's values to expressions. ``invalid`` names the
+finding recorded instead when a value cannot be converted, with the
+exception text available as ``error``.
+
+Expressions are Python syntax limited to arithmetic, comparisons, boolean
+logic, attribute access and the functions in ``FUNCTIONS``; ``self`` is the
+validator.
+"""
+
+import ast
+import hashlib
+import json
+import os
+import re
+
+from src.utils.money import Money, apply_rate, minor_units, percent
+
+# Directory of the built-in schemas, loaded by name
+SCHEMA_DIR = os.path.join(os.path.dirname(__file__), "schemas")
+
+FIELD_TYPES = ("str", "int", "float", "money")
+SEVERITIES = ("error", "warning")
+MERGED_SECTIONS = ("parameters", "patterns", "fields", "rules", "messages")
+
+
+def matches(pattern, text):
+    """Whether a schema pattern matches at the start of ``text``."""
+    return pattern.match(text) is not None
+
+
+# Functions available to expressions
+FUNCTIONS = {
+    "abs": abs,
+    "min": min,
+    "max": max,
+    "round": round,
+    "len": len,
+    "int": int,
+    "float": float,
+    "str": str,
+    "matches": matches,
+    "money": Money,
+    "apply_rate": apply_rate,
+    "percent": percent,
+}
+
+_NODES = (
+    ast.Expression,
+    ast.BoolOp,
+    ast.And,
+    ast.Or,
+    ast.BinOp,
+    ast.Add,
+    ast.Sub,
+    ast.Mult,
+    ast.Div,
+    ast.FloorDiv,
+    ast.Mod,
+    ast.UnaryOp,
+    ast.Not,
+    ast.USub,
+    ast.UAdd,
+    ast.Compare,
+    ast.Eq,
+    ast.NotEq,
+    ast.Lt,
+    ast.LtE,
+    ast.Gt,
+    ast.GtE,
+    ast.In,
+    ast.NotIn,
+    ast.Is,
+    ast.IsNot,
+    ast.IfExp,
+    ast.Constant,
+    ast.Name,
+    ast.Load,
+    ast.Attribute,
+    ast.Call,
+)
+_IDENTIFIER = re.compile(r"^[A-Za-z][A-Za-z0-9_]*$")
+_PATH_PART = re.compile(r"^[A-Za-z][A-Za-z0-9_]*(\[\])?$")
+
+
+def _merge(base, override):
+    """Schema table with ``override`` applied entry by entry over ``base``."""
+    merged = {**base, **override}
+    for section in MERGED_SECTIONS:
+        merged[section] = {**base.get(section, {}), **override.get(section, {})}
+    merged.pop("extends", None)
+    return merged
+
+
+def _expression_names(text, where):
+    """Validate an expression and return the names it reads."""
+    try:
+        tree = ast.parse(text, mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"Invalid expression in {where}: {text!r} ({e.msg})") from None
+
+    names = set()
+    for node in ast.walk(tree):
+        if not isinstance(node, _NODES):
+            raise ValueError(f"Unsupported syntax in {where}: {text!r} ({type(node).__name__})")
+        if isinstance(node, ast.Name):
+            if node.id.startswith("_"):
+                raise ValueError(f"Private name in {where}: {text!r}")
+            names.add(node.id)
+        elif isinstance(node, ast.Attribute) and node.attr.startswith("_"):
+            raise ValueError(f"Private attribute in {where}: {text!r}")
+        elif isinstance(node, ast.Call) and (
+            not isinstance(node.func, ast.Name) or node.func.id not in FUNCTIONS or node.keywords
+        ):
+            raise ValueError(f"Unsupported call in {where}: {text!r}")
+    return names
+
+
+class _RuleCompiler:
+    """Generates the source of one rule function."""
+
+    def __init__(self, schema, name, rule):
+        self.schema = schema
+        self.name = name
+        self.rule = rule
+        self.lines = []
+        self.codes = set()
+        # Every name an expression of the rule may read
+        self.known = {
+            *schema.fields,
+            *schema.parameters,
+            *schema.patterns,
+            *FUNCTIONS,
+            "self",
+            "error",
+        }
+        if "as" in rule:
+            self.known.add(rule["as"])
+        for check in rule.get("checks", []):
+            self.known.update(check.get("let", {}))
+
+    def compile(self):
+        rule = self.rule
+        where = f"rule {self.name!r}"
+        each = rule.get("each")
+        item = rule.get("as")
+        if each is not None and (item is None or not _IDENTIFIER.match(item)):
+            raise ValueError(f"{where}: 'each' needs an 'as' name for the item")
+
+        self.lines = [
+            "def rule(self):",
+            f"    _model = self.{self.schema.model}",
+            "    _error = self._error",
+            "    _warning = self._warning",
+        ]
+        assigned = set()
+        invalid = rule.get("invalid")
+
+        # Fields read by the rule's own condition and invalid finding come first
+        indent = 1
+        head_names = set()
+        if "when" in rule:
+            head_names |= self._names(rule["when"], where)
+        if invalid is not None:
+            head_names |= self._invalid_names(invalid, where)
+        self._emit_fields(head_names, assigned, indent)
+        if "when" in rule:
+            self._emit(indent, f"if not ({rule['when']}):")
+            self._emit(indent + 1, "return")
+
+        if invalid is not None:
+            self._emit(indent, "try:")
+            indent += 1
+
+        checks = rule.get("checks", [])
+        if each is None:
+            for check in checks:
+                self._check(check, assigned, indent, "return")
+        else:
+            # Document fields are read once, before the loop
+            hoisted = set()
+            for check in checks:
+                if "invalid" not in check:
+                    hoisted |= self._check_names(check, where)
+            self._emit_fields(hoisted - {item}, assigned, indent)
+            self._emit(indent, f"for {item} in _model.{self._path(each, where)}:")
+            assigned = assigned | {item}
+            for check in checks:
+                self._check(check, assigned, indent + 1, "continue")
+
+        if not checks:
+            self._emit(indent, "pass")
+        if invalid is not None:
+            self._emit(indent - 1, "except ValueError as _e:")
+            self._record(invalid, indent, where, "error", handler=True)
+        return "\n".join(self.lines)
+
+    def _check(self, check, assigned, indent, stop):
+        where = f"rule {self.name!r} check {check.get('code')!r}"
+        invalid = check.get("invalid")
+        if invalid is not None:
+            # Fields converted inside the try belong to this check only
+            self._emit_fields(self._invalid_names(invalid, where), assigned, indent)
+            self._emit(indent, "try:")
+            indent += 1
+            assigned = set(assigned)
+
+        self._emit_fields(self._check_names(check, where), assigned, indent)
+        if "when" in check:
+            self._emit(indent, f"if {check['when']}:")
+            indent += 1
+        for name, expression in check.get("let", {}).items():
+            self._emit(indent, f"{name} = {expression}")
+        self._emit(indent, f"if {check['fail']}:")
+        self._record(check, indent + 1, where, check.get("severity", "error"))
+        if check.get("stop"):
+            self._emit(indent + 1, stop)
+
+        if invalid is not None:
+            self._emit(indent - 1 - ("when" in check), "except ValueError as _e:")
+            self._record(invalid, indent - ("when" in check), where, "error", handler=True)
+
+    def _record(self, finding, indent, where, severity, handler=False):
+        code = finding.get("code")
+        if not code:
+            raise ValueError(f"{where}: finding without a code")
+        if severity not in SEVERITIES:
+            raise ValueError(f"{where}: unknown severity {severity!r}")
+        self.codes.add(code)
+
+        values = finding.get("values", {})
+        for name in values:
+            if not _IDENTIFIER.match(name):
+                raise ValueError(f"{where}: invalid value name {name!r}")
+        if handler and any("error" in self._names(e, where) for e in values.values()):
+            self._emit(indent, "error = str(_e)")
+        arguments = "".join(f", {name}=({expression})" for name, expression in values.items())
+        record = "_error" if severity == "error" else "_warning"
+        self._emit(indent, f"{record}({code!r}{arguments})")
+
+    def _check_names(self, check, where):
+        if "fail" not in check:
+            raise ValueError(f"{where}: check without a 'fail' condition")
+        names = set()
+        for expression in (check.get("when"), check["fail"], *check.get("values", {}).values()):
+            if expression is not None:
+                names |= self._names(expression, where)
+        for name, expression in check.get("let", {}).items():
+            if not _IDENTIFIER.match(name):
+                raise ValueError(f"{where}: invalid 'let' name {name!r}")
+            names |= self._names(expression, where)
+        return names - set(check.get("let", {}))
+
+    def _invalid_names(self, invalid, where):
+        names = set()
+        for expression in invalid.get("values", {}).values():
+            names |= self._names(expression, where)
+        return names - {"error"}
+
+    def _names(self, expression, where):
+        names = _expression_names(expression, where)
+        unknown = names - self.known
+        if unknown:
+            raise ValueError(f"Unknown name(s) in {where}: {', '.join(sorted(unknown))}")
+        return names
+
+    def _emit_fields(self, names, assigned, indent):
+        for name in sorted(names):
+            if name in assigned or name not in self.schema.fields:
+                continue
+            currency = self.schema.fields[name].get("currency")
+            if currency is not None:
+                if currency not in self.schema.fields:
+                    raise ValueError(f"field {name!r}: unknown currency field {currency!r}")
+                self._emit_fields([currency], assigned, indent)
+                units = f"_units_{currency}"
+                if units not in assigned:
+                    self._emit(indent, f"{units} = _minor_units({currency})")
+                    assigned.add(units)
+            self._emit(indent, f"{name} = {self._field(name)}")
+            assigned.add(name)
+
+    def _field(self, name):
+        field = self.schema.fields[name]
+        where = f"field {name!r}"
+        field_type = field.get("type")
+        if field_type is not None and field_type not in FIELD_TYPES:
+            raise ValueError(f"{where}: unknown type {field_type!r}")
+
+        path = field["path"]
+        head, sep, tail = path.partition("[].")
+        if sep:
+            value = self._convert(f"_item.{self._path(tail, where)}", field)
+            values = f"[{value} for _item in _model.{self._path(head, where)}]"
+            return f"sum({values})" if field.get("sum") else values
+
+        return self._convert(f"_model.{self._path(path, where)}", field)
+
+    @staticmethod
+    def _convert(value, field):
+        field_type = field.get("type")
+        if field_type is None:
+            return value
+        if field_type == "money":
+            # Integer minor units, from the memoized table of the field's currency
+            return f"_units_{field['currency']}[{value}]"
+        return f"{field_type}({value})"
+
+    @staticmethod
+    def _path(path, where):
+        parts = path.split(".")
+        if not all(_PATH_PART.match(part) and not part.endswith("[]") for part in parts):
+            raise ValueError(f"{where}: unsupported path {path!r}")
+        return path
+
+    def _emit(self, indent, line):
+        self.lines.append("    " * indent + line)
+
+
+class RuleSchema:
+    """
+    Rule table compiled to rule functions, see the module docstring.
+
+    ``checkers`` maps rule names to functions taking the validator. The
+    validators bind a schema to their rule registry, where rules reserved with
+    ``registry.declare(name)`` are filled in by the schema's checkers.
+    """
+
+    def __init__(self, table):
+        self.table = table
+        self.model = table["model"]
+        if not isinstance(self.model, str) or not _IDENTIFIER.match(self.model):
+            raise ValueError(f"Invalid model name: {self.model!r}")
+        self.parameters = {
+            name: frozenset(value) if isinstance(value, list) else value
+            for name, value in table.get("parameters", {}).items()
+        }
+        self.patterns = {name: re.compile(text) for name, text in table.get("patterns", {}).items()}
+        self.fields = table.get("fields", {})
+        self.messages = {code: tuple(entry) for code, entry in table.get("messages", {}).items()}
+        self.digest = hashlib.sha256(json.dumps(table, sort_keys=True).encode()).hexdigest()
+
+        self._check_names()
+        self.checkers = {}
+        self.sections = {}
+        self.defaults = []
+        self.codes = set()
+        for name, rule in table.get("rules", {}).items():
+            self.checkers[name] = self._compile(name, rule)
+            if "sections" in rule:
+                self.sections[name] = tuple(rule["sections"])
+            if rule.get("default", True):
+                self.defaults.append(name)
+        # validator class -> (bound registry, messages)
+        self._bound = {}
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load a schema from a JSON file. A table with ``"extends"`` (a
+        built-in schema name or another file, relative to this one) is
+        applied over that schema.
+        """
+        with open(path, encoding="utf-8") as f:
+            table = json.load(f)
+        return cls(cls._resolve(table, os.path.dirname(os.fspath(path))))
+
+    @classmethod
+    def builtin(cls, name):
+        """One of the schemas shipped in ``SCHEMA_DIR``, e.g. ``"booking"``."""
+        return cls.load(os.path.join(SCHEMA_DIR, f"{name}.json"))
+
+    @classmethod
+    def _resolve(cls, table, directory):
+        base = table.get("extends")
+        if base is None:
+            return table
+        path = os.path.join(directory, base)
+        if not os.path.exists(path):
+            path = os.path.join(SCHEMA_DIR, f"{base}.json")
+        with open(path, encoding="utf-8") as f:
+            base_table = json.load(f)
+        return _merge(cls._resolve(base_table, os.path.dirname(path)), table)
+
+    def extend(self, table):
+        """New schema with ``table`` applied over this one."""
+        return RuleSchema(_merge(self.table, table))
+
+    def bind(self, validator_cls):
+        """The rule registry and messages of ``validator_cls`` under this schema."""
+        bound = self._bound.get(validator_cls)
+        if bound is None:
+            messages = {**validator_cls.messages, **self.messages}
+            unknown = self.codes - set(messages)
+            if unknown:
+                raise ValueError(f"Finding code(s) without a message: {', '.join(sorted(unknown))}")
+            registry = validator_cls.registry.bind(self.checkers, self.defaults, self.sections)
+            bound = self._bound[validator_cls] = (registry, messages)
+        return bound
+
+    def _check_names(self):
+        constants = set(self.parameters) | set(self.patterns)
+        for name in (*constants, *self.fields):
+            if not _IDENTIFIER.match(name) or name in FUNCTIONS or name in ("self", "error"):
+                raise ValueError(f"Invalid schema name: {name!r}")
+        clashes = constants & set(self.fields)
+        if clashes:
+            raise ValueError(f"Names used for both parameters and fields: {sorted(clashes)}")
+
+    def _compile(self, name, rule):
+        compiler = _RuleCompiler(self, name, rule)
+        source = compiler.compile()
+        self.codes |= compiler.codes
+        namespace = {**FUNCTIONS, **self.parameters, **self.patterns, "_minor_units": minor_units}
+        exec(compile(source, f"<rule {name}>", "exec"), namespace)
+        checker = namespace["rule"]
+        checker.__name__ = checker.__qualname__ = f"_validate_{name}"
+        checker.source = source
+        return checker
+
+    def __repr__(self):
+        # Stable across processes, so it can take part in result cache keys
+        return f"RuleSchema({self.model!r}, digest={self.digest!r})"
+
+    def __reduce__(self):
+        # Compiled checkers are rebuilt from the table, e.g. in worker processes
+        return (RuleSchema, (self.table,))
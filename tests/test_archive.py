@@ -0,0 +1,97 @@
+import os
+
+import pytest
+
+from src.validators.archive import ArchiveIndex, validate_archive
+from src.validators.batch import validate_document
+
+
+@pytest.fixture
+def archive(tmp_path, base_booking_xml, valid_fare_xml, invalid_pricing_xml, invalid_xml):
+    path = tmp_path / "archive.xml"
+    path.write_text(
+        base_booking_xml
+        + valid_fare_xml
+        + invalid_pricing_xml
+        + invalid_xml.replace("REF2025001", "REF2025002"),
+        encoding="utf-8",
+    )
+    return path
+
+
+def test_index_records_document_boundaries(archive):
+    """Test that each document's tag, byte span and reference is indexed."""
+    index = ArchiveIndex.build(archive)
+    data = archive.read_bytes()
+
+    assert [(tag, ref) for tag, _, _, ref in index] == [
+        ("BookingResponse", "REF2025001"),
+        ("FareResponse", "FARE2025001"),
+        ("FareResponse", "FARE2025003"),
+        ("BookingResponse", "REF2025002"),
+    ]
+    for tag, start, end, _ in index:
+        assert data[start:end].startswith(f"<{tag}>".encode())
+        assert data[start:end].endswith(f"</{tag}>".encode())
+
+
+def test_index_saved_and_reused(archive):
+    """Test that the sidecar index is reused until the archive changes."""
+    index = ArchiveIndex.open(archive)
+    assert os.path.exists(ArchiveIndex.index_path(archive))
+
+    assert ArchiveIndex.open(archive).entries == index.entries
+
+    with open(archive, "a", encoding="utf-8") as f:
+        f.write("<FareResponse><FareInfo><FareReference>X1</FareReference></FareInfo>")
+    reopened = ArchiveIndex.open(archive)
+    assert len(reopened) == len(index) + 1
+    assert reopened.entries[-1][3] == "X1"
+
+
+def test_truncated_document_does_not_swallow_next(tmp_path, base_booking_xml):
+    """Test that a document missing its closing tag ends where the next begins."""
+    path = tmp_path / "archive.xml"
+    truncated = base_booking_xml.split("</BookingResponse>")[0]
+    path.write_text(truncated + base_booking_xml.replace("REF2025001", "REF2"), encoding="utf-8")
+
+    index = ArchiveIndex.build(path)
+
+    assert [ref for _, _, _, ref in index] == ["REF2025001", "REF2"]
+    assert index.entries[0][2] == index.entries[1][1]
+
+
+def test_random_access_by_reference(archive, invalid_xml):
+    """Test that single documents are read and validated by reference."""
+    index = ArchiveIndex.open(archive)
+
+    assert index.read("REF2025002").decode() == invalid_xml.strip().replace(
+        "REF2025001", "REF2025002"
+    )
+    assert not index.validate("REF2025002")["is_valid"]
+    assert index.find("MISSING") is None
+    with pytest.raises(KeyError):
+        index.read("MISSING")
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_validate_archive_in_file_order(archive, workers):
+    """Test that archive validation matches per-document validation, in order."""
+    index = ArchiveIndex.open(archive)
+
+    results = list(validate_archive(archive, workers=workers, chunksize=1))
+
+    assert [ref for ref, _ in results] == [ref for _, _, _, ref in index]
+    assert [result for _, result in results] == [
+        validate_document(index.read(ref)) for _, _, _, ref in index
+    ]
+    assert [result["is_valid"] for _, result in results] == [True, True, False, False]
+
+
+def test_empty_archive(tmp_path):
+    """Test that an empty archive has an empty index."""
+    path = tmp_path / "empty.xml"
+    path.write_bytes(b"")
+
+    assert len(ArchiveIndex.open(path)) == 0
+    assert list(validate_archive(path)) == []
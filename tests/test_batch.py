@@ -0,0 +1,55 @@
+import pytest
+
+from src.validators.batch import validate_document, validate_many
+from src.validators.booking_validator import BookingValidator
+from src.validators.fare_validator import FareValidator
+
+
+def test_validate_document_detects_type(base_booking_xml, invalid_pricing_xml):
+    """Test that the validator is picked from the root tag."""
+    assert validate_document(base_booking_xml)["is_valid"]
+
+    result = validate_document(invalid_pricing_xml)
+    assert not result["is_valid"]
+    assert any("total mismatch" in error.lower() for error in result["errors"])
+
+
+def test_validate_document_unsupported_type():
+    """Test that unknown document types are reported, not raised."""
+    result = validate_document("<ScheduleResponse/>")
+
+    assert not result["is_valid"]
+    assert any("unsupported document type" in error.lower() for error in result["errors"])
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_validate_many_preserves_order(
+    workers, base_booking_xml, invalid_xml, valid_fare_xml, negative_seats_xml
+):
+    """Test that batch results come back in input order."""
+    docs = [base_booking_xml, invalid_xml, valid_fare_xml, negative_seats_xml] * 3
+
+    results = validate_many(docs, workers=workers, chunksize=2)
+
+    assert [result["is_valid"] for result in results] == [True, False, True, False] * 3
+
+
+def test_validate_many_matches_single_validation(invalid_child_xml, invalid_fare_basis_xml):
+    """Test that batch results equal the per-document validator results."""
+    results = validate_many([invalid_child_xml], validator_cls=BookingValidator, workers=2)
+    assert results == [BookingValidator(invalid_child_xml).validate()]
+
+    results = validate_many([invalid_fare_basis_xml] * 2, validator_cls=FareValidator, workers=2)
+    assert results == [FareValidator(invalid_fare_basis_xml).validate()] * 2
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_validate_many_forwards_options(workers, invalid_xml, base_booking_xml):
+    """Test that validator options apply to every document in the batch."""
+    docs = [invalid_xml, base_booking_xml.replace("1033.85", "1000.00")]
+
+    results = validate_many(docs, workers=workers, rules=["pricing"], structured=True)
+
+    assert results[0]["is_valid"]
+    assert {finding.rule for finding in results[1]["errors"]} == {"pricing"}
+    assert results == [validate_document(doc, rules=["pricing"], structured=True) for doc in docs]
@@ -0,0 +1,61 @@
+import io
+
+import pytest
+
+from benchmarks.generators import make_booking_feed, make_booking_xml, make_fare_xml
+from benchmarks.run_benchmarks import compare, main
+from src.validators.booking_validator import BookingValidator
+from src.validators.fare_validator import FareValidator
+
+
+@pytest.mark.parametrize("passengers,segments", [(1, 2), (9, 8), (50, 20)])
+def test_generated_bookings_are_valid(passengers, segments):
+    """Test that generated bookings of any size pass validation."""
+    result = BookingValidator(make_booking_xml(passengers, segments)).validate()
+
+    assert result["is_valid"], result["errors"]
+    assert result["summary"]["total_passengers"] == passengers
+
+
+@pytest.mark.parametrize("rules", [0, 2, 500])
+def test_generated_fares_are_valid(rules):
+    """Test that generated fares with many rules pass validation."""
+    result = FareValidator(make_fare_xml(rules)).validate()
+
+    assert result["is_valid"], result["errors"]
+    assert result["warnings"] == []
+
+
+def test_generated_feed_streams_all_documents():
+    """Test that a generated feed yields one valid result per booking."""
+    results = list(BookingValidator.iter_validate(io.BytesIO(make_booking_feed(25))))
+
+    assert len(results) == 25
+    assert all(result["is_valid"] for result in results)
+
+
+def test_compare_flags_regressions_only():
+    """Test that only metrics slower than the tolerance are reported."""
+    baseline = {
+        "booking": {"parse": 100.0, "validate": 200.0, "_validate_currency": 0.4},
+        "feed": {"docs_per_second": 1000},
+    }
+    results = {
+        "booking": {"parse": 120.0, "validate": 300.0, "_validate_currency": 0.9, "new_rule": 5.0},
+        "feed": {"docs_per_second": 700},
+    }
+
+    regressions = compare(results, baseline, tolerance=0.25)
+
+    assert len(regressions) == 2
+    assert regressions[0].startswith("booking.validate")
+    assert regressions[1].startswith("feed.docs_per_second")
+
+
+def test_missing_baseline_fails(tmp_path, monkeypatch):
+    """Test that a run without a baseline cannot pass as regression-free."""
+    monkeypatch.setattr("benchmarks.run_benchmarks.run", lambda **kwargs: {})
+
+    assert main(["--baseline", str(tmp_path / "baseline.json")]) == 2
+    assert main(["--baseline", str(tmp_path / "baseline.json"), "--save"]) == 0
+    assert main(["--baseline", str(tmp_path / "baseline.json")]) == 0
@@ -1,7 +1,10 @@
+import io
 import logging
 
 import pytest
 
+from src.utils.instrumentation import Instrumentation
+from src.utils.reporting import print_report
 from src.validators.booking_validator import BookingValidator
 
 logger = logging.getLogger(__name__)
@@ -95,3 +98,261 @@ def test_invalid_baggage_weight(excessive_baggage_xml):
     assert any(
         "baggage" in error.lower() and "exceeded" in error.lower() for error in result["errors"]
     )
+
+
+def _booking_feed(*bookings):
+    """Wrap booking documents into a single multi-booking feed."""
+    return ("<BookingFeed>" + "".join(bookings) + "</BookingFeed>").encode()
+
+
+def test_iter_validate_yields_result_per_booking(tmp_path, base_booking_xml, invalid_xml):
+    """Test that streaming validation yields one result per booking, in order."""
+    feed = tmp_path / "feed.xml"
+    feed.write_bytes(_booking_feed(base_booking_xml, invalid_xml, base_booking_xml))
+
+    results = list(BookingValidator.iter_validate(str(feed)))
+
+    assert [result["is_valid"] for result in results] == [True, False, True]
+    assert any("connection" in error.lower() for error in results[1]["errors"])
+
+
+def test_iter_validate_rejects_incomplete_bookings(tmp_path, base_booking_xml):
+    """Test that a streamed booking missing a required element fails without ending the feed."""
+    start = base_booking_xml.index("<Pricing")
+    end = base_booking_xml.index("</Pricing>") + len("</Pricing>")
+    feed = tmp_path / "feed.xml"
+    feed.write_bytes(
+        _booking_feed(base_booking_xml[:start] + base_booking_xml[end:], base_booking_xml)
+    )
+
+    results = list(BookingValidator.iter_validate(str(feed)))
+
+    assert results[0]["errors"] == ["Missing required element: Pricing"]
+    assert results[0]["summary"] is None
+    assert results[1]["is_valid"]
+
+
+def test_booking_without_segments_rejected(base_booking_xml):
+    """Test that a booking without flight segments is a finding, not an exception."""
+    start = base_booking_xml.index("<Route>")
+    end = base_booking_xml.index("</Route>") + len("</Route>")
+    xml = base_booking_xml[:start] + base_booking_xml[end:]
+
+    result = BookingValidator(xml).validate()
+
+    assert result["errors"] == ["Missing required element: Segment"]
+
+
+def test_iter_validate_is_incremental(base_booking_xml):
+    """Test that the first result is produced before the whole feed is read."""
+    stream = io.BytesIO(_booking_feed(*[base_booking_xml] * 500))
+
+    results = BookingValidator.iter_validate(stream)
+    first = next(results)
+
+    assert first["is_valid"]
+    assert stream.tell() < len(stream.getvalue())
+
+
+def test_booking_model_built_from_parse(excessive_baggage_xml):
+    """Test that validation reads a compact model and the tree is not kept."""
+    validator = BookingValidator(excessive_baggage_xml)
+    booking = validator.booking
+
+    assert not hasattr(validator, "root")
+    assert [p.id for p in booking.passengers] == ["P001", "P002"]
+    assert [s.number for s in booking.segments] == ["1", "2"]
+    assert booking.segments[0].arrival_time.isoformat() == "2025-06-15T10:45:00"
+    assert booking.pricing.currency == "GBP"
+    assert booking.pricing.subtotal == "1798.00"
+
+
+def test_validate_is_quiet_and_returns_summary(capsys, base_booking_xml):
+    """Test that validation prints nothing and returns the summary as data."""
+    xml = base_booking_xml.replace(
+        "</Baggage>",
+        '</Baggage><SpecialRequests><Request code="VGML">Vegetarian meal</Request>'
+        "</SpecialRequests>",
+    )
+    result = BookingValidator(xml).validate()
+
+    assert capsys.readouterr().out == ""
+    assert result["summary"]["booking_reference"] == "REF2025001"
+    assert result["summary"]["adults"] == 1
+    assert result["summary"]["children"] == 0
+    assert result["summary"]["total_price"] == "1033.85"
+    assert result["special_requests"] == [
+        {"passenger_id": "P001", "code": "VGML", "description": "Vegetarian meal"}
+    ]
+
+
+def test_reporter_receives_result(capsys, base_booking_xml):
+    """Test that a pluggable reporter is called with the result."""
+    reported = []
+    result = BookingValidator(base_booking_xml, reporter=reported.append).validate()
+    assert reported == [result]
+
+    BookingValidator(base_booking_xml, reporter=print_report).validate()
+    output = capsys.readouterr().out
+    assert "Booking reference: REF2025001" in output
+    assert "Total price: GBP 1033.85" in output
+
+
+def _segment(number, departure, arrival, origin="LHR", destination="JFK"):
+    return f"""
+        <Segment number="{number}" status="confirmed">
+            <Flight carrier="BA" number="11{number}" class="Y">
+                <Departure>
+                    <Airport>{origin}</Airport>
+                    <DateTime>{departure}</DateTime>
+                </Departure>
+                <Arrival>
+                    <Airport>{destination}</Airport>
+                    <DateTime>{arrival}</DateTime>
+                </Arrival>
+            </Flight>
+        </Segment>
+    """
+
+
+def _with_segments(xml, *segments):
+    start = xml.index("<Route>") + len("<Route>")
+    end = xml.index("</Route>")
+    return xml[:start] + "".join(segments) + xml[end:]
+
+
+def test_single_segment_booking_has_no_connection(base_booking_xml):
+    """Test that single-segment bookings validate without a connection check."""
+    xml = _with_segments(
+        base_booking_xml, _segment(1, "2025-06-15T08:30:00", "2025-06-15T10:45:00")
+    )
+
+    result = BookingValidator(xml).validate()
+
+    assert result["is_valid"], result["errors"]
+
+
+def test_every_connection_checked_in_segment_order(base_booking_xml):
+    """Test that later connections are checked, sorted by segment number."""
+    xml = _with_segments(
+        base_booking_xml,
+        _segment(3, "2025-06-15T18:00:00", "2025-06-15T20:00:00", "JFK", "BOS"),
+        _segment(1, "2025-06-15T08:30:00", "2025-06-15T10:45:00", "WAW", "LHR"),
+        _segment(2, "2025-06-15T14:00:00", "2025-06-15T17:30:00", "LHR", "JFK"),
+    )
+
+    result = BookingValidator(xml).validate()
+
+    assert result["errors"] == [
+        "Connection time too short at JFK between segments 2 and 3: 30 minutes "
+        "(minimum 90 minutes required)"
+    ]
+
+
+def test_min_connection_time_per_airport(invalid_xml):
+    """Test that minimum connection times can be configured per airport."""
+    assert BookingValidator(invalid_xml, min_connection_times={"LHR": 45}).validate()["is_valid"]
+
+    result = BookingValidator(invalid_xml, min_connection_times={"JFK": 30}).validate()
+    assert not result["is_valid"]
+
+    result = BookingValidator(invalid_xml, min_connection_times={"LHR": 60}).validate()
+    assert any("minimum 60 minutes" in error for error in result["errors"])
+
+
+def test_fail_fast_stops_at_first_error(invalid_xml):
+    """Test that fail-fast mode skips the rules after the first error."""
+    xml = invalid_xml.replace("<Tax>134.85</Tax>", "<Tax>0.00</Tax>")
+    assert len(BookingValidator(xml).validate()["errors"]) == 3
+
+    result = BookingValidator(xml, fail_fast=True).validate()
+
+    assert not result["is_valid"]
+    assert result["truncated"]
+    assert result["errors"] == [
+        "Connection time too short at LHR between segments 1 and 2: 45 minutes "
+        "(minimum 90 minutes required)"
+    ]
+
+
+def test_max_errors_budget(invalid_xml, base_booking_xml):
+    """Test that the error budget caps the collected errors."""
+    xml = invalid_xml.replace("<Tax>134.85</Tax>", "<Tax>0.00</Tax>")
+
+    result = BookingValidator(xml, max_errors=2).validate()
+    assert len(result["errors"]) == 2
+    assert result["truncated"]
+
+    result = BookingValidator(xml, max_errors=5).validate()
+    assert len(result["errors"]) == 3
+    assert not result["truncated"]
+
+    result = BookingValidator(base_booking_xml, fail_fast=True).validate()
+    assert result["is_valid"]
+    assert not result["truncated"]
+    assert "truncated" not in BookingValidator(base_booking_xml).validate()
+
+    with pytest.raises(ValueError, match="max_errors"):
+        BookingValidator(base_booking_xml, max_errors=0)
+
+
+def test_revalidate_reruns_only_changed_sections(invalid_xml):
+    """Test that revalidation reuses findings of rules whose sections are unchanged."""
+    previous = BookingValidator(invalid_xml)
+    previous.validate()
+
+    repriced = invalid_xml.replace("<Tax>134.85</Tax>", "<Tax>0.00</Tax>")
+    validator = BookingValidator(repriced, instrumentation=Instrumentation())
+    result = validator.revalidate(previous)
+
+    assert set(validator.timings) == {"parse", "model", "summary", "pricing", "special_requests"}
+    assert result == BookingValidator(repriced).validate()
+    assert result["errors"][0].startswith("Connection time too short at LHR")
+    assert result["errors"][1].startswith("Tax mismatch")
+
+
+def test_revalidate_reruns_rules_of_changed_passengers(invalid_xml):
+    """Test that a passenger change reruns every rule reading the passengers."""
+    previous = BookingValidator(invalid_xml)
+    previous.validate()
+
+    changed = invalid_xml.replace('<Weight unit="kg">20</Weight>', '<Weight unit="kg">120</Weight>')
+    validator = BookingValidator(changed, instrumentation=Instrumentation())
+    result = validator.revalidate(previous)
+
+    assert {"passenger_ages", "baggage", "pricing"} <= set(validator.timings)
+    assert "connection_times" not in validator.timings
+    assert result == BookingValidator(changed).validate()
+    assert any("Baggage limit exceeded" in error for error in result["errors"])
+
+
+def test_revalidate_with_other_settings_runs_everything(invalid_xml):
+    """Test that findings are not reused when the connection minimums differ."""
+    previous = BookingValidator(invalid_xml)
+    previous.validate()
+
+    result = BookingValidator(invalid_xml, min_connection_times={"LHR": 45}).revalidate(previous)
+
+    assert result["is_valid"]
+
+
+@pytest.mark.parametrize(
+    "date_of_birth,passenger_type,should_pass",
+    [
+        ("2013-06-15", "adult", True),  # 12th birthday on the departure date
+        ("2013-06-16", "adult", False),  # turns 12 the day after departure
+        ("2013-06-16", "child", True),
+        ("2013-06-15", "child", False),
+    ],
+)
+def test_passenger_age_at_birthday_boundary(
+    base_booking_xml, date_of_birth, passenger_type, should_pass
+):
+    """Test that ages are exact on the 12th birthday (departure 2025-06-15)."""
+    xml = base_booking_xml.replace("1985-03-20", date_of_birth).replace(
+        'type="adult"', f'type="{passenger_type}"'
+    )
+
+    result = BookingValidator(xml).validate(rules=["passenger_ages"])
+
+    assert result["is_valid"] == should_pass, result["errors"]
@@ -0,0 +1,134 @@
+import pytest
+
+from src.utils.instrumentation import Instrumentation
+from src.validators.booking_validator import BookingValidator
+from src.validators.cache import DiskCacheBackend, MemoryCacheBackend, ResultCache
+from src.validators.fare_validator import FareCatalog, FareValidator
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_repeated_document_hits_cache(base_booking_xml):
+    """Test that identical documents are validated once."""
+    cache = ResultCache()
+
+    first = cache.validate(base_booking_xml)
+    second = cache.validate(base_booking_xml)
+
+    assert first == second == BookingValidator(base_booking_xml).validate()
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_cached_result_is_a_copy(invalid_xml):
+    """Test that callers cannot alter cached results."""
+    cache = ResultCache()
+    cache.validate(invalid_xml)
+
+    cache.validate(invalid_xml)["errors"].clear()
+
+    assert cache.validate(invalid_xml)["errors"]
+
+
+def test_options_are_part_of_key(invalid_xml):
+    """Test that rule selections are cached separately."""
+    cache = ResultCache()
+
+    assert not cache.validate(invalid_xml)["is_valid"]
+    assert cache.validate(invalid_xml, rules=["pricing"])["is_valid"]
+    assert cache.misses == 2
+
+
+def test_lru_eviction(base_booking_xml, invalid_xml, invalid_child_xml):
+    """Test that the least recently used entry is evicted first."""
+    cache = ResultCache(backend=MemoryCacheBackend(maxsize=2))
+
+    cache.validate(base_booking_xml)
+    cache.validate(invalid_xml)
+    cache.validate(base_booking_xml)
+    cache.validate(invalid_child_xml)
+
+    assert cache.evictions == 1
+    cache.validate(base_booking_xml)
+    assert cache.hits == 2
+    cache.validate(invalid_xml)
+    assert cache.misses == 4
+
+
+def test_ttl_expiry(valid_fare_xml):
+    """Test that entries expire after the TTL."""
+    clock = FakeClock()
+    cache = ResultCache(ttl=60, clock=clock)
+
+    cache.validate(valid_fare_xml)
+    clock.now += 59
+    cache.validate(valid_fare_xml)
+    clock.now += 1
+    cache.validate(valid_fare_xml)
+
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["expirations"] == 1
+    assert cache.stats()["misses"] == 2
+
+
+@pytest.mark.parametrize("maxsize", [1, 10])
+def test_disk_backend_persists(tmp_path, maxsize, base_booking_xml, invalid_fare_basis_xml):
+    """Test that the on-disk backend shares results across cache instances."""
+    path = tmp_path / "results.sqlite"
+    cache = ResultCache(backend=DiskCacheBackend(path, maxsize=maxsize))
+    cache.validate(base_booking_xml)
+    expected = cache.validate(invalid_fare_basis_xml)
+    cache.backend.close()
+
+    cache = ResultCache(backend=DiskCacheBackend(path, maxsize=maxsize))
+
+    assert cache.validate(invalid_fare_basis_xml) == expected
+    assert cache.hits == 1
+    assert len(cache.backend) == min(maxsize, 2)
+
+
+def test_option_objects_keyed_by_content(valid_fare_xml):
+    """Test that catalogs are keyed by content, not by their memory address."""
+    cache = ResultCache()
+
+    cache.validate(valid_fare_xml, FareValidator, catalog=FareCatalog(currencies=("USD",)))
+    result = cache.validate(valid_fare_xml, FareValidator, catalog=FareCatalog(currencies=("SEK",)))
+    assert cache.hits == 0
+    assert result["warnings"] == ["Uncommon currency code: USD. Verify this is correct."]
+
+    cache.validate(valid_fare_xml, FareValidator, catalog=FareCatalog(currencies=("SEK",)))
+    assert cache.hits == 1
+    assert ResultCache.key(valid_fare_xml, catalog=FareCatalog()) == ResultCache.key(
+        valid_fare_xml, catalog=FareCatalog()
+    )
+
+
+def test_options_without_stable_key(base_booking_xml):
+    """Test that result-neutral options are not keyed and unkeyable ones are rejected."""
+    assert ResultCache.key(base_booking_xml) == ResultCache.key(
+        base_booking_xml, instrumentation=Instrumentation(), reporter=print
+    )
+
+    with pytest.raises(ValueError, match="min_connection_times"):
+        ResultCache.key(base_booking_xml, min_connection_times=object())
+
+
+def test_disk_backend_counts_without_scanning(tmp_path):
+    """Test that the running entry count tracks replacements, deletions and evictions."""
+    backend = DiskCacheBackend(tmp_path / "results.sqlite", maxsize=2)
+
+    assert backend.set("a", 1.0, b"1") == 0
+    assert backend.set("a", 2.0, b"2") == 0
+    assert backend.set("b", 3.0, b"3") == 0
+    assert backend.set("c", 4.0, b"4") == 1
+    backend.delete("b")
+    backend.delete("missing")
+
+    assert backend._count == len(backend) == 1
+    assert backend.get("c") == (4.0, b"4")
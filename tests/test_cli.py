@@ -0,0 +1,104 @@
+import io
+import json
+import sys
+
+import pytest
+
+from src.cli import iter_paths, main
+
+
+@pytest.fixture
+def inputs(tmp_path, base_booking_xml, invalid_xml, valid_fare_xml, invalid_pricing_xml):
+    (tmp_path / "bookings").mkdir()
+    (tmp_path / "bookings" / "ok.xml").write_text(base_booking_xml)
+    (tmp_path / "bookings" / "short_connection.xml").write_text(invalid_xml)
+    (tmp_path / "fares.xml").write_text(valid_fare_xml + invalid_pricing_xml)
+    (tmp_path / "notes.txt").write_text("not xml")
+    return tmp_path
+
+
+def read_records(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_iter_paths_expands_directories_and_globs(inputs):
+    """Test that directories and glob patterns expand to XML files."""
+    paths = list(iter_paths([str(inputs / "bookings"), str(inputs / "*.xml"), "-"]))
+
+    assert paths == [
+        str(inputs / "bookings" / "ok.xml"),
+        str(inputs / "bookings" / "short_connection.xml"),
+        str(inputs / "fares.xml"),
+        "-",
+    ]
+
+
+@pytest.mark.parametrize("workers", ["1", "2"])
+def test_validates_files_to_json_lines(inputs, capsys, workers):
+    """Test that every document is validated and written as one JSON line."""
+    output = inputs / "results.jsonl"
+
+    code = main(
+        [str(inputs / "bookings"), str(inputs / "fares.xml"), "-w", workers, "-o", str(output)]
+    )
+
+    records = read_records(output)
+    assert code == 1
+    assert [(r["source"].split("/")[-1], r["position"], r["is_valid"]) for r in records] == [
+        ("ok.xml", 0, True),
+        ("short_connection.xml", 0, False),
+        ("fares.xml", 0, True),
+        ("fares.xml", 1, False),
+    ]
+    assert records[0]["summary"]["booking_reference"] == "REF2025001"
+    err = capsys.readouterr().err
+    assert "4 documents" in err
+    assert "2 invalid (50.0%)" in err
+
+
+def test_reads_stdin_and_reports_bad_input(monkeypatch, capsys, valid_fare_xml):
+    """Test stdin input, structured output and broken documents."""
+    stdin = valid_fare_xml + "<BookingResponse><BookingReference>X</Book"
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(stdin.encode())))
+
+    code = main(["-q", "-w", "1", "--structured"])
+
+    out, err = capsys.readouterr()
+    records = [json.loads(line) for line in out.splitlines()]
+    assert code == 1
+    assert err == ""
+    assert records[0]["source"] == "-"
+    assert records[0]["is_valid"]
+    assert records[1]["errors"][0]["code"] == "truncated_document"
+
+
+def test_exit_code_zero_when_all_valid(inputs, capsys):
+    """Test that a clean run exits with 0."""
+    assert main(["-q", "-w", "1", str(inputs / "bookings" / "ok.xml")]) == 0
+    assert json.loads(capsys.readouterr().out)["is_valid"]
+
+
+def test_file_without_documents_reported(inputs, capsys):
+    """Test that files without a booking or fare are reported, not skipped."""
+    assert main(["-q", "-w", "1", str(inputs / "notes.txt")]) == 1
+    record = json.loads(capsys.readouterr().out)
+    assert record["errors"] == ["No BookingResponse or FareResponse document found"]
+
+
+@pytest.mark.parametrize("workers", ["1", "2"])
+def test_unreadable_inputs_reported_and_run_continues(inputs, capsys, workers):
+    """Test that missing files and empty globs become invalid records, not tracebacks."""
+    missing = str(inputs / "missing.xml")
+    no_match = str(inputs / "none" / "*.xml")
+    ok = str(inputs / "bookings" / "ok.xml")
+
+    assert main(["-q", "-w", workers, missing, no_match, ok]) == 1
+
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [(r["source"], r["is_valid"]) for r in records] == [
+        (missing, False),
+        (no_match, False),
+        (ok, True),
+    ]
+    assert records[0]["errors"][0].startswith("Cannot read input: ")
@@ -0,0 +1,127 @@
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from benchmarks.generators import make_booking_xml
+from src.validators.booking_validator import DEFAULT_SCHEMA, BookingValidator
+from src.validators.models import Booking
+
+np = pytest.importorskip("numpy")
+
+from src.validators.columnar import COLUMNAR_RULES, validate_bookings_columnar  # noqa: E402
+
+
+def scalar_results(docs, schema=None):
+    results = []
+    for doc in docs:
+        result = BookingValidator(doc, rules=COLUMNAR_RULES, schema=schema).validate()
+        results.append({key: result[key] for key in ("is_valid", "errors", "warnings")})
+    return results
+
+
+def test_columnar_matches_scalar_on_fixtures(
+    base_booking_xml, invalid_xml, invalid_child_xml, excessive_baggage_xml
+):
+    """Test that columnar results equal the scalar validator's messages."""
+    docs = [base_booking_xml, invalid_xml, invalid_child_xml, excessive_baggage_xml]
+
+    assert validate_bookings_columnar(docs) == scalar_results(docs)
+
+
+def test_columnar_matches_scalar_on_broken_documents(base_booking_xml, excessive_baggage_xml):
+    """Test that every pricing, age and baggage message matches the scalar path."""
+    docs = [
+        base_booking_xml.replace("<SubTotal>899.00</SubTotal>", "<SubTotal>900.10</SubTotal>"),
+        base_booking_xml.replace("<Tax>134.85</Tax>", "<Tax>100.00</Tax>"),
+        base_booking_xml.replace("<Total>1033.85</Total>", "<Total>1000.00</Total>"),
+        base_booking_xml.replace("1985-03-20", "2020-01-01"),
+        excessive_baggage_xml.replace('<Fare currency="GBP">899.00</Fare>', "<Fare>0.1</Fare>"),
+        make_booking_xml(passengers=40, segments=6),
+        make_booking_xml(passengers=3, segments=1).replace(
+            '<Weight unit="kg">33</Weight>', '<Weight unit="kg">40.5</Weight>'
+        ),
+    ]
+
+    columnar = validate_bookings_columnar(docs)
+
+    assert columnar == scalar_results(docs)
+    assert sum(not result["is_valid"] for result in columnar) == 6
+
+
+def test_columnar_reports_unparseable_amounts(base_booking_xml, excessive_baggage_xml):
+    """Test that a booking with a bad amount gets a finding without failing the batch."""
+    docs = [
+        base_booking_xml.replace('<Fare currency="GBP">899.00</Fare>', "<Fare>899.001</Fare>"),
+        excessive_baggage_xml.replace("<Tax>", "<Tax>x"),
+        base_booking_xml,
+    ]
+
+    columnar = validate_bookings_columnar(docs)
+
+    assert columnar == scalar_results(docs)
+    assert columnar[1]["errors"][-1].startswith("Invalid numeric value in pricing: ")
+    assert columnar[2]["is_valid"]
+
+
+def test_columnar_follows_market_schema(base_booking_xml, invalid_child_xml):
+    """Test that schema thresholds and messages apply as in the scalar validator."""
+    schema = DEFAULT_SCHEMA.extend(
+        {
+            "parameters": {"tax_rate": 0.23, "baggage_limit_kg": 15, "child_age_limit": 16},
+            "messages": {"tax_mismatch": ["BookingResponse/Pricing/Tax", "VAT {rate}"]},
+        }
+    )
+    docs = [base_booking_xml, invalid_child_xml]
+
+    columnar = validate_bookings_columnar(docs, schema=schema)
+
+    assert columnar == scalar_results(docs, schema)
+    assert "VAT 23%" in columnar[0]["errors"]
+
+
+def test_columnar_rejects_changed_checks():
+    """Test that schemas changing the vectorized checks are refused."""
+    schema = DEFAULT_SCHEMA.extend(
+        {"rules": {"baggage": {"checks": [{"code": "baggage_limit_exceeded", "fail": "False"}]}}}
+    )
+
+    with pytest.raises(ValueError, match="baggage"):
+        validate_bookings_columnar([], schema=schema)
+
+
+def test_columnar_empty_batch():
+    """Test that an empty batch gives no results."""
+    assert validate_bookings_columnar([]) == []
+
+
+def test_columnar_rejects_documents_like_scalar(base_booking_xml, valid_fare_xml):
+    """Test that rejected documents get the scalar findings and the rest still run."""
+    start = base_booking_xml.index("<Itinerary>")
+    end = base_booking_xml.index("</Itinerary>") + len("</Itinerary>")
+    docs = [
+        base_booking_xml[:start] + base_booking_xml[end:],
+        base_booking_xml[:-40],
+        valid_fare_xml,
+        base_booking_xml.replace("1985-03-20", "2020-01-01"),
+        ET.fromstring(base_booking_xml.replace("Pricing", "Price")),
+    ]
+
+    results = validate_bookings_columnar(docs)
+
+    assert results == scalar_results(docs)
+    assert results[0]["errors"] == ["Missing required element: Segment"]
+    assert not results[3]["is_valid"]
+    assert results[4]["errors"] == ["Missing required element: Pricing"]
+
+
+def test_columnar_reads_columns_without_a_model(monkeypatch, base_booking_xml, invalid_child_xml):
+    """Test that the engine reads its columns from the tree instead of building bookings."""
+    docs = [base_booking_xml, invalid_child_xml]
+    expected = scalar_results(docs)
+
+    def from_element(root):
+        raise AssertionError("Booking model built")
+
+    monkeypatch.setattr(Booking, "from_element", from_element)
+
+    assert validate_bookings_columnar(docs) == expected
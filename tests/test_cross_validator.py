@@ -0,0 +1,103 @@
+import pytest
+
+from src.utils.instrumentation import Instrumentation
+from src.validators.booking_validator import BookingValidator
+from src.validators.cross_validator import BookingFareValidator
+from src.validators.fare_validator import FareValidator
+
+
+@pytest.fixture
+def matching_fare_xml(valid_fare_xml):
+    """Fare quoted in the booking's currency at the booking's per-passenger price."""
+    return (
+        valid_fare_xml.replace("USD", "GBP")
+        .replace("575.00", "1033.85")
+        .replace("500.00", "899.00")
+        .replace(">75.00<", ">134.85<")
+    )
+
+
+def test_matching_booking_and_fare_pass(base_booking_xml, matching_fare_xml):
+    """Test that a booking priced from its fare passes every check."""
+    result = BookingFareValidator(base_booking_xml, matching_fare_xml).validate()
+
+    assert result["is_valid"], result
+    assert result["errors"] == []
+    assert result["booking"] == BookingValidator(base_booking_xml).validate()
+    assert result["fare"] == FareValidator(matching_fare_xml).validate()
+
+
+def test_fare_amount_and_currency_mismatch(base_booking_xml, valid_fare_xml):
+    """Test that totals and currency are checked across the two documents."""
+    result = BookingFareValidator(base_booking_xml, valid_fare_xml).validate()
+
+    assert not result["is_valid"]
+    assert result["booking"]["is_valid"]
+    assert result["fare"]["is_valid"]
+    assert result["errors"] == [
+        "Booking SubTotal 899.00 does not match fare BaseFare 500.00 for 1 passenger(s): "
+        "expected 500.00",
+        "Booking Tax 134.85 does not match fare Taxes 75.00 for 1 passenger(s): expected 75.00",
+        "Booking currency GBP does not match fare currency USD",
+    ]
+
+
+def test_document_results_count_towards_validity(invalid_xml, matching_fare_xml):
+    """Test that booking errors make the combined result invalid."""
+    result = BookingFareValidator(invalid_xml, matching_fare_xml).validate()
+
+    assert result["errors"] == []
+    assert not result["booking"]["is_valid"]
+    assert not result["is_valid"]
+
+
+def test_each_document_parsed_once(base_booking_xml, matching_fare_xml):
+    """Test that the booking and fare validators reuse the pipeline's parse."""
+    instrumentation = Instrumentation()
+
+    BookingFareValidator(
+        base_booking_xml,
+        matching_fare_xml,
+        instrumentation=instrumentation,
+        rules=["currency_consistency"],
+        booking_options={"rules": ["pricing"]},
+    ).validate()
+
+    steps = {step for _, step in instrumentation.totals}
+    assert {"pricing", "currency_consistency", "fare_structure"} <= steps
+    assert instrumentation.totals[("BookingValidator", "parse")][1] == 1
+    assert instrumentation.totals[("FareValidator", "parse")][1] == 1
+    assert "connection_times" not in steps
+    assert set(instrumentation.documents) == {
+        "BookingValidator",
+        "FareValidator",
+        "BookingFareValidator",
+    }
+
+
+def test_structured_cross_findings(base_booking_xml, valid_fare_xml):
+    """Test that structured mode applies to the nested results as well."""
+    result = BookingFareValidator(
+        base_booking_xml,
+        valid_fare_xml.replace("<FareBasis>YOWUS", "<FareBasis>x"),
+        structured=True,
+    ).validate()
+
+    assert result["errors"][0].code == "subtotal_fare_mismatch"
+    assert result["errors"][0].rule == "fare_totals"
+    assert result["fare"]["errors"][0].code == "invalid_fare_basis"
+
+
+def test_error_budget_covers_nested_validators(invalid_xml, invalid_pricing_xml):
+    """Test that fail_fast stops the booking and fare rules at their first error."""
+    booking_xml = invalid_xml.replace("<Tax>", "<Tax>1").replace("<Total>", "<Total>1")
+    fare_xml = invalid_pricing_xml.replace("<FareBasis>", "<FareBasis>x")
+    assert len(BookingFareValidator(booking_xml, fare_xml).validate()["booking"]["errors"]) > 1
+
+    result = BookingFareValidator(booking_xml, fare_xml, fail_fast=True).validate()
+
+    assert len(result["booking"]["errors"]) == 1
+    assert result["booking"]["truncated"]
+    assert len(result["fare"]["errors"]) == 1
+    assert result["truncated"]
+    assert not result["is_valid"]
@@ -0,0 +1,35 @@
+from datetime import date, datetime
+
+from src.utils.dates import age_cutoff, age_on, parse_date, parse_datetime, years_before
+
+
+def test_parsing_is_memoized():
+    """Test that repeated strings are parsed once."""
+    parse_date.cache_clear()
+
+    assert parse_date("1985-03-20") == date(1985, 3, 20)
+    assert parse_date("1985-03-20") == date(1985, 3, 20)
+    assert parse_date.cache_info().hits == 1
+    assert parse_date("1985-03-20T10:00:00") == date(1985, 3, 20)
+    assert parse_datetime("2025-06-15T08:30:00") == datetime(2025, 6, 15, 8, 30)
+
+
+def test_age_at_birthday_boundaries():
+    """Test that a birthday counts as reached on the day itself."""
+    born = date(2013, 6, 15)
+
+    assert age_on(born, date(2025, 6, 14)) == 11
+    assert age_on(born, date(2025, 6, 15)) == 12
+    assert age_on(born, datetime(2025, 6, 15, 23, 59)) == 12
+
+
+def test_age_cutoff():
+    """Test that the cutoff is the latest date of birth of someone old enough."""
+    assert age_cutoff(date(2025, 6, 15), 12) == date(2013, 6, 15)
+    assert age_on(age_cutoff(date(2025, 6, 15), 12), date(2025, 6, 15)) == 12
+
+
+def test_leap_day_falls_back_to_28th():
+    """Test that 29 February maps onto non-leap years as the 28th."""
+    assert years_before(date(2024, 2, 29), 12) == date(2012, 2, 29)
+    assert years_before(date(2024, 2, 29), 1) == date(2023, 2, 28)
@@ -0,0 +1,42 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.validators.booking_validator import BookingValidator
+from src.validators.engine import ValidatorEngine
+from src.validators.fare_validator import FareValidator
+
+
+def test_engine_matches_validator(base_booking_xml, invalid_xml, excessive_baggage_xml):
+    """Test that an engine returns the same results as a validator per document."""
+    engine = ValidatorEngine(BookingValidator, min_connection_times={"LHR": 75})
+
+    for xml in (base_booking_xml, invalid_xml, excessive_baggage_xml):
+        expected = BookingValidator(xml, min_connection_times={"LHR": 75}).validate()
+        assert engine.validate(xml) == expected
+
+
+def test_engine_shared_between_threads(
+    base_booking_xml, invalid_xml, invalid_child_xml, excessive_baggage_xml
+):
+    """Test that one engine validates concurrently without mixing up findings."""
+    engine = ValidatorEngine(BookingValidator, structured=True)
+    docs = [base_booking_xml, invalid_xml, invalid_child_xml, excessive_baggage_xml] * 50
+    expected = [engine.validate(doc) for doc in docs]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert list(executor.map(engine.validate, docs)) == expected
+
+
+def test_engine_configuration_checked_once(valid_fare_xml, invalid_pricing_xml):
+    """Test that rule selections are resolved on construction and per call."""
+    with pytest.raises(ValueError, match="Unknown rule"):
+        ValidatorEngine(FareValidator, rules=["nonexistent"])
+
+    rules = ["pricing_components"]
+    engine = ValidatorEngine(FareValidator, rules=rules)
+    rules.append("fare_rules")
+
+    assert not engine.validate(invalid_pricing_xml)["is_valid"]
+    assert engine.validate(invalid_pricing_xml, rules=["fare_rules"])["is_valid"]
+    assert engine.validate("<FareResponse/>")["errors"] == ["Missing required element: FareInfo"]
@@ -1,6 +1,9 @@
+import json
+from datetime import datetime
+
 import pytest
 
-from src.validators.fare_validator import FareValidator
+from src.validators.fare_validator import FareCatalog, FareValidator
 
 
 def test_valid_fare_passes(valid_fare_xml):
@@ -178,3 +181,59 @@ def test_seat_availability_validation(valid_fare_xml, seats, should_pass, should
         assert any(
             "negative" in error.lower() or "seats" in error.lower() for error in result["errors"]
         )
+
+
+def test_unknown_rule_type_warns_with_catalog_order(valid_fare_xml):
+    """Test that unknown rule types list the catalog in its declared order."""
+    xml = valid_fare_xml.replace('type="MIN_STAY"', 'type="ROUTING"')
+
+    result = FareValidator(xml).validate()
+
+    assert result["is_valid"]
+    assert result["warnings"] == [
+        "Unknown fare rule type: ROUTING. Expected one of: "
+        "ADVANCE_PURCHASE, MIN_STAY, MAX_STAY, PENALTIES, BLACKOUT_DATES"
+    ]
+
+
+def test_catalog_loaded_from_config_table(tmp_path, valid_fare_xml):
+    """Test that currency and rule type catalogs can be configured."""
+    table = tmp_path / "catalog.json"
+    table.write_text(json.dumps({"rule_types": ["ADVANCE_PURCHASE"], "currencies": ["SEK"]}))
+    catalog = FareCatalog.load(table)
+
+    result = FareValidator(valid_fare_xml, catalog=catalog).validate()
+
+    assert result["is_valid"]
+    assert any("Unknown fare rule type: MIN_STAY" in w for w in result["warnings"])
+    assert any("Uncommon currency code: USD" in w for w in result["warnings"])
+
+    xml = valid_fare_xml.replace('currency="USD"', 'currency="SEK"')
+    result = FareValidator(xml, catalog=catalog).validate()
+    assert not any("currency" in w.lower() for w in result["warnings"])
+
+
+def test_fail_fast_skips_remaining_rules(invalid_currency_xml):
+    """Test that fail-fast mode stops the fare rules at the first error."""
+    result = FareValidator(invalid_currency_xml.replace("<FareBasis>", "<FareBasis>x")).validate()
+    assert len(result["errors"]) > 1
+
+    result = FareValidator(
+        invalid_currency_xml.replace("<FareBasis>", "<FareBasis>x"), fail_fast=True
+    ).validate()
+    assert len(result["errors"]) == 1
+    assert result["truncated"]
+
+
+def test_expiry_checked_against_reference_time(valid_fare_xml):
+    """Test that the expiry check uses the given reference time."""
+    xml = valid_fare_xml.replace(
+        "</FareInfo>", "<ValidFrom>2025-01-01</ValidFrom><ValidTo>2025-06-30</ValidTo></FareInfo>"
+    )
+
+    def expired(now):
+        result = FareValidator(xml, now=now).validate(rules=["validity_dates"])
+        return any("expired" in warning for warning in result["warnings"])
+
+    assert not expired(datetime(2025, 6, 29))
+    assert expired(datetime(2025, 7, 1))
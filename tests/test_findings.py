@@ -0,0 +1,90 @@
+import pickle
+from datetime import date, datetime
+
+import pytest
+
+from src.validators.booking_validator import BookingValidator
+from src.validators.fare_validator import FareValidator
+from src.validators.findings import Finding, dumps, loads, to_record
+
+
+def test_structured_findings_carry_typed_values(invalid_child_xml):
+    """Test that structured results hold findings with rule, code, path and values."""
+    result = BookingValidator(invalid_child_xml, structured=True).validate()
+
+    (finding,) = result["errors"]
+    assert isinstance(finding, Finding)
+    assert finding.rule == "passenger_ages"
+    assert finding.code == "child_too_old"
+    assert finding.severity == "error"
+    assert finding.path == "BookingResponse/Passengers/Passenger[@id='P001']"
+    assert finding.values == {"passenger_id": "P001", "age": 15, "limit": 12}
+
+
+def test_messages_match_plain_results(invalid_xml, invalid_currency_xml):
+    """Test that formatting a finding gives the default result's message."""
+    for validator_cls, xml in [
+        (BookingValidator, invalid_xml.replace("<Tax>134.85</Tax>", "<Tax>0.00</Tax>")),
+        (FareValidator, invalid_currency_xml),
+    ]:
+        structured = validator_cls(xml, structured=True).validate()
+        plain = validator_cls(xml).validate()
+
+        assert [str(f) for f in structured["errors"]] == plain["errors"]
+        assert [str(f) for f in structured["warnings"]] == plain["warnings"]
+        assert all(f.severity == "warning" for f in structured["warnings"])
+
+
+def test_findings_pickle_and_compare(invalid_pricing_xml):
+    """Test that findings survive pickling, as used by the process pool and cache."""
+    result = FareValidator(invalid_pricing_xml, structured=True).validate()
+
+    copied = pickle.loads(pickle.dumps(result))
+
+    assert copied["errors"] == result["errors"]
+    assert hash(copied["errors"][0]) == hash(result["errors"][0])
+
+
+def test_to_record_keeps_plain_messages():
+    """Test that results without findings are passed through unchanged."""
+    result = {"is_valid": False, "errors": ["Unsupported document type: X"], "warnings": []}
+
+    assert to_record(result) == result
+
+
+def test_json_lines_round_trip(invalid_pricing_xml, valid_fare_xml):
+    """Test that results are written one compact JSON object per line."""
+    xml = valid_fare_xml.replace(
+        "</FareInfo>", "<ValidFrom>2025-01-01</ValidFrom><ValidTo>2025-02-01</ValidTo></FareInfo>"
+    )
+    results = [
+        FareValidator(invalid_pricing_xml, structured=True).validate(),
+        FareValidator(xml, structured=True, now=datetime(2026, 1, 1)).validate(
+            rules=["validity_dates"]
+        ),
+    ]
+
+    data = dumps(results)
+    records = loads(data)
+
+    assert data.count(b"\n") == 2
+    assert records[0]["errors"][0]["code"] == "total_mismatch"
+    assert "message" not in records[0]["errors"][0]
+    assert records[1]["warnings"][0]["values"] == {"valid_to": date(2025, 2, 1).isoformat()}
+
+    with_messages = loads(dumps(results, messages=True))
+    assert with_messages[0]["errors"][0]["message"] == str(results[0]["errors"][0])
+
+
+def test_msgpack_round_trip(invalid_pricing_xml):
+    """Test the msgpack serializer."""
+    pytest.importorskip("msgpack")
+    results = [FareValidator(invalid_pricing_xml, structured=True).validate()]
+
+    assert loads(dumps(results, format="msgpack"), format="msgpack") == loads(dumps(results))
+
+
+def test_unknown_format_rejected():
+    """Test that unknown serialization formats raise."""
+    with pytest.raises(ValueError, match="Unknown format"):
+        dumps([], format="xml")
@@ -0,0 +1,62 @@
+from src.utils.instrumentation import Instrumentation
+from src.validators.booking_validator import BookingValidator
+from src.validators.fare_validator import FareValidator
+
+BOOKING_STEPS = {
+    "parse",
+    "model",
+    "summary",
+    "connection_times",
+    "passenger_ages",
+    "baggage",
+    "pricing",
+    "special_requests",
+}
+
+
+def test_per_document_timings_reported(base_booking_xml):
+    """Test that every step of a document is timed and sent to the callback."""
+    reported = []
+    instrumentation = Instrumentation(callback=lambda name, t: reported.append((name, t)))
+
+    validator = BookingValidator(base_booking_xml, instrumentation=instrumentation)
+    validator.validate()
+
+    assert len(reported) == 1
+    name, timings = reported[0]
+    assert name == "BookingValidator"
+    assert set(timings) == BOOKING_STEPS
+    assert all(seconds >= 0 for seconds in timings.values())
+
+
+def test_totals_aggregate_across_documents(base_booking_xml, valid_fare_xml):
+    """Test that timings and call counts are aggregated across a run."""
+    instrumentation = Instrumentation()
+
+    for _ in range(3):
+        BookingValidator(base_booking_xml, instrumentation=instrumentation).validate()
+    FareValidator(valid_fare_xml, instrumentation=instrumentation).validate()
+
+    assert instrumentation.documents == {"BookingValidator": 3, "FareValidator": 1}
+    assert instrumentation.totals[("BookingValidator", "pricing")][1] == 3
+    assert instrumentation.totals[("FareValidator", "fare_rules")][1] == 1
+
+
+def test_prometheus_text_dump(valid_fare_xml):
+    """Test the Prometheus text exposition output."""
+    instrumentation = Instrumentation()
+    FareValidator(valid_fare_xml, instrumentation=instrumentation).validate()
+
+    text = instrumentation.to_prometheus()
+
+    assert 'validator_documents_total{validator="FareValidator"} 1' in text
+    assert 'validator_step_calls_total{validator="FareValidator",step="currency"} 1' in text
+    assert "# TYPE validator_step_seconds_total counter" in text
+
+
+def test_no_timings_without_instrumentation(base_booking_xml):
+    """Test that nothing is recorded when instrumentation is off."""
+    validator = BookingValidator(base_booking_xml)
+    validator.validate()
+
+    assert validator.timings == {}
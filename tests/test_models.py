@@ -0,0 +1,68 @@
+import xml.etree.ElementTree as ET
+
+from src.validators.models import Booking, Fare, FareRule, Passenger
+
+
+def test_model_objects_have_no_instance_dict(base_booking_xml, valid_fare_xml):
+    """Test that model classes are slot-only."""
+    booking = Booking.from_element(ET.fromstring(base_booking_xml))
+    fare = Fare.from_element(ET.fromstring(valid_fare_xml))
+
+    for obj in [booking, booking.pricing, *booking.segments, *booking.passengers, fare, fare.info]:
+        assert not hasattr(obj, "__dict__")
+
+
+def test_booking_segments_sorted_by_number(base_booking_xml):
+    """Test that segments are kept in itinerary order."""
+    xml = base_booking_xml.replace('number="1" status', 'number="9" status')
+
+    booking = Booking.from_element(ET.fromstring(xml))
+
+    assert [segment.number for segment in booking.segments] == ["2", "9"]
+
+
+def test_passenger_special_requests(base_booking_xml):
+    """Test that special requests are captured per passenger."""
+    xml = base_booking_xml.replace(
+        "</Baggage>",
+        '</Baggage><SpecialRequests><Request code="WCHR">Wheelchair</Request></SpecialRequests>',
+    )
+
+    (passenger,) = Booking.from_element(ET.fromstring(xml)).passengers
+
+    assert isinstance(passenger, Passenger)
+    assert passenger.special_requests == (("WCHR", "Wheelchair"),)
+    assert passenger.fare == "899.00"
+
+
+def test_fare_model_fields(valid_fare_xml):
+    """Test that the fare model holds every field the checks read."""
+    fare = Fare.from_element(ET.fromstring(valid_fare_xml))
+
+    assert fare.info.reference == "FARE2025001"
+    assert fare.fare_basis_codes == ("YOWUS",)
+    assert fare.pricing.total == "575.00"
+    assert fare.rules[0] == FareRule("ADVANCE_PURCHASE", "AP14", "14")
+    assert fare.seats_available == "7"
+    assert fare.currencies == ("USD",)
+
+
+def test_missing_and_empty_fields_differ():
+    """Test that missing elements are None and empty ones are empty strings."""
+    fare = Fare.from_element(
+        ET.fromstring("<FareResponse><FareInfo><FareBasis/></FareInfo></FareResponse>")
+    )
+
+    assert fare.info.basis == ""
+    assert fare.info.reference is None
+    assert fare.pricing is None
+    assert fare.seats_available is None
+
+
+def test_booking_changed_sections(base_booking_xml):
+    """Test that bookings report which document sections differ."""
+    booking = Booking.from_element(ET.fromstring(base_booking_xml))
+    repriced = Booking.from_element(ET.fromstring(base_booking_xml.replace("<Total>", "<Total>1")))
+
+    assert booking.changed_sections(Booking.from_element(ET.fromstring(base_booking_xml))) == set()
+    assert repriced.changed_sections(booking) == {"Pricing"}
@@ -0,0 +1,135 @@
+import pickle
+
+import pytest
+
+from src.utils.money import Money, apply_rate, minor_units, parse_minor, percent
+from src.validators.booking_validator import BookingValidator
+from src.validators.fare_validator import FareValidator
+
+
+@pytest.mark.parametrize(
+    "text, currency, minor",
+    [
+        ("899.00", "GBP", 89900),
+        ("0.1", "USD", 10),
+        (" 12 ", "EUR", 1200),
+        ("-1.50", "USD", -150),
+        ("1500", "JPY", 1500),
+        ("1500.00", "JPY", 1500),
+        ("1.250", "KWD", 1250),
+    ],
+)
+def test_amounts_parse_to_minor_units(text, currency, minor):
+    """Test that amounts become integer minor units of their currency."""
+    assert parse_minor(text, currency) == minor
+
+
+@pytest.mark.parametrize("text, currency", [("1.005", "USD"), ("1.5", "JPY"), ("1,00", "EUR")])
+def test_unrepresentable_amounts_rejected(text, currency):
+    """Test that extra precision or malformed text raises instead of rounding."""
+    with pytest.raises(ValueError):
+        parse_minor(text, currency)
+
+
+def test_parsing_is_memoized_per_currency():
+    """Test that repeated amounts are dict hits in the currency's table."""
+    parse_minor("123.45", "CHF")
+
+    assert minor_units("CHF")["123.45"] == 12345
+    assert "123.45" not in minor_units("JPY")
+
+
+def test_apply_rate_rounds_half_up():
+    """Test that rates apply exactly, rounding half a minor unit up."""
+    assert apply_rate(89900, 0.15) == 13485
+    assert apply_rate(30, 0.15) == 5
+    assert apply_rate(-30, 0.15) == -5
+    assert apply_rate(1001, 0.08) == 80
+
+
+@pytest.mark.parametrize(
+    "rate, text", [(0.15, "15%"), (0.075, "7.5%"), (0.125, "12.5%"), (0.2, "20%"), (1, "100%")]
+)
+def test_percent_keeps_rate_precision(rate, text):
+    """Test that rates print as percentages without rounding away decimals."""
+    assert percent(rate) == text
+
+
+def test_money_formats_with_currency_exponent():
+    """Test that money prints with the currency's decimal places and pickles."""
+    assert str(Money(89900, "GBP")) == "899.00"
+    assert str(Money(-5, "USD")) == "-0.05"
+    assert str(Money(1500, "JPY")) == "1500"
+    assert f"{Money(1250, 'KWD'):.2f}" == "1.25"
+    assert pickle.loads(pickle.dumps(Money(5, "USD"))) == Money(5, "USD")
+
+
+def test_large_booking_reconciles_exactly(base_booking_xml):
+    """Test that many cent fares add up exactly where floats drift."""
+    start = base_booking_xml.index("<Passenger ")
+    end = base_booking_xml.index("</Passengers>")
+    passenger = (
+        base_booking_xml[start:end]
+        .replace('<Weight unit="kg">20</Weight>', '<Weight unit="kg">0</Weight>')
+        .replace("899.00", "0.10")
+    )
+    xml = (
+        (base_booking_xml[:start] + passenger * 30 + base_booking_xml[end:])
+        .replace("<SubTotal>899.00</SubTotal>", "<SubTotal>3.00</SubTotal>")
+        .replace("<Tax>134.85</Tax>", "<Tax>0.45</Tax>")
+        .replace("<Total>1033.85</Total>", "<Total>3.45</Total>")
+    )
+
+    assert sum([0.1] * 30) != 3.0
+    assert BookingValidator(xml, rules=["pricing"]).validate()["is_valid"]
+
+    validator = BookingValidator(xml.replace("<Total>3.45", "<Total>3.46"), rules=["pricing"])
+    assert validator.validate()["errors"] == [
+        "Total mismatch: expected 3.45 (SubTotal + Tax), but got 3.46"
+    ]
+
+
+def test_zero_decimal_currency(valid_fare_xml):
+    """Test that JPY amounts have no minor digits and reject fractions."""
+    xml = (
+        valid_fare_xml.replace('currency="USD"', 'currency="JPY"')
+        .replace("<BaseFare>500.00</BaseFare>", "<BaseFare>50000</BaseFare>")
+        .replace("<Taxes>75.00</Taxes>", "<Taxes>7500</Taxes>")
+        .replace("<Total>575.00</Total>", "<Total>57500</Total>")
+    )
+
+    assert FareValidator(xml, rules=["pricing_components"]).validate()["is_valid"]
+
+    result = FareValidator(
+        xml.replace("<Taxes>7500</Taxes>", "<Taxes>7500.5</Taxes>"), rules=["pricing_components"]
+    ).validate()
+    assert result["errors"] == [
+        "Invalid numeric value in pricing: Amount 7500.5 has more than 0 decimal places for JPY"
+    ]
+
+
+@pytest.mark.parametrize(
+    "fare, error",
+    [
+        ("899.001", "Amount 899.001 has more than 2 decimal places for GBP"),
+        ("n/a", "Invalid amount: 'n/a'"),
+    ],
+)
+def test_unparseable_booking_amount_is_a_finding(base_booking_xml, fare, error):
+    """Test that a booking amount that does not parse is reported, not raised."""
+    xml = base_booking_xml.replace('<Fare currency="GBP">899.00</Fare>', f"<Fare>{fare}</Fare>")
+
+    result = BookingValidator(xml).validate()
+
+    assert result["errors"] == [f"Invalid numeric value in pricing: {error}"]
+
+
+def test_zero_decimal_booking_rejects_fractions(base_booking_xml):
+    """Test that a JPY booking with minor digits is reported, not raised."""
+    xml = base_booking_xml.replace('currency="GBP"', 'currency="JPY"')
+
+    result = BookingValidator(xml, rules=["pricing"]).validate()
+
+    assert result["errors"] == [
+        "Invalid numeric value in pricing: Amount 134.85 has more than 0 decimal places for JPY"
+    ]
@@ -0,0 +1,80 @@
+import pytest
+
+from src.validators.batch import validate_document
+from src.validators.booking_validator import BookingValidator
+from src.validators.cross_validator import BookingFareValidator
+from src.validators.fare_validator import FareValidator
+from src.validators.prefilter import check_structure
+
+
+def codes(findings):
+    return [finding.code for finding in findings]
+
+
+@pytest.mark.parametrize(
+    "document, code",
+    [
+        ("", "empty_document"),
+        (b"  \n", "empty_document"),
+        ("not xml at all", "not_xml"),
+        ("<Booking", "not_xml"),
+        ("<Invoice><Total>1</Total></Invoice>", "unsupported_document"),
+        ("<BookingResponse><BookingReference>X</Book", "truncated_document"),
+        (b"<FareResponse><FareInfo>", "truncated_document"),
+    ],
+)
+def test_structural_problems_detected(document, code):
+    """Test that gross structural problems are found without parsing."""
+    assert codes(check_structure(document)) == [code]
+
+
+def test_valid_documents_pass(base_booking_xml, valid_fare_xml):
+    """Test that complete documents, as text or bytes, pass the prefilter."""
+    preamble = '\ufeff<?xml version="1.0"?>\n<!-- feed -->\n'
+
+    assert check_structure(base_booking_xml) == ()
+    assert check_structure((preamble + valid_fare_xml + "<!-- end -->").encode()) == ()
+
+
+def test_missing_required_elements(base_booking_xml):
+    """Test that each missing required element is reported with its path."""
+    start = base_booking_xml.index("<Pricing")
+    end = base_booking_xml.index("</Pricing>") + len("</Pricing>")
+    xml = base_booking_xml[:start] + base_booking_xml[end:]
+
+    (finding,) = check_structure(xml.replace("BookingReference>", "Reference>"))[1:]
+    assert finding.path == "BookingResponse/Pricing"
+    assert codes(check_structure("<BookingResponse/>")) == ["missing_element"] * 3
+
+
+def test_expected_document_type(valid_fare_xml):
+    """Test that a validator only accepts its own document type."""
+    result = BookingValidator(valid_fare_xml).validate()
+
+    assert result["errors"] == ["Unsupported document type: FareResponse"]
+    assert result["summary"] is None
+    assert validate_document(valid_fare_xml)["is_valid"]
+
+    result = validate_document("<Invoice/>", structured=True)
+    assert codes(result["errors"]) == ["unsupported_document"]
+    assert result["errors"][0].values == {"root": "Invoice"}
+
+
+def test_rejected_documents_return_findings(base_booking_xml, valid_fare_xml):
+    """Test that bad input yields a failed result instead of raising."""
+    truncated = base_booking_xml[:-40]
+
+    result = validate_document(truncated, structured=True)
+    assert not result["is_valid"]
+    assert codes(result["errors"]) == ["truncated_document"]
+
+    result = FareValidator(valid_fare_xml.replace("<Taxes>", "<Taxes><")).validate()
+    assert result["errors"][0].startswith("Malformed XML: ")
+
+    result = BookingFareValidator(truncated, valid_fare_xml).validate()
+    assert not result["is_valid"]
+    assert result["errors"] == []
+    assert result["booking"]["errors"] == [
+        "Document is truncated: no closing </BookingResponse> tag"
+    ]
+    assert result["fare"]["is_valid"]
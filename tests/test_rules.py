@@ -0,0 +1,109 @@
+import pytest
+
+from src.utils.instrumentation import Instrumentation
+from src.validators.booking_validator import BookingValidator
+from src.validators.fare_validator import FareValidator
+from src.validators.rules import RuleRegistry
+
+
+def test_registered_rules_in_order():
+    """Test that rules are registered in declaration order."""
+    assert BookingValidator.registry.names() == (
+        "connection_times",
+        "passenger_ages",
+        "baggage",
+        "pricing",
+    )
+    assert "validity_dates" in FareValidator.registry.names()
+    assert "validity_dates" not in FareValidator.registry.defaults()
+
+
+def test_only_selected_rules_run(invalid_xml):
+    """Test that unselected rules are not run at all."""
+    instrumentation = Instrumentation()
+    validator = BookingValidator(invalid_xml, instrumentation=instrumentation)
+
+    result = validator.validate(rules=["pricing"])
+
+    assert result["is_valid"]
+    assert "pricing" in validator.timings
+    assert "connection_times" not in validator.timings
+
+
+def test_repeated_runs_do_not_accumulate(invalid_xml, invalid_pricing_xml):
+    """Test that each validate() call reports only the findings of its own rules."""
+    validator = BookingValidator(invalid_xml, structured=True, max_errors=10)
+    everything = validator.validate()
+    pricing = validator.validate(rules=["pricing"])
+
+    assert not everything["is_valid"]
+    assert pricing["errors"] == []
+    assert list(validator.rule_findings) == ["pricing"]
+    assert validator.validate() == everything
+
+    validator = FareValidator(invalid_pricing_xml)
+    assert not validator.validate()["is_valid"]
+    assert validator.validate(rules=["currency"])["is_valid"]
+
+
+def test_rule_selection_at_construction(invalid_pricing_xml):
+    """Test that a rule selection can be configured on the validator."""
+    result = FareValidator(invalid_pricing_xml, rules=["currency"]).validate()
+    assert result["is_valid"]
+
+    result = FareValidator(invalid_pricing_xml, rules=["pricing_components"]).validate()
+    assert not result["is_valid"]
+
+
+def test_opt_in_rule_runs_when_selected(valid_fare_xml):
+    """Test that non-default rules only run when selected."""
+    xml = valid_fare_xml.replace(
+        "</FareInfo>", "<ValidFrom>2025-02-01</ValidFrom><ValidTo>2025-01-01</ValidTo></FareInfo>"
+    )
+
+    assert FareValidator(xml).validate()["is_valid"]
+
+    result = FareValidator(xml).validate(rules=["validity_dates"])
+    assert any("ValidTo date" in error for error in result["errors"])
+
+
+def test_unknown_rule_rejected(base_booking_xml):
+    """Test that selecting an unknown rule raises."""
+    with pytest.raises(ValueError, match="Unknown rule"):
+        BookingValidator(base_booking_xml).validate(rules=["seat_map"])
+
+
+def test_subclass_can_extend_registry(base_booking_xml):
+    """Test that subclasses add rules without touching the parent registry."""
+
+    class StrictBookingValidator(BookingValidator):
+        registry = BookingValidator.registry.copy()
+
+        @registry.register("agency")
+        def _validate_agency(self):
+            self.errors.append("Agency not allowed")
+
+    assert not StrictBookingValidator(base_booking_xml).validate()["is_valid"]
+    assert BookingValidator(base_booking_xml).validate()["is_valid"]
+    assert "agency" not in BookingValidator.registry.names()
+
+
+def test_registry_default_flag():
+    """Test that registry selection honours default flags."""
+    registry = RuleRegistry()
+    registry.register("a")(lambda v: None)
+    registry.register("b", default=False)(lambda v: None)
+
+    assert [name for name, _ in registry.select()] == ["a"]
+    assert [name for name, _ in registry.select(["b", "a"])] == ["a", "b"]
+
+
+def test_registry_sections_survive_copy():
+    """Test that declared rule sections are kept and copied."""
+    registry = RuleRegistry()
+    registry.register("a", sections=["Pricing"])(lambda v: None)
+    registry.register("b")(lambda v: None)
+
+    copied = registry.copy()
+    assert copied.sections("a") == {"Pricing"}
+    assert copied.sections("b") is None
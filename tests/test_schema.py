@@ -0,0 +1,137 @@
+import json
+import pickle
+
+import pytest
+
+from src.validators.booking_validator import DEFAULT_SCHEMA, BookingValidator
+from src.validators.cache import ResultCache
+from src.validators.fare_validator import FareValidator
+from src.validators.schema import RuleSchema
+
+
+@pytest.fixture
+def market_schema(tmp_path):
+    """Schema for a market with 23% tax and a 15kg baggage allowance."""
+    path = tmp_path / "market.json"
+    path.write_text(
+        json.dumps({"extends": "booking", "parameters": {"tax_rate": 0.23, "baggage_limit_kg": 15}})
+    )
+    return RuleSchema.load(path)
+
+
+def test_market_schema_overrides_thresholds(base_booking_xml, market_schema):
+    """Test that a schema loaded for a market changes the thresholds."""
+    result = BookingValidator(base_booking_xml, schema=market_schema).validate()
+
+    assert result["errors"] == [
+        "Baggage limit exceeded: Total weight 20.0kg (limit 15kg), Total checked bags: 1.0",
+        "Tax mismatch: expected 206.77 (23% of 899.00), but got 134.85",
+    ]
+    assert BookingValidator(base_booking_xml).validate()["is_valid"]
+
+
+def test_schema_adds_rule_with_its_own_message(base_booking_xml):
+    """Test that a schema can add a rule and its message without code changes."""
+    schema = DEFAULT_SCHEMA.extend(
+        {
+            "parameters": {"max_passengers": 0},
+            "fields": {"passenger_count": {"path": "passengers"}},
+            "rules": {
+                "party_size": {
+                    "checks": [
+                        {
+                            "code": "too_many_passengers",
+                            "fail": "len(passenger_count) > max_passengers",
+                            "values": {"count": "len(passenger_count)"},
+                        }
+                    ]
+                }
+            },
+            "messages": {
+                "too_many_passengers": ["BookingResponse/Passengers", "{count} passengers"]
+            },
+        }
+    )
+
+    validator = BookingValidator(base_booking_xml, schema=schema)
+    result = validator.validate()
+
+    assert validator.registry.names()[-1] == "party_size"
+    assert result["errors"] == ["1 passengers"]
+    assert "party_size" not in BookingValidator.registry.names()
+
+
+def test_fare_rule_thresholds_from_schema(valid_fare_xml, negative_seats_xml):
+    """Test the declared fare rules against the built-in and changed thresholds."""
+    schema = FareValidator.schema.extend({"parameters": {"max_days": 5}})
+
+    result = FareValidator(valid_fare_xml, schema=schema).validate()
+    assert any("(must be 0-5)" in error for error in result["errors"])
+    assert FareValidator(valid_fare_xml).validate()["is_valid"]
+
+    result = FareValidator(negative_seats_xml).validate()
+    assert result["errors"] == ["Seats available cannot be negative: -5"]
+
+
+def test_shared_fields_read_once_per_rule():
+    """Test that a field used by several checks is read once in the rule."""
+    source = DEFAULT_SCHEMA.checkers["pricing"].source
+
+    assert source.count("_model.pricing.subtotal") == 1
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "__import__('os')",
+        "self.__class__",
+        "[x for x in passengers]",
+        "open('f')",
+        "weight_total > 1",
+    ],
+)
+def test_unsafe_or_unknown_expressions_rejected(expression):
+    """Test that only the supported expression syntax and names compile."""
+    with pytest.raises(ValueError):
+        DEFAULT_SCHEMA.extend(
+            {"rules": {"baggage": {"checks": [{"code": "x", "fail": expression}]}}}
+        )
+
+
+@pytest.mark.parametrize("model", ["booking; print(1)", "booking.__class__", "_model", 1])
+def test_invalid_model_name_rejected(model):
+    """Test that the model name must be a plain identifier before it is compiled."""
+    with pytest.raises(ValueError, match="Invalid model name"):
+        RuleSchema({**DEFAULT_SCHEMA.table, "model": model})
+
+
+def test_fractional_tax_rate_in_message(base_booking_xml):
+    """Test that a tax mismatch message keeps the precision of the rate."""
+    schema = DEFAULT_SCHEMA.extend({"parameters": {"tax_rate": 0.075}})
+    result = BookingValidator(base_booking_xml, schema=schema).validate()
+
+    assert result["errors"] == ["Tax mismatch: expected 67.43 (7.5% of 899.00), but got 134.85"]
+
+
+def test_finding_codes_need_a_message(base_booking_xml):
+    """Test that a schema rule recording an unknown code is rejected on use."""
+    schema = DEFAULT_SCHEMA.extend(
+        {"rules": {"baggage": {"checks": [{"code": "missing", "fail": "True"}]}}}
+    )
+
+    with pytest.raises(ValueError, match="missing"):
+        BookingValidator(base_booking_xml, schema=schema)
+
+
+def test_schema_pickles_and_keys_cache(base_booking_xml, market_schema):
+    """Test that schemas reach worker processes and take part in cache keys."""
+    copy = pickle.loads(pickle.dumps(market_schema))
+    assert repr(copy) == repr(market_schema)
+    assert (
+        BookingValidator(base_booking_xml, schema=copy).validate()
+        == BookingValidator(base_booking_xml, schema=market_schema).validate()
+    )
+
+    cache = ResultCache()
+    assert cache.validate(base_booking_xml)["is_valid"]
+    assert not cache.validate(base_booking_xml, schema=market_schema)["is_valid"]
@@ -0,0 +1,139 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.service.sources import serve_tcp, tail_file
+from src.service.validation_service import ValidationService
+from src.validators.batch import validate_document
+
+
+def one_line(xml):
+    return " ".join(xml.split())
+
+
+async def iterate(documents, pulled=None):
+    for document in documents:
+        if pulled is not None:
+            pulled.append(document)
+        yield document
+
+
+async def collect(service, documents, pulled=None):
+    return [item async for item in service.process(iterate(documents, pulled))]
+
+
+@pytest.fixture
+def service():
+    service = ValidationService(workers=2, max_in_flight=2)
+    yield service
+    service.close()
+
+
+def test_process_streams_every_result(service, base_booking_xml, invalid_xml, valid_fare_xml):
+    """Test that every document comes back with its input position."""
+    documents = [base_booking_xml, invalid_xml, valid_fare_xml] * 3
+
+    results = asyncio.run(collect(service, documents))
+
+    assert sorted(index for index, _, _ in results) == list(range(9))
+    for index, result, latency in results:
+        assert result == validate_document(documents[index])
+        assert latency >= 0
+
+
+def test_process_applies_backpressure(base_booking_xml):
+    """Test that input is not read further ahead than the in-flight limit."""
+    service = ValidationService(max_in_flight=3, executor=ThreadPoolExecutor(2))
+    pulled = []
+    high_water = 0
+
+    async def run():
+        nonlocal high_water
+        completed = 0
+        async for _ in service.process(iterate([base_booking_xml] * 20, pulled)):
+            completed += 1
+            high_water = max(high_water, len(pulled) - completed)
+
+    asyncio.run(run())
+    service.close()
+
+    assert len(pulled) == 20
+    assert high_water <= 3
+
+
+def test_broken_document_does_not_stop_service(service, base_booking_xml):
+    """Test that unparseable input yields a failed result instead of raising."""
+    results = {
+        index: result
+        for index, result, _ in asyncio.run(collect(service, ["<Booking", base_booking_xml]))
+    }
+
+    assert not results[0]["is_valid"]
+    assert results[0]["errors"] == ["Document does not start with an XML element"]
+    assert results[1]["is_valid"]
+
+
+def test_tail_file_reads_appended_documents(tmp_path, base_booking_xml, valid_fare_xml):
+    """Test that the file source follows documents appended to the file."""
+    path = tmp_path / "feed.xml"
+    path.write_text(one_line(base_booking_xml) + "\n")
+
+    async def run():
+        documents = []
+        source = tail_file(path, poll_interval=0.01)
+        documents.append(await source.__anext__())
+        with open(path, "a") as f:
+            f.write(one_line(valid_fare_xml) + "\n")
+        documents.append(await asyncio.wait_for(source.__anext__(), timeout=5))
+        await source.aclose()
+        return documents
+
+    documents = asyncio.run(run())
+
+    assert documents == [one_line(base_booking_xml), one_line(valid_fare_xml)]
+
+
+def test_tcp_source_round_trip(service, invalid_child_xml, negative_seats_xml):
+    """Test that the local TCP source returns one JSON result per document."""
+
+    async def run():
+        server = await serve_tcp(service)
+        host, port = server.sockets[0].getsockname()[:2]
+        reader, writer = await asyncio.open_connection(host, port)
+        for xml in (invalid_child_xml, negative_seats_xml):
+            writer.write(one_line(xml).encode() + b"\n")
+        writer.write_eof()
+        lines = [json.loads(line) async for line in reader]
+        writer.close()
+        server.close()
+        await server.wait_closed()
+        return lines
+
+    results = sorted(asyncio.run(run()), key=lambda result: result["index"])
+
+    assert [result["index"] for result in results] == [0, 1]
+    assert not results[0]["is_valid"]
+    assert any("negative" in error.lower() for error in results[1]["errors"])
+
+
+def test_tcp_result_sent_while_connection_stays_open(service, base_booking_xml):
+    """Test that a result is sent back before the client sends more or closes."""
+
+    async def run():
+        server = await serve_tcp(service)
+        host, port = server.sockets[0].getsockname()[:2]
+        reader, writer = await asyncio.open_connection(host, port)
+        writer.write(one_line(base_booking_xml).encode() + b"\n")
+        await writer.drain()
+        line = await asyncio.wait_for(reader.readline(), timeout=10)
+        writer.close()
+        server.close()
+        await server.wait_closed()
+        return json.loads(line)
+
+    result = asyncio.run(run())
+
+    assert result["index"] == 0
+    assert result["is_valid"]
@@ -0,0 +1,61 @@
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from src.utils import xml_parser
+from src.utils.xml_parser import get_parser, resolve_backend
+from src.validators.booking_validator import BookingValidator
+from src.validators.fare_validator import FareValidator
+
+BOOKING_FIXTURES = ["base_booking_xml", "invalid_xml", "invalid_child_xml", "excessive_baggage_xml"]
+FARE_FIXTURES = [
+    "valid_fare_xml",
+    "invalid_fare_basis_xml",
+    "invalid_pricing_xml",
+    "invalid_currency_xml",
+    "negative_seats_xml",
+]
+
+
+def test_etree_backend_is_stdlib():
+    """Test that the etree backend uses the standard library parser."""
+    assert get_parser("etree") is ET.fromstring
+
+
+def test_auto_backend_falls_back_without_lxml(monkeypatch):
+    """Test that auto selection falls back to ElementTree when lxml is missing."""
+    monkeypatch.setattr(xml_parser, "lxml_etree", None)
+
+    assert resolve_backend("auto") == "etree"
+    with pytest.raises(ImportError):
+        resolve_backend("lxml")
+
+
+def test_unknown_backend_rejected():
+    """Test that unknown backend names are rejected."""
+    with pytest.raises(ValueError):
+        get_parser("expat")
+
+
+@pytest.mark.parametrize("fixture", BOOKING_FIXTURES)
+def test_booking_results_match_across_backends(request, fixture):
+    """Test that booking validation is identical on lxml and ElementTree."""
+    pytest.importorskip("lxml")
+    xml = request.getfixturevalue(fixture)
+
+    assert (
+        BookingValidator(xml, parser="lxml").validate()
+        == BookingValidator(xml, parser="etree").validate()
+    )
+
+
+@pytest.mark.parametrize("fixture", FARE_FIXTURES)
+def test_fare_results_match_across_backends(request, fixture):
+    """Test that fare validation is identical on lxml and ElementTree."""
+    pytest.importorskip("lxml")
+    xml = request.getfixturevalue(fixture)
+
+    assert (
+        FareValidator(xml, parser="lxml").validate()
+        == FareValidator(xml, parser="etree").validate()
+    )